@@ -1,10 +1,59 @@
 # api/cron.py
 from http.server import BaseHTTPRequestHandler
+import json
 import os
 import asyncio
-from src.pipeline import run_daily_pipeline
+from typing import Optional
+import httpx
+from src.run_status import RunTracker, new_run, new_run_id, is_active
+from src.storage import get_run_status, save_run_status, save_latest_run_id
+
+# The worker runs the pipeline in its own invocation and answers only when done;
+# waiting this long for its response is enough to know it was started
+WORKER_DISPATCH_TIMEOUT = float(os.getenv("CRON_WORKER_DISPATCH_TIMEOUT", "3"))
+
+# Worker URL (default: /api/cron_worker on the host this trigger was called on)
+CRON_WORKER_URL = os.getenv("CRON_WORKER_URL")
+
+
+def dispatch_worker(worker_url: str, run_id: str, secret: str) -> Optional[str]:
+    """
+    Start the worker invocation for a queued run without waiting for it.
+
+    Args:
+        worker_url: URL of api/cron_worker.py
+        run_id: Queued run id
+        secret: CRON_SECRET (the worker is protected like this trigger)
+
+    Returns:
+        None if the worker was started, otherwise an error message
+    """
+    timeout = httpx.Timeout(10.0, read=WORKER_DISPATCH_TIMEOUT)
+    try:
+        response = httpx.get(
+            worker_url,
+            params={"run_id": run_id},
+            headers={"Authorization": f"Bearer {secret}"},
+            timeout=timeout,
+        )
+    except httpx.ReadTimeout:
+        return None  # Request delivered, worker is running the pipeline
+    except httpx.HTTPError as e:
+        return f"worker not reachable: {type(e).__name__}: {e}"
+    if response.status_code >= 400:
+        return f"worker refused the run: HTTP {response.status_code} {response.text[:200]}"
+    return None  # Worker already finished (e.g. a very fast failing run)
+
 
 class handler(BaseHTTPRequestHandler):
+    def _send_json(self, status: int, data: dict):
+        body = json.dumps(data).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
     def do_GET(self):
         # Sicherheit: Vercel sendet automatisch Authorization: Bearer <CRON_SECRET>
         # (wenn CRON_SECRET als Env gesetzt ist)
@@ -14,6 +63,35 @@ class handler(BaseHTTPRequestHandler):
             self.send_response(401); self.end_headers()
             self.wfile.write(b"unauthorized"); return
 
-        result = asyncio.run(run_daily_pipeline())  # fetch -> process -> store
-        self.send_response(200); self.end_headers()
-        self.wfile.write(f"ok: {result}".encode("utf-8"))
\ No newline at end of file
+        # Retried trigger while a run is still active: report that run instead of starting another
+        latest = get_run_status()
+        if is_active(latest):
+            self._send_json(202, {
+                "run_id": latest["run_id"],
+                "status": latest["status"],
+                "status_url": f"/api/cron_status?run_id={latest['run_id']}",
+            })
+            return
+
+        # Record the run and hand it to the worker invocation (api/cron_worker.py), which
+        # runs the pipeline with its own time limit. Progress is persisted per stage
+        # (see /api/cron_status), so nothing depends on this request staying open.
+        run = new_run(new_run_id())
+        save_run_status(run)
+        save_latest_run_id(run["run_id"])
+
+        worker_url = CRON_WORKER_URL or (
+            f"{self.headers.get('X-Forwarded-Proto', 'https')}://{self.headers.get('Host')}/api/cron_worker"
+        )
+        error = dispatch_worker(worker_url, run["run_id"], secret)
+        if error:
+            print(f"[Run {run['run_id']}] {error}")
+            asyncio.run(RunTracker(run).fail(RuntimeError(error)))
+            self._send_json(502, {"run_id": run["run_id"], "status": run["status"], "error": error})
+            return
+
+        self._send_json(202, {
+            "run_id": run["run_id"],
+            "status": run["status"],
+            "status_url": f"/api/cron_status?run_id={run['run_id']}",
+        })
@@ -0,0 +1,37 @@
+# api/cron_status.py
+from http.server import BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+import json
+import os
+from src.run_status import RUN_ID_PATTERN, is_active
+from src.storage import get_run_status
+
+class handler(BaseHTTPRequestHandler):
+    def _send_json(self, status: int, data: dict):
+        body = json.dumps(data).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Cache-Control", "no-store")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        """Status of a pipeline run (?run_id=...; latest run if omitted) with per-stage progress."""
+        auth = self.headers.get("Authorization", "")
+        secret = os.environ.get("CRON_SECRET", "")
+        if not secret or auth != f"Bearer {secret}":
+            self.send_response(401); self.end_headers()
+            self.wfile.write(b"unauthorized"); return
+
+        run_id = parse_qs(urlparse(self.path).query).get("run_id", [None])[0]
+        if run_id is not None and not RUN_ID_PATTERN.match(run_id):
+            self._send_json(400, {"error": "invalid run_id"}); return
+
+        run = get_run_status(run_id)
+        if not run:
+            self._send_json(404, {"error": "run not found"}); return
+
+        # A queued/running run without checkpoints for too long was killed (e.g. function timeout)
+        run["stale"] = run["status"] in ("queued", "running") and not is_active(run)
+        self._send_json(200, run)
@@ -0,0 +1,49 @@
+# api/cron_worker.py
+from http.server import BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+import asyncio
+import json
+import os
+from src.pipeline import run_tracked_pipeline
+from src.run_status import RUN_ID_PATTERN
+from src.storage import get_run_status
+
+class handler(BaseHTTPRequestHandler):
+    def _send_json(self, status: int, data: dict):
+        body = json.dumps(data).encode("utf-8")
+        try:
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # The trigger stops waiting after a few seconds; the result is in the run status
+
+    def do_GET(self):
+        """Run the pipeline for a queued run (?run_id=..., dispatched by /api/cron)."""
+        auth = self.headers.get("Authorization", "")
+        secret = os.environ.get("CRON_SECRET", "")
+        if not secret or auth != f"Bearer {secret}":
+            self.send_response(401); self.end_headers()
+            self.wfile.write(b"unauthorized"); return
+
+        run_id = parse_qs(urlparse(self.path).query).get("run_id", [None])[0]
+        if run_id is None or not RUN_ID_PATTERN.match(run_id):
+            self._send_json(400, {"error": "invalid run_id"}); return
+
+        run = get_run_status(run_id)
+        if not run:
+            self._send_json(404, {"error": "run not found"}); return
+
+        # Each run is executed once
+        if run["status"] != "queued":
+            self._send_json(409, {"run_id": run_id, "status": run["status"], "error": "run is not queued"}); return
+
+        try:
+            asyncio.run(run_tracked_pipeline(run))  # fetch -> process -> store
+        except Exception as e:
+            print(f"[Run {run_id}] Pipeline failed: {e}")
+            self._send_json(500, {"run_id": run_id, "status": run["status"], "error": run.get("error")}); return
+
+        self._send_json(200, {"run_id": run_id, "status": run["status"], "result": run.get("result")})
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Migration script to convert the existing archive to gzip-compressed files.
+
+Converts reports (reports/YYYY-MM-DD.json) and feed markdown
+(feeds/YYYY-MM-DD.md) to their compressed variants (*.json.gz / *.md.gz)
+as written by src/storage.py. Reports are re-serialized as compact JSON.
+Originals are kept unless --delete-originals is given; readers use the
+compressed variant when both exist.
+
+Usage:
+    python scripts/compress_archive.py [--dry-run] [--verify] [--delete-originals] [--target local|blob]
+
+Examples:
+    # Dry-run against Vercel Blob Storage
+    python scripts/compress_archive.py --target blob --dry-run
+
+    # Compress all blobs, verify and delete the uncompressed originals
+    python scripts/compress_archive.py --target blob --verify --delete-originals
+
+    # Compress local files in src/reports/ and src/feeds-markdown/
+    python scripts/compress_archive.py --target local
+"""
+
+import argparse
+import asyncio
+import gzip
+import json
+import re
+import sys
+from pathlib import Path
+import httpx
+from dotenv import load_dotenv
+
+# Load environment variables from .env.local (Vercel standard) or .env
+load_dotenv('.env.local')  # Try Vercel's .env.local first
+load_dotenv()              # Fallback to .env if it exists
+
+# Add parent directory to path to import from src
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src import storage
+from src.storage import BLOB_API_BASE, BLOB_TOKEN, BLOB_TIMEOUT, GZIP_SUFFIX, REPORTS_DIR, FEEDS_MARKDOWN_DIR
+
+# Archive files with the standard naming scheme (suffixed files like -good.json are skipped)
+ARCHIVE_PATTERN = re.compile(r"^(reports/\d{4}-\d{2}-\d{2}\.json|feeds/\d{4}-\d{2}-\d{2}\.md)$")
+
+
+def compress_content(pathname: str, raw: bytes) -> bytes:
+    """Compress one archive file the same way storage.py writes new files."""
+    text = raw.decode('utf-8')
+    if pathname.endswith('.json'):
+        text = json.dumps(json.loads(text), ensure_ascii=False, separators=(",", ":"))
+    return gzip.compress(text.encode('utf-8'), compresslevel=9, mtime=0)
+
+
+def migrate_blobs(dry_run: bool, verify: bool, delete_originals: bool) -> bool:
+    """
+    Compress all uncompressed archive blobs.
+
+    Returns:
+        bool: True if all conversions succeeded
+    """
+    ok = True
+    with httpx.Client() as client:
+        blobs = storage._list_blobs(client, "reports/") + storage._list_blobs(client, "feeds/")
+        existing = {blob['pathname'] for blob in blobs}
+        candidates = [blob for blob in blobs if ARCHIVE_PATTERN.match(blob['pathname'])]
+        print(f"Found {len(candidates)} uncompressed archive blob(s)\n")
+
+        converted_urls = []
+        for blob in candidates:
+            pathname = blob['pathname']
+            target = pathname + GZIP_SUFFIX
+
+            if target in existing and not delete_originals:
+                print(f"  - {pathname}: {target} already exists, skipping")
+                continue
+
+            try:
+                if target not in existing:
+                    response = client.get(blob['url'], timeout=BLOB_TIMEOUT)
+                    response.raise_for_status()
+                    raw = response.content
+                    compressed = compress_content(pathname, raw)
+                    if dry_run:
+                        print(f"  [DRY-RUN] Would write blob://{target} ({len(raw)} → {len(compressed)} bytes)")
+                        continue
+
+                    asyncio.run(_upload(target, compressed))
+                    print(f"  ✓ {pathname} → {target} ({len(raw)} → {len(compressed)} bytes)")
+
+                    if verify:
+                        # Upload response URL is in the storage manifest
+                        response = client.get(storage._blob_url(target), timeout=BLOB_TIMEOUT)
+                        response.raise_for_status()
+                        if storage._read_archive([response.content]) != storage._read_archive([compressed]):
+                            print(f"    ✗ Verification failed: Data mismatch")
+                            ok = False
+                            continue
+                        print(f"    ✓ Verification successful")
+                elif dry_run:
+                    print(f"  [DRY-RUN] Would delete blob://{pathname} ({target} exists)")
+                    continue
+
+                converted_urls.append(blob['url'])
+
+            except Exception as e:
+                print(f"  ✗ Failed to convert {pathname}: {e}")
+                ok = False
+
+        if delete_originals and converted_urls and not dry_run:
+            response = client.post(
+                f"{BLOB_API_BASE}/delete",
+                json={"urls": converted_urls},
+                headers={"Authorization": f"Bearer {BLOB_TOKEN}"},
+                timeout=BLOB_TIMEOUT,
+            )
+            response.raise_for_status()
+            print(f"\n✓ Deleted {len(converted_urls)} uncompressed original(s)")
+
+    return ok
+
+
+async def _upload(pathname: str, content: bytes) -> None:
+    async with httpx.AsyncClient(timeout=BLOB_TIMEOUT) as client:
+        await storage._put_blob(pathname, content, "application/gzip", client)
+
+
+def migrate_local(dry_run: bool, delete_originals: bool) -> bool:
+    """
+    Compress all uncompressed local archive files.
+
+    Returns:
+        bool: True if all conversions succeeded
+    """
+    ok = True
+    files = sorted(REPORTS_DIR.glob("*.json")) + sorted(FEEDS_MARKDOWN_DIR.glob("*.md"))
+    for file_path in files:
+        prefix = "reports" if file_path.suffix == ".json" else "feeds"
+        pathname = f"{prefix}/{file_path.name}"
+        if not ARCHIVE_PATTERN.match(pathname):
+            print(f"  - Skipping non-standard filename: {file_path.name}")
+            continue
+
+        target = file_path.with_name(file_path.name + GZIP_SUFFIX)
+        try:
+            raw = file_path.read_bytes()
+            compressed = compress_content(pathname, raw)
+            if dry_run:
+                print(f"  [DRY-RUN] Would write {target.name} ({len(raw)} → {len(compressed)} bytes)")
+                continue
+
+            target.write_bytes(compressed)
+            if delete_originals:
+                file_path.unlink()
+            print(f"  ✓ {file_path.name} → {target.name} ({len(raw)} → {len(compressed)} bytes)")
+
+        except Exception as e:
+            print(f"  ✗ Failed to convert {file_path.name}: {e}")
+            ok = False
+
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Convert the report/feed archive to gzip-compressed files",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__
+    )
+    parser.add_argument(
+        '--dry-run',
+        action='store_true',
+        help='Show what would be converted without writing anything'
+    )
+    parser.add_argument(
+        '--verify',
+        action='store_true',
+        help='Verify each compressed blob by reading it back (blob target only)'
+    )
+    parser.add_argument(
+        '--delete-originals',
+        action='store_true',
+        help='Delete the uncompressed originals after successful conversion'
+    )
+    parser.add_argument(
+        '--target',
+        type=str,
+        choices=['local', 'blob'],
+        default='blob',
+        help='Archive to convert (default: blob)'
+    )
+
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("Archive Compression Script")
+    print("=" * 60)
+    print(f"\nTarget: {args.target}")
+    print(f"Dry-run mode: {args.dry_run}")
+    print(f"Delete originals: {args.delete_originals}")
+    print()
+
+    if args.target == 'blob':
+        if not BLOB_TOKEN:
+            print("\nError: BLOB_READ_WRITE_TOKEN not found in environment")
+            print("Please set up your environment variables:")
+            print("  1. Run: vercel env pull")
+            print("  2. Or set manually: export BLOB_READ_WRITE_TOKEN=your_token")
+            sys.exit(1)
+        ok = migrate_blobs(args.dry_run, args.verify, args.delete_originals)
+    else:
+        ok = migrate_local(args.dry_run, args.delete_originals)
+
+    print("\n" + ("✓ Done" if ok else "✗ Finished with errors"))
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Load test for the FastAPI app with local Stytch and storage stand-ins.
+
+Runs the app in-process (httpx ASGI transport) and replaces the Stytch client
+and the report/history storage functions with stand-ins that block for a fixed
+latency, like the real sync SDK and blob I/O. Each scenario sends --users
+concurrent requests; "concurrency" is the summed request latency divided by
+the wall time. A value close to 1 means requests were served one at a time
+(a blocking call on the event loop); close to --users means they overlapped.
+
+Usage:
+    python scripts/load_test_app.py [--users N] [--latency SECONDS]
+
+Examples:
+    # 50 concurrent users, 200 ms per Stytch/storage call
+    python scripts/load_test_app.py --users 50 --latency 0.2
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Dict, List
+import httpx
+
+# Dummy credentials so the app enables authentication (the client is replaced below)
+os.environ.setdefault("STYTCH_PROJECT_ID", "project-test-00000000-0000-0000-0000-000000000000")
+os.environ.setdefault("STYTCH_SECRET", "secret-test-load-test")
+os.environ["ENVIRONMENT"] = "local"
+
+# Add parent directory to path to import from src (templates are resolved relative to it)
+REPO_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+os.chdir(REPO_ROOT)
+
+from src import app as app_module
+
+
+def make_jwt(user: int) -> str:
+    """Unsigned JWT-shaped token (unique per user, so the session cache misses)."""
+    def encode(data: Dict[str, Any]) -> str:
+        return base64.urlsafe_b64encode(json.dumps(data).encode()).decode().rstrip("=")
+    return f"{encode({'alg': 'none'})}.{encode({'sub': f'user-{user}', 'exp': time.time() + 300})}.sig"
+
+
+class StytchStandIn:
+    """Blocking stand-in for the parts of stytch.Client used by the app."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.sessions = SimpleNamespace(
+            authenticate_jwt_local=self._authenticate_jwt_local,
+            authenticate=self._authenticate,
+        )
+        self.magic_links = SimpleNamespace(
+            email=SimpleNamespace(send=self._send),
+            authenticate=self._magic_link_authenticate,
+        )
+
+    def _session(self, session_jwt: str):
+        email_factor = SimpleNamespace(email_address="load-test@example.com")
+        return SimpleNamespace(
+            user_id=session_jwt[-12:],
+            authentication_factors=[SimpleNamespace(email_factor=email_factor)],
+        )
+
+    def _authenticate_jwt_local(self, session_jwt: str):
+        time.sleep(self.latency)  # First use fetches the JWKS
+        return self._session(session_jwt)
+
+    def _authenticate(self, session_jwt: str):
+        time.sleep(self.latency)
+        return SimpleNamespace(status_code=200, session=self._session(session_jwt))
+
+    def _send(self, email: str):
+        time.sleep(self.latency)
+        return SimpleNamespace(status_code=200)
+
+    def _magic_link_authenticate(self, token: str, session_duration_minutes: int):
+        time.sleep(self.latency)
+        return SimpleNamespace(status_code=200, session_jwt=make_jwt(0))
+
+
+def install_stand_ins(latency: float) -> None:
+    """Replace Stytch and storage in the app module with blocking stand-ins."""
+    app_module.stytch_client = StytchStandIn(latency)
+
+    def get_today_report():
+        time.sleep(latency)
+        return None
+
+    def get_score_history(start=None, end=None):
+        time.sleep(latency)
+        return {"date": [], "score": []}
+
+    app_module.get_today_report = get_today_report
+    app_module.get_score_history = get_score_history
+    app_module.get_score_history_manifest = lambda: None
+
+
+async def run_scenario(client: httpx.AsyncClient, name: str, users: int, request) -> Dict[str, Any]:
+    """Send one request per user concurrently and measure latencies."""
+    latencies: List[float] = []
+    statuses: Dict[int, int] = {}
+
+    async def one(user: int) -> None:
+        start = time.perf_counter()
+        response = await request(client, user)
+        latencies.append(time.perf_counter() - start)
+        statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+
+    wall_start = time.perf_counter()
+    await asyncio.gather(*(one(user) for user in range(users)))
+    wall = time.perf_counter() - wall_start
+
+    latencies.sort()
+    return {
+        "scenario": name,
+        "requests": users,
+        "wall_seconds": round(wall, 3),
+        "requests_per_second": round(users / wall, 1),
+        "p50_ms": round(latencies[len(latencies) // 2] * 1000),
+        "p99_ms": round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000),
+        "concurrency": round(sum(latencies) / wall, 1),
+        "statuses": statuses,
+    }
+
+
+SCENARIOS = {
+    "send-magic-link": lambda client, user: client.post(
+        "/auth/send-magic-link", json={"email": f"user-{user}@example.com"}
+    ),
+    "authenticate": lambda client, user: client.get("/authenticate", params={"token": f"token-{user}"}),
+    "dashboard": lambda client, user: client.get("/", headers={"Cookie": f"stytch_session_jwt={make_jwt(user)}"}),
+    "history": lambda client, user: client.get(
+        "/api/history", headers={"Cookie": f"stytch_session_jwt={make_jwt(user)}"}
+    ),
+}
+
+
+async def main_async(users: int, latency: float) -> bool:
+    install_stand_ins(latency)
+    transport = httpx.ASGITransport(app=app_module.app)
+
+    ok = True
+    async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+        for name, request in SCENARIOS.items():
+            result = await run_scenario(client, name, users, request)
+            collapsed = users > 1 and result["concurrency"] < 2
+            ok = ok and not collapsed
+            print(f"  {'✗' if collapsed else '✓'} {json.dumps(result)}")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Load test the app with blocking Stytch/storage stand-ins",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__
+    )
+    parser.add_argument(
+        '--users',
+        type=int,
+        default=20,
+        help='Concurrent requests per scenario (default: 20)'
+    )
+    parser.add_argument(
+        '--latency',
+        type=float,
+        default=0.2,
+        help='Latency of each stand-in call in seconds (default: 0.2)'
+    )
+
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("App Load Test")
+    print("=" * 60)
+    print(f"\nUsers: {args.users}")
+    print(f"Stand-in latency: {args.latency}s")
+    print()
+
+    ok = asyncio.run(main_async(args.users, args.latency))
+    print("\n" + ("✓ Requests overlap under load" if ok else "✗ Requests were serialized"))
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
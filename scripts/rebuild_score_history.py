@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Rebuild the score history table from the report archive.
+
+New reports update the history when they are saved (src/storage.py). This
+script backfills it from all existing daily reports (reports/YYYY-MM-DD.json
+and .json.gz), e.g. after the first deployment or to repair the table.
+
+Usage:
+    python scripts/rebuild_score_history.py [--dry-run] [--target local|blob]
+
+Examples:
+    # Show the rows that would be written from Vercel Blob Storage
+    python scripts/rebuild_score_history.py --target blob --dry-run
+
+    # Rebuild from local reports in src/reports/
+    python scripts/rebuild_score_history.py --target local
+"""
+
+import argparse
+import asyncio
+import re
+import sys
+from pathlib import Path
+from typing import List
+import httpx
+from dotenv import load_dotenv
+
+# Load environment variables from .env.local (Vercel standard) or .env
+load_dotenv('.env.local')  # Try Vercel's .env.local first
+load_dotenv()              # Fallback to .env if it exists
+
+# Add parent directory to path to import from src
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src import storage
+from src.score_history import empty_table, report_to_row, upsert_row
+from src.storage import BLOB_TOKEN, REPORTS_DIR
+
+# Daily reports with the standard naming scheme (compressed or plain)
+REPORT_PATTERN = re.compile(r"(\d{4}-\d{2}-\d{2})\.json(\.gz)?$")
+
+
+def list_report_dates(target: str) -> List[str]:
+    """List the dates of all archived reports, sorted ascending."""
+    if target == 'blob':
+        with httpx.Client() as client:
+            names = [blob['pathname'].split('/')[-1] for blob in storage._list_blobs(client, "reports/")]
+    else:
+        names = [path.name for path in REPORTS_DIR.glob("*.json*")]
+
+    return sorted({match.group(1) for match in map(REPORT_PATTERN.fullmatch, names) if match})
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Rebuild the score history table from the report archive",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__
+    )
+    parser.add_argument(
+        '--dry-run',
+        action='store_true',
+        help='Show the rows without writing the history'
+    )
+    parser.add_argument(
+        '--target',
+        type=str,
+        choices=['local', 'blob'],
+        default='blob',
+        help='Archive to read and history to write (default: blob)'
+    )
+
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("Score History Rebuild Script")
+    print("=" * 60)
+    print(f"\nTarget: {args.target}")
+    print(f"Dry-run mode: {args.dry_run}")
+    print()
+
+    if args.target == 'blob':
+        if not BLOB_TOKEN:
+            print("\nError: BLOB_READ_WRITE_TOKEN not found in environment")
+            print("Please set up your environment variables:")
+            print("  1. Run: vercel env pull")
+            print("  2. Or set manually: export BLOB_READ_WRITE_TOKEN=your_token")
+            sys.exit(1)
+        # Route reads and writes through the blob backend
+        storage.ENVIRONMENT = "prod"
+    else:
+        storage.ENVIRONMENT = "local"
+
+    dates = list_report_dates(args.target)
+    print(f"Found {len(dates)} report(s)\n")
+
+    table = empty_table()
+    for date in dates:
+        report = storage.get_report_by_date(date)
+        row = report_to_row(report) if report else None
+        if row is None:
+            print(f"  - {date}: no scores (missing or failed run), skipping")
+            continue
+        upsert_row(table, row)
+        print(f"  ✓ {date}: score {row['score']} ({row['level']})")
+
+    print(f"\n{len(table['date'])} row(s)")
+    if args.dry_run:
+        print("[DRY-RUN] History not written")
+        sys.exit(0)
+
+    ok = asyncio.run(storage.save_score_history_async(table))
+    print("\n" + ("✓ Done" if ok else "✗ Finished with errors"))
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
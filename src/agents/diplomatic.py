@@ -1,5 +1,7 @@
 # src/agents/diplomatic.py
+from typing import Optional
 from agno.agent import Agent
+from agno.models.base import Model
 
 try:
     from ..schemas import DimensionScore
@@ -85,26 +87,22 @@ Für jeden Punkt: Quelle + Datum oder "Keine aktuellen Daten".
 """
 ]
 
-def build_prompt(date: str, rss_data: str) -> str:
-    return f"""
-DIPLOMATISCHE LAGEBEURTEILUNG - {date}
-
-RSS-FEED-KONTEXT:
-{rss_data}
+TASK = """
+DIPLOMATISCHE LAGEBEURTEILUNG
 
 AUFTRAG:
 Bewerte die diplomatische Eskalationslage (1-10).
 
 DATENQUELLEN (in dieser Reihenfolge):
-1. RSS-Feed-Kontext oben als Ausgangspunkt
+1. RSS-Feed-Kontext unten als Ausgangspunkt
 2. AKTIVE SUCHE in deinen verfügbaren Quellen (X/Twitter, Web), um Lücken zu füllen
-3. Fokus auf aktuelle Informationen (<30 Tage vom {date})
+3. Fokus auf aktuelle Informationen (<30 Tage vor dem STICHTAG)
 4. Historischer Kontext: Ältere Informationen zur Einordnung von Trends (Verschlechterung/Verbesserung)
 
 PFLICHT:
 - Jede Aussage mit Quelle + Datum belegen
 - Wenn RSS-Daten unzureichend: AKTIV nach aktuellen Informationen suchen
-- Fehlende Daten explizit kennzeichnen: "Keine aktuellen Daten zu [X] gefunden (geprüft am {date})"
+- Fehlende Daten explizit kennzeichnen: "Keine aktuellen Daten zu [X] gefunden (geprüft am [STICHTAG])"
 - Historischer Kontext: Falls vorhanden, ältere Entwicklungen erwähnen (z.B. "Seit 2022...", "Trend seit...")
 - Widersprüche zwischen Quellen dokumentieren
 - Attributive Sprache verwenden: "Laut [Quelle, Datum]..."
@@ -114,8 +112,21 @@ AUSGABE:
 - rationale: Begründung mit Quellen + Datum, historischer Kontext falls relevant, Widersprüche, fehlende Daten
 """
 
-def create_agent() -> Agent:
-    model = create_research_model()
+def build_prompt(date: str, rss_data: str) -> str:
+    return f"""{TASK}
+STICHTAG: {date}
+
+RSS-FEED-KONTEXT:
+{rss_data}
+"""
+
+def create_model(search_results: int = 15) -> Model:
+    """Create the default model: research model with live search."""
+    return create_research_model(search_results=search_results)
+
+def create_agent(model: Optional[Model] = None) -> Agent:
+    """Create the agent (default model: see create_model())."""
+    model = model or create_model()
 
     return Agent(
         model=model,
@@ -0,0 +1,94 @@
+# src/agents/metrics.py
+"""
+Per-call LLM metrics (tokens, provider-side prompt cache hits, duration).
+
+Prompt convention for cache hits: every prompt builder in this package starts
+with the module's static TASK text (identical on every call, so providers can
+cache it as a prompt prefix) and appends the volatile parts (date, RSS data,
+results) after it. Additions such as evidence or incremental context go at the
+end as well.
+"""
+
+import threading
+from typing import Any, Dict, List
+
+_lock = threading.Lock()
+_call_log: List[Dict[str, Any]] = []
+
+
+def _metric(metrics: Any, name: str) -> float:
+    """Read a metric from agno RunOutput.metrics (object or dict of per-message lists)."""
+    if metrics is None:
+        return 0
+    if isinstance(metrics, dict):
+        value = metrics.get(name, 0)
+        if isinstance(value, list):
+            return sum(v for v in value if v)
+        return value or 0
+    return getattr(metrics, name, 0) or 0
+
+
+def call_metrics(response: Any) -> Dict[str, Any]:
+    """
+    Extract token and cache metrics from an agent run response.
+
+    Args:
+        response: agno RunOutput
+
+    Returns:
+        Dict with input/cached/output tokens, cache_hit, cache_ratio and duration
+    """
+    metrics = getattr(response, "metrics", None)
+    input_tokens = int(_metric(metrics, "input_tokens"))
+    cached_tokens = int(_metric(metrics, "cache_read_tokens"))
+
+    return {
+        "input_tokens": input_tokens,
+        "cached_tokens": cached_tokens,
+        "cache_hit": cached_tokens > 0,
+        "cache_ratio": round(cached_tokens / input_tokens, 3) if input_tokens else 0.0,
+        "output_tokens": int(_metric(metrics, "output_tokens")),
+        "duration": round(float(_metric(metrics, "duration")), 3),
+    }
+
+
+def record_call(label: str, response: Any, queue_seconds: float = 0.0) -> Dict[str, Any]:
+    """
+    Record metrics of one LLM call in the process-level call log.
+
+    Args:
+        label: Call label (e.g. "military", "filter:NATO:1/2")
+        response: agno RunOutput
+        queue_seconds: Time the call waited in the rate limiter (see scheduler.py)
+
+    Returns:
+        The recorded metrics
+    """
+    entry = {"label": label, **call_metrics(response), "queue_seconds": round(queue_seconds, 3)}
+    with _lock:
+        _call_log.append(entry)
+    print(f"[LLM Metrics] {label}: {entry['input_tokens']} input tokens, "
+          f"{entry['cached_tokens']} cached ({entry['cache_ratio']*100:.0f}%), {entry['duration']:.1f}s"
+          + (f", queued {queue_seconds:.1f}s" if queue_seconds >= 0.1 else ""))
+    return entry
+
+
+def drain_call_log() -> Dict[str, Any]:
+    """
+    Return all recorded calls with totals and clear the log.
+
+    Returns:
+        Dict with calls, total input tokens, total cached tokens, cache hit count
+        and total queue time
+    """
+    with _lock:
+        calls = list(_call_log)
+        _call_log.clear()
+
+    return {
+        "calls": calls,
+        "input_tokens": sum(c["input_tokens"] for c in calls),
+        "cached_tokens": sum(c["cached_tokens"] for c in calls),
+        "cache_hits": sum(1 for c in calls if c["cache_hit"]),
+        "queue_seconds": round(sum(c["queue_seconds"] for c in calls), 3),
+    }
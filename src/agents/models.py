@@ -5,6 +5,11 @@ import os
 from agno.models.xai import xAI
 from agno.models.anthropic import Claude
 
+try:
+    from .pool import get_http_client
+except ImportError:
+    from pool import get_http_client
+
 
 def create_research_model(
     search_results: int = 15,
@@ -48,6 +53,27 @@ def create_research_model(
             "return_citations": False,
             "sources": sources
         },
+        http_client=get_http_client("xai"),
+    )
+
+
+def create_analysis_model() -> xAI:
+    """
+    Create the research model without live search (dimension agents working
+    from the shared evidence pack, see research.py).
+
+    Returns:
+        Configured xAI model
+    """
+    model_id = os.getenv("RESEARCH_MODEL_ID", "grok-4-fast-reasoning-latest")
+
+    return xAI(
+        id=model_id,
+        temperature=0,
+        search_parameters={
+            "mode": "off"
+        },
+        http_client=get_http_client("xai"),
     )
 
 
@@ -66,4 +92,22 @@ def create_review_model() -> xAI:
         search_parameters={
             "mode": "off"
         },
+        http_client=get_http_client("xai"),
+    )
+
+
+def create_fallback_model() -> Claude:
+    """
+    Create the secondary model for hedged dimension requests (no live search).
+
+    Returns:
+        Configured fallback model
+    """
+    model_id = os.getenv("FALLBACK_MODEL_ID", "claude-sonnet-4-5")
+
+    return Claude(
+        id=model_id,
+        temperature=0,
+        max_tokens=8000,
+        http_client=get_http_client("anthropic"),
     )
@@ -0,0 +1,199 @@
+# src/agents/pool.py
+"""
+Process-level pool of LLM HTTP clients and agents with per-provider stats.
+
+The sync clients (feed filtering) stay warm for the lifetime of the process.
+Async clients and the agents using them are bound to one event loop, and each
+pipeline run is its own asyncio.run(): they are reused within a run only and
+closed with aclose_async_clients() at its end.
+"""
+
+import asyncio
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
+import httpx
+from agno.agent import Agent
+
+# Shared connection settings for all LLM providers (long timeout for reasoning/search calls)
+HTTP_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=10, keepalive_expiry=300.0)
+HTTP_TIMEOUT = httpx.Timeout(600.0, connect=10.0)
+
+_lock = threading.Lock()
+_sync_clients: Dict[str, httpx.Client] = {}
+# Async clients and agents are keyed by (name, event loop): their connections are loop-bound
+_async_clients: Dict[Tuple[str, Optional[asyncio.AbstractEventLoop]], httpx.AsyncClient] = {}
+_agents: Dict[Tuple[str, Optional[asyncio.AbstractEventLoop]], Agent] = {}
+_stats: Dict[str, Dict[str, int]] = {}
+
+
+def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def _is_stopped(loop: Optional[asyncio.AbstractEventLoop]) -> bool:
+    return loop is not None and (loop.is_closed() or not loop.is_running())
+
+
+def _prune_stopped_loops() -> None:
+    """
+    Drop clients and agents of stopped event loops (call with _lock held).
+
+    Only a safety net for loops that ended without aclose_async_clients():
+    their clients can't be closed anymore and are left to garbage collection.
+    """
+    for key in [key for key in _agents if _is_stopped(key[1])]:
+        del _agents[key]
+    for key in [key for key in _async_clients if _is_stopped(key[1])]:
+        del _async_clients[key]
+
+
+def _count(provider: str, key: str, amount: int = 1) -> None:
+    with _lock:
+        provider_stats = _stats.setdefault(provider, {
+            "clients_created": 0,
+            "requests": 0,
+            "errors": 0,
+            "connections_opened": 0,
+            "agents_created": 0,
+            "agents_reused": 0,
+        })
+        provider_stats[key] += amount
+
+
+def _make_hooks(provider: str, asynchronous: bool) -> Dict[str, list]:
+    """Event hooks counting requests, errors and new TCP connections per provider."""
+
+    def trace(event_name: str, info: Dict[str, Any]) -> None:
+        if event_name == "connection.connect_tcp.complete":
+            _count(provider, "connections_opened")
+
+    def on_request(request: httpx.Request) -> None:
+        request.extensions["trace"] = trace
+        _count(provider, "requests")
+
+    def on_response(response: httpx.Response) -> None:
+        if response.status_code >= 400:
+            _count(provider, "errors")
+
+    if asynchronous:
+        # httpcore requires an async trace callback for async clients
+        async def trace_async(event_name: str, info: Dict[str, Any]) -> None:
+            trace(event_name, info)
+
+        async def on_request_async(request: httpx.Request) -> None:
+            request.extensions["trace"] = trace_async
+            _count(provider, "requests")
+
+        async def on_response_async(response: httpx.Response) -> None:
+            on_response(response)
+
+        return {"request": [on_request_async], "response": [on_response_async]}
+
+    return {"request": [on_request], "response": [on_response]}
+
+
+def get_http_client(provider: str, asynchronous: bool = True) -> httpx.Client | httpx.AsyncClient:
+    """
+    Return the shared HTTP client for an LLM provider.
+
+    Async clients are bound to the event loop they are used in, so each loop
+    (e.g. each asyncio.run()) gets its own; close them with
+    aclose_async_clients() before the loop ends.
+
+    Args:
+        provider: Provider name (e.g. "xai", "anthropic")
+        asynchronous: Return an httpx.AsyncClient (for Agent.arun) instead of httpx.Client
+
+    Returns:
+        Pooled httpx client with keep-alive connections
+    """
+    with _lock:
+        if not asynchronous:
+            client = _sync_clients.get(provider)
+            if client is None or client.is_closed:
+                client = httpx.Client(limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT,
+                                      event_hooks=_make_hooks(provider, asynchronous=False))
+                _sync_clients[provider] = client
+                created = True
+            else:
+                created = False
+        else:
+            loop = _running_loop()
+            _prune_stopped_loops()
+            # A client created outside of a loop is adopted by the first loop using it
+            client = _async_clients.get((provider, loop))
+            if client is None and loop is not None:
+                client = _async_clients.pop((provider, None), None)
+            if client is None or client.is_closed:
+                client = httpx.AsyncClient(limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT,
+                                           event_hooks=_make_hooks(provider, asynchronous=True))
+                created = True
+            else:
+                created = False
+            _async_clients[(provider, loop)] = client
+
+    if created:
+        _count(provider, "clients_created")
+    return client
+
+
+def get_agent(key: str, factory: Callable[[], Agent], provider: str = "xai") -> Agent:
+    """
+    Return a pooled agent, creating it with factory on first use.
+
+    Agents are cached per event loop (their models hold loop-bound async
+    clients), so concurrent loops don't evict each other's agents; agents of
+    stopped loops are dropped.
+
+    Args:
+        key: Pool key (e.g. "military", "review")
+        factory: Function creating the agent
+        provider: Provider name for stats
+
+    Returns:
+        Agent instance
+    """
+    loop = _running_loop()
+    with _lock:
+        _prune_stopped_loops()
+        agent = _agents.get((key, loop))
+
+    if agent is not None:
+        _count(provider, "agents_reused")
+        return agent
+
+    agent = factory()
+    with _lock:
+        _agents[(key, loop)] = agent
+    _count(provider, "agents_created")
+    return agent
+
+
+async def aclose_async_clients() -> int:
+    """
+    Close the async clients of the running event loop and drop its agents.
+
+    Call at the end of a run (before asyncio.run() returns), so keep-alive
+    connections are closed on their own loop instead of leaking.
+
+    Returns:
+        Number of clients closed
+    """
+    loop = _running_loop()
+    with _lock:
+        for key in [key for key in _agents if key[1] is loop]:
+            del _agents[key]
+        clients = [_async_clients.pop(key) for key in [key for key in _async_clients if key[1] is loop]]
+
+    for client in clients:
+        await client.aclose()
+    return len(clients)
+
+
+def get_pool_stats() -> Dict[str, Dict[str, int]]:
+    """Return a snapshot of per-provider connection and agent stats."""
+    with _lock:
+        return {provider: dict(provider_stats) for provider, provider_stats in _stats.items()}
@@ -0,0 +1,166 @@
+# src/agents/research.py
+"""Shared research pass: one live search for all dimension agents, handed over as an evidence pack."""
+import os
+import re
+from typing import Dict, List, Optional
+from agno.agent import Agent
+from agno.models.base import Model
+
+try:
+    from ..schemas import Evidence, EvidencePack
+    from .models import create_research_model
+except ImportError:
+    from schemas import Evidence, EvidencePack
+    from models import create_research_model
+
+# Search results of the shared pass (replaces 15-20 results per dimension agent)
+RESEARCH_SEARCH_RESULTS = int(os.getenv("RESEARCH_SEARCH_RESULTS", "25"))
+
+DIMENSIONS = ["military", "diplomatic", "economic", "societal", "russians"]
+
+DESCRIPTION = """
+Du bist Rechercheur für die NATO-Russland-Lagebeurteilung.
+
+KERNPRINZIP - ZERO TRUST:
+Du vertraust keiner Quelle automatisch. Jede Information – auch von offiziellen
+Stellen – ist eine Behauptung, kein gesicherter Fakt. Du bewertest nicht, du
+sammelst attribuierte Aussagen für fünf Analysten (Militär, Diplomatie,
+Wirtschaft, Gesellschaft, Russen in DE).
+
+AUFGABE:
+Ergänze die RSS-Feeds durch EINE gemeinsame Suche, damit die Analysten nicht
+selbst suchen müssen. Jede Angabe muss Quelle + Datum haben.
+"""
+
+INSTRUCTIONS = [
+    """
+SUCHSTRATEGIE:
+
+1. Ausgangspunkt: RSS-Feed-Kontext (bereits bekannt, NICHT erneut belegen)
+2. Lücken füllen je Dimension:
+   - military: Truppenbewegungen, Übungen, Luftraum-/See-Vorfälle, Stationierungen
+   - diplomatic: Ausweisungen, Gipfel, Verhandlungen, Sanktionsbeschlüsse, Rhetorik
+   - economic: Sanktionen, Energie, Handel, Exportkontrollen, Kriegswirtschaft
+   - societal: Zivilschutz, Wehrpflicht-Debatte, Sabotage, Desinformation, Stimmung
+   - russians: Visa, Aufenthaltsrecht, Konsulate, Kontensperrungen für Russen in DE
+3. Beide Perspektiven: westliche UND russische Quellen (z.B. tagesschau.de, nato.int,
+   bmvg.de, reuters.com UND mid.ru, mil.ru, tass.ru, kremlin.ru)
+4. Fokus auf aktuelle Informationen (<30 Tage vor dem STICHTAG)
+""",
+    """
+EVIDENZ-REGELN:
+
+- Eine Evidenz = eine attribuierte Aussage: "Laut [Quelle, Datum] ..."
+- Keine Duplikate: dieselbe Meldung aus mehreren Quellen nur einmal (wichtigste Quelle)
+- dimensions: alle Dimensionen, für die die Aussage relevant ist
+- counter_position: Gegendarstellung der anderen Seite, falls gefunden
+- gaps: Themen ohne aktuelle Daten ("Keine aktuellen Daten zu [X] (geprüft am [STICHTAG])")
+- Keine Bewertung, keine Scores
+"""
+]
+
+TASK = """
+GEMEINSAME RECHERCHE
+
+AUFTRAG:
+Sammle aktuelle, attribuierte Aussagen zur NATO-Russland-Lage für alle fünf Dimensionen.
+Der RSS-Feed-Kontext unten ist bekannt; suche nach Ergänzungen, Gegendarstellungen und Lücken.
+
+AUSGABE:
+- evidence: Liste attribuierter Aussagen (claim, source, date, url, dimensions, counter_position)
+- gaps: Themen ohne aktuelle Daten
+"""
+
+
+def build_research_prompt(date: str, rss_data: str) -> str:
+    return f"""{TASK}
+STICHTAG: {date}
+
+RSS-FEED-KONTEXT:
+{rss_data}
+"""
+
+
+def create_model(search_results: int = RESEARCH_SEARCH_RESULTS) -> Model:
+    """Create the default model: research model with web, X and news search."""
+    return create_research_model(
+        search_results=search_results,
+        sources=[{"type": "web"}, {"type": "x"}, {"type": "news"}],
+    )
+
+
+def create_agent(model: Optional[Model] = None) -> Agent:
+    """Create the agent (default model: see create_model())."""
+    model = model or create_model()
+
+    return Agent(
+        model=model,
+        description=DESCRIPTION,
+        instructions=INSTRUCTIONS,
+        output_schema=EvidencePack,
+        markdown=False,
+    )
+
+
+def _evidence_key(evidence: Evidence) -> str:
+    """Dedup key: normalized URL (without scheme, query, fragment) or normalized claim."""
+    if evidence.url:
+        url = re.sub(r"^https?://(www\.)?", "", evidence.url.strip().lower())
+        return re.split(r"[?#]", url)[0].rstrip("/")
+    return re.sub(r"\W+", " ", evidence.claim.casefold()).strip()
+
+
+def dedup_evidence(pack: EvidencePack) -> EvidencePack:
+    """
+    Merge evidence items pointing to the same URL (or with the same claim).
+
+    Args:
+        pack: Evidence pack from the research agent
+
+    Returns:
+        New pack with unique evidence items (dimensions merged)
+    """
+    unique: Dict[str, Evidence] = {}
+    for evidence in pack.evidence:
+        key = _evidence_key(evidence)
+        if key in unique:
+            kept = unique[key]
+            kept.dimensions = list(dict.fromkeys(kept.dimensions + evidence.dimensions))
+            kept.counter_position = kept.counter_position or evidence.counter_position
+        else:
+            unique[key] = evidence.model_copy(deep=True)
+    return EvidencePack(evidence=list(unique.values()), gaps=list(dict.fromkeys(pack.gaps)))
+
+
+def format_evidence(pack: EvidencePack, dimension: str) -> str:
+    """
+    Format the evidence relevant for one dimension as prompt text.
+
+    Evidence without dimension assignment is given to every dimension.
+
+    Args:
+        pack: Deduplicated evidence pack
+        dimension: Dimension key (e.g. "military")
+
+    Returns:
+        Markdown list (📍 claim, 🔹 source/date/url, ⚠️ counter position)
+    """
+    lines: List[str] = []
+    for evidence in pack.evidence:
+        if evidence.dimensions and dimension not in evidence.dimensions:
+            continue
+        lines.append(f"📍 {evidence.claim}")
+        source = f"{evidence.source}, {evidence.date}"
+        if evidence.url:
+            source += f", {evidence.url}"
+        lines.append(f"   🔹 {source}")
+        if evidence.counter_position:
+            lines.append(f"   ⚠️ Gegendarstellung: {evidence.counter_position}")
+
+    if not lines:
+        lines.append("Keine zusätzlichen Belege aus der gemeinsamen Recherche.")
+    if pack.gaps:
+        lines.append("")
+        lines.append("Lücken:")
+        lines.extend(f"- {gap}" for gap in pack.gaps)
+    return "\n".join(lines)
@@ -205,12 +205,60 @@ def create_agent() -> Agent:
     )
 
 
-def build_prompt(date: str, rss_data: str, dim_results: Dict, calculated_score: float) -> str:
-    return f"""
-ESKALATIONS-REVIEW - {date}
+# Static review task incl. all dimension scales
+TASK = f"""
+ESKALATIONS-REVIEW
 
 ZERO-TRUST-PRINZIP: Behandle alle Aussagen als Claims, nicht als Fakten. Attribuiere alles.
 
+═══════════════════════════════════════════════════════════
+DIMENSIONS-SKALEN (Referenz für die Ergebnisse unten)
+═══════════════════════════════════════════════════════════
+
+**Militärisch:**
+{MILITARY_SCALE}
+
+**Diplomatisch:**
+{DIPLOMATIC_SCALE}
+
+**Wirtschaftlich:**
+{ECONOMIC_SCALE}
+
+**Gesellschaftlich:**
+{SOCIETAL_SCALE}
+
+**Russen in DE:**
+{RUSSIANS_SCALE}
+
+BASELINE-SCORE-FORMEL: Mil*0.30 + Dip*0.20 + Eco*0.20 + Soc*0.15 + Rus*0.15
+
+═══════════════════════════════════════════════════════════
+DEINE AUFGABE
+═══════════════════════════════════════════════════════════
+
+Erstelle für den STICHTAG (siehe unten):
+
+1. **situation_summary** (Markdown)
+   Laienverständliche Gesamtlage-Synthese über alle Dimensionen
+   (Struktur siehe INSTRUCTIONS)
+
+2. **overall_score** (1.0-10.0)
+   Ausgangspunkt ist der BERECHNETE BASELINE-SCORE (siehe unten)
+   Prüfe Kontext und passe, wenn nötig, an
+
+═══════════════════════════════════════════════════════════
+OUTPUT
+═══════════════════════════════════════════════════════════
+JSON-Schema OverallAssessment. Keine zusätzlichen Texte.
+"""
+
+
+def build_prompt(date: str, rss_data: str, dim_results: Dict, calculated_score: float) -> str:
+    return f"""{TASK}
+═══════════════════════════════════════════════════════════
+STICHTAG: {date}
+═══════════════════════════════════════════════════════════
+
 ═══════════════════════════════════════════════════════════
 RSS-FEED-KONTEXT
 ═══════════════════════════════════════════════════════════
@@ -222,66 +270,31 @@ DIMENSIONS-ERGEBNISSE (zur Kontext-Nutzung, nicht zu ändern)
 
 **Militärisch:** {dim_results['military']['score']}
 
-Skala:
-{MILITARY_SCALE}
-
 Rationale: {dim_results['military']['rationale']}
 
 ---
 
 **Diplomatisch:** {dim_results['diplomatic']['score']}
 
-Skala:
-{DIPLOMATIC_SCALE}
-
 Rationale: {dim_results['diplomatic']['rationale']}
 
 ---
 
 **Wirtschaftlich:** {dim_results['economic']['score']}
 
-Skala:
-{ECONOMIC_SCALE}
-
 Rationale: {dim_results['economic']['rationale']}
 
 ---
 
 **Gesellschaftlich:** {dim_results['societal']['score']}
 
-Skala:
-{SOCIETAL_SCALE}
-
 Rationale: {dim_results['societal']['rationale']}
 
 ---
 
 **Russen in DE:** {dim_results['russians']['score']}
 
-Skala:
-{RUSSIANS_SCALE}
-
 Rationale: {dim_results['russians']['rationale']}
 
 BERECHNETER BASELINE-SCORE: {calculated_score:.2f}
-(Formel: Mil*0.30 + Dip*0.20 + Eco*0.20 + Soc*0.15 + Rus*0.15)
-
-═══════════════════════════════════════════════════════════
-DEINE AUFGABE
-═══════════════════════════════════════════════════════════
-
-Erstelle für {date}:
-
-1. **situation_summary** (Markdown)
-   Laienverständliche Gesamtlage-Synthese über alle Dimensionen
-   (Struktur siehe INSTRUCTIONS)
-
-2. **overall_score** (1.0-10.0)
-   Baseline-Score: {calculated_score:.2f}
-   Prüfe Kontext und passe, wenn nötig, an
-
-═══════════════════════════════════════════════════════════
-OUTPUT
-═══════════════════════════════════════════════════════════
-JSON-Schema OverallAssessment. Keine zusätzlichen Texte.
-"""
\ No newline at end of file
+"""
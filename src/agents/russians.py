@@ -1,5 +1,7 @@
 # src/agents/russians.py
+from typing import Optional
 from agno.agent import Agent
+from agno.models.base import Model
 
 try:
     from ..schemas import DimensionScore
@@ -84,26 +86,22 @@ Für jeden Punkt: Quelle + Datum oder "Keine aktuellen Daten".
 """
 ]
 
-def build_prompt(date: str, rss_data: str) -> str:
-    return f"""
-LAGE RUSSISCHER STAATSBÜRGER IN DEUTSCHLAND - {date}
-
-RSS-FEED-KONTEXT:
-{rss_data}
+TASK = """
+LAGE RUSSISCHER STAATSBÜRGER IN DEUTSCHLAND
 
 AUFTRAG:
 Bewerte Risiken und Einschränkungen für russische Staatsbürger in Deutschland (1-10).
 
 DATENQUELLEN (in dieser Reihenfolge):
-1. RSS-Feed-Kontext oben als Ausgangspunkt
+1. RSS-Feed-Kontext unten als Ausgangspunkt
 2. AKTIVE SUCHE in deinen verfügbaren Quellen (X/Twitter, Web), um Lücken zu füllen
-3. Fokus auf aktuelle Informationen (<30 Tage vom {date})
+3. Fokus auf aktuelle Informationen (<30 Tage vor dem STICHTAG)
 4. Historischer Kontext: Ältere Informationen zur Einordnung von Trends (Verschlechterung/Verbesserung)
 
 PFLICHT:
 - Jede Aussage mit Quelle + Datum belegen
 - Wenn RSS-Daten unzureichend: AKTIV nach aktuellen Informationen suchen
-- Fehlende Daten explizit kennzeichnen: "Keine aktuellen Daten zu [X] gefunden (geprüft am {date})"
+- Fehlende Daten explizit kennzeichnen: "Keine aktuellen Daten zu [X] gefunden (geprüft am [STICHTAG])"
 - Historischer Kontext: Falls vorhanden, ältere Entwicklungen erwähnen (z.B. "Seit 2022...", "Trend seit...")
 - Frühe Warnzeichen ernst nehmen, aber nicht ohne Belege dramatisieren
 - Attributive Sprache verwenden: "Laut [Quelle, Datum]..."
@@ -113,10 +111,23 @@ AUSGABE:
 - rationale: Begründung mit Quellen + Datum, historischer Kontext falls relevant, fehlende Daten
 """
 
-def create_agent() -> Agent:
+def build_prompt(date: str, rss_data: str) -> str:
+    return f"""{TASK}
+STICHTAG: {date}
+
+RSS-FEED-KONTEXT:
+{rss_data}
+"""
+
+# Keeps its own live search when the shared research pass ran (see scoring3.py): the value of
+# this agent is the X-only search on the accounts below, which the research pass doesn't query
+USES_SHARED_RESEARCH = False
+
+def create_model(search_results: int = 20) -> Model:
+    """Create the default model: research model with X search on selected accounts."""
     # Test: Use only X search to verify if included_x_handles works
-    model = create_research_model(
-        search_results=20,
+    return create_research_model(
+        search_results=search_results,
         sources=[{"type": "x"}],  # Only X search, no web
         x_accounts=[
             "AuswaertigesAmt",   # DE: Auswärtiges Amt - Visa, Reisehinweise, Konsulate
@@ -132,6 +143,10 @@ def create_agent() -> Agent:
         ]
     )
 
+def create_agent(model: Optional[Model] = None) -> Agent:
+    """Create the agent (default model: see create_model())."""
+    model = model or create_model()
+
     return Agent(
         model=model,
         description=DESCRIPTION,
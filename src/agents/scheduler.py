@@ -0,0 +1,297 @@
+# src/agents/scheduler.py
+"""Process-wide LLM rate limiter: token buckets per provider/model with priority queueing."""
+
+import asyncio
+import heapq
+import itertools
+import os
+import threading
+import time
+from typing import Any, Dict, List, Tuple
+
+try:
+    from .metrics import call_metrics
+except ImportError:
+    from metrics import call_metrics
+
+# Priority classes (lower value is served first)
+PRIORITY_REVIEW = 0
+PRIORITY_DIMENSION = 1
+PRIORITY_FILTER = 2
+
+PRIORITY_NAMES = {
+    PRIORITY_REVIEW: "review",
+    PRIORITY_DIMENSION: "dimension",
+    PRIORITY_FILTER: "filter",
+}
+
+# Requests/tokens per minute per provider (override with LLM_RPM_<PROVIDER> / LLM_TPM_<PROVIDER>,
+# or per model with LLM_RPM_<PROVIDER>_<MODEL> where the model id is upper-cased with "-"/"." as "_")
+DEFAULT_RATE_LIMITS: Dict[str, Dict[str, int]] = {
+    "xai": {"rpm": 60, "tpm": 500000},
+    "anthropic": {"rpm": 50, "tpm": 400000},
+}
+FALLBACK_RATE_LIMIT = {"rpm": 30, "tpm": 200000}
+
+# Output tokens reserved per request until the actual usage is known
+RESERVED_OUTPUT_TOKENS = 1000
+
+# Max sleep between capacity checks of async waiters
+ASYNC_POLL_SECONDS = 0.25
+
+
+def _env_limit(name: str, provider: str, model: str, default: int) -> int:
+    model_key = model.upper().replace("-", "_").replace(".", "_")
+    for key in (f"LLM_{name}_{provider.upper()}_{model_key}", f"LLM_{name}_{provider.upper()}"):
+        value = os.getenv(key)
+        if value:
+            return int(value)
+    return default
+
+
+class _Bucket:
+    """Request and token buckets of one provider/model, refilled continuously."""
+
+    def __init__(self, rpm: int, tpm: int):
+        self.rpm = rpm
+        self.tpm = tpm
+        self.requests = float(rpm)
+        self.tokens = float(tpm)
+        self.updated = time.monotonic()
+        self.waiters: List[Tuple[int, int]] = []  # Heap of (priority, sequence)
+
+    def refill(self, now: float) -> None:
+        elapsed = now - self.updated
+        self.updated = now
+        self.requests = min(self.rpm, self.requests + elapsed * self.rpm / 60.0)
+        self.tokens = min(self.tpm, self.tokens + elapsed * self.tpm / 60.0)
+
+    def wait_time(self, tokens: int) -> float:
+        """Seconds until a request with tokens fits (0 if it fits now)."""
+        missing_requests = max(0.0, 1.0 - self.requests)
+        missing_tokens = max(0.0, tokens - self.tokens)
+        return max(missing_requests * 60.0 / self.rpm, missing_tokens * 60.0 / self.tpm)
+
+
+class LLMScheduler:
+    """
+    Token-bucket rate limiter shared by all LLM calls of the process.
+
+    Each provider/model has a request bucket (RPM) and a token bucket (TPM).
+    Waiting requests are served strictly by priority, then arrival order, so
+    a queued review call is not starved by a burst of filter calls. Token
+    reservations are estimates and are corrected with the actual usage once
+    the call has finished.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._condition = threading.Condition(self._lock)
+        self._buckets: Dict[str, _Bucket] = {}
+        self._sequence = itertools.count()
+        self._stats: Dict[str, Dict[str, float]] = {}
+
+    def _bucket(self, provider: str, model: str) -> Tuple[str, _Bucket]:
+        key = f"{provider}:{model}" if model else provider
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            defaults = DEFAULT_RATE_LIMITS.get(provider, FALLBACK_RATE_LIMIT)
+            bucket = _Bucket(
+                rpm=_env_limit("RPM", provider, model, defaults["rpm"]),
+                tpm=_env_limit("TPM", provider, model, defaults["tpm"]),
+            )
+            self._buckets[key] = bucket
+        return key, bucket
+
+    def _try_acquire(self, bucket: _Bucket, waiter: Tuple[int, int], tokens: int) -> float:
+        """Grant the request if it is first in line and fits (caller holds the lock)."""
+        now = time.monotonic()
+        bucket.refill(now)
+        if bucket.waiters[0] != waiter:
+            return ASYNC_POLL_SECONDS  # Woken up by notify when the queue head changes
+        wait = bucket.wait_time(tokens)
+        if wait > 0:
+            return wait
+        bucket.requests -= 1
+        bucket.tokens -= tokens
+        heapq.heappop(bucket.waiters)
+        self._condition.notify_all()
+        return 0.0
+
+    def _leave(self, bucket: _Bucket, waiter: Tuple[int, int]) -> None:
+        """Remove an abandoned waiter (caller holds the lock)."""
+        if waiter in bucket.waiters:
+            bucket.waiters.remove(waiter)
+            heapq.heapify(bucket.waiters)
+            self._condition.notify_all()
+
+    def _record(self, key: str, priority: int, tokens: int, queued: float) -> None:
+        for stats_key in (key, f"priority:{PRIORITY_NAMES.get(priority, priority)}"):
+            stats = self._stats.setdefault(stats_key, {
+                "requests": 0,
+                "reserved_tokens": 0,
+                "queue_seconds": 0.0,
+                "max_queue_seconds": 0.0,
+            })
+            stats["requests"] += 1
+            stats["reserved_tokens"] += tokens
+            stats["queue_seconds"] += queued
+            stats["max_queue_seconds"] = max(stats["max_queue_seconds"], queued)
+
+    def _enqueue(self, provider: str, model: str, tokens: int, priority: int) -> Tuple[str, _Bucket, Tuple[int, int], int]:
+        with self._lock:
+            key, bucket = self._bucket(provider, model)
+            waiter = (priority, next(self._sequence))
+            heapq.heappush(bucket.waiters, waiter)
+            # A single request larger than the bucket would never fit
+            return key, bucket, waiter, min(tokens + RESERVED_OUTPUT_TOKENS, bucket.tpm)
+
+    def acquire(self, provider: str, model: str, tokens: int, priority: int) -> float:
+        """
+        Block until the request may be sent.
+
+        Args:
+            provider: Provider name (e.g. "xai", "anthropic")
+            model: Model id
+            tokens: Estimated prompt tokens
+            priority: PRIORITY_REVIEW, PRIORITY_DIMENSION or PRIORITY_FILTER
+
+        Returns:
+            Seconds spent waiting in the queue
+        """
+        start = time.monotonic()
+        key, bucket, waiter, reserved = self._enqueue(provider, model, tokens, priority)
+        with self._condition:
+            try:
+                while True:
+                    wait = self._try_acquire(bucket, waiter, reserved)
+                    if wait == 0:
+                        break
+                    self._condition.wait(timeout=wait)
+            except BaseException:
+                self._leave(bucket, waiter)
+                raise
+            queued = time.monotonic() - start
+            self._record(key, priority, reserved, queued)
+        return queued
+
+    async def acquire_async(self, provider: str, model: str, tokens: int, priority: int) -> float:
+        """
+        Async variant of acquire() (polls instead of blocking the event loop).
+
+        Cancelling the awaiting task (e.g. a hedged request that lost) removes
+        it from the queue.
+
+        Returns:
+            Seconds spent waiting in the queue
+        """
+        start = time.monotonic()
+        key, bucket, waiter, reserved = self._enqueue(provider, model, tokens, priority)
+        try:
+            while True:
+                with self._lock:
+                    wait = self._try_acquire(bucket, waiter, reserved)
+                    if wait == 0:
+                        queued = time.monotonic() - start
+                        self._record(key, priority, reserved, queued)
+                        return queued
+                await asyncio.sleep(min(wait, ASYNC_POLL_SECONDS))
+        except BaseException:
+            with self._lock:
+                self._leave(bucket, waiter)
+            raise
+
+    def settle(self, provider: str, model: str, reserved_tokens: int, used_tokens: int) -> None:
+        """
+        Correct the token bucket with the actual usage of a finished call.
+
+        Args:
+            provider: Provider name
+            model: Model id
+            reserved_tokens: Estimated prompt tokens passed to acquire()
+            used_tokens: Actual input + output tokens (0 if unknown)
+        """
+        if not used_tokens:
+            return
+        with self._condition:
+            _, bucket = self._bucket(provider, model)
+            reserved = min(reserved_tokens + RESERVED_OUTPUT_TOKENS, bucket.tpm)
+            bucket.tokens = min(bucket.tpm, bucket.tokens + reserved - used_tokens)
+            self._condition.notify_all()
+
+    def get_stats(self) -> Dict[str, Dict[str, float]]:
+        """Return queue-time stats per provider/model and per priority class."""
+        with self._lock:
+            stats = {}
+            for key, values in self._stats.items():
+                stats[key] = {
+                    **values,
+                    "queue_seconds": round(values["queue_seconds"], 3),
+                    "max_queue_seconds": round(values["max_queue_seconds"], 3),
+                    "avg_queue_seconds": round(values["queue_seconds"] / values["requests"], 3),
+                }
+            return stats
+
+
+_scheduler = LLMScheduler()
+
+
+def get_scheduler() -> LLMScheduler:
+    """Return the process-wide scheduler."""
+    return _scheduler
+
+
+def _model_id(agent: Any) -> str:
+    return str(getattr(getattr(agent, "model", None), "id", "") or "")
+
+
+def _used_tokens(response: Any) -> int:
+    metrics = call_metrics(response)
+    return metrics["input_tokens"] + metrics["output_tokens"]
+
+
+def run_agent(agent: Any, prompt: str, provider: str, tokens: int, priority: int) -> Tuple[Any, float]:
+    """
+    Run Agent.run() through the scheduler.
+
+    Args:
+        agent: agno Agent
+        prompt: Prompt
+        provider: Provider name for the rate limit (e.g. "xai")
+        tokens: Estimated prompt tokens
+        priority: Priority class
+
+    Returns:
+        Tuple of (agno RunOutput, seconds spent in the queue)
+    """
+    model = _model_id(agent)
+    queued = _scheduler.acquire(provider, model, tokens, priority)
+    response = agent.run(prompt)
+    _scheduler.settle(provider, model, tokens, _used_tokens(response))
+    return response, queued
+
+
+async def arun_agent(agent: Any, prompt: str, provider: str, tokens: int, priority: int) -> Tuple[Any, float]:
+    """
+    Run Agent.arun() through the scheduler.
+
+    Args:
+        agent: agno Agent
+        prompt: Prompt
+        provider: Provider name for the rate limit (e.g. "xai")
+        tokens: Estimated prompt tokens
+        priority: Priority class
+
+    Returns:
+        Tuple of (agno RunOutput, seconds spent in the queue)
+    """
+    model = _model_id(agent)
+    queued = await _scheduler.acquire_async(provider, model, tokens, priority)
+    response = await agent.arun(prompt)
+    _scheduler.settle(provider, model, tokens, _used_tokens(response))
+    return response, queued
+
+
+def get_scheduler_stats() -> Dict[str, Dict[str, float]]:
+    """Return queue-time stats of the process-wide scheduler."""
+    return _scheduler.get_stats()
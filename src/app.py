@@ -1,22 +1,57 @@
 # src/app.py
+import base64
+import gzip
+import hashlib
+import json
 import os
 import sys
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
 from urllib.parse import quote
-from fastapi import FastAPI, Request, HTTPException
+from fastapi import FastAPI, Request, HTTPException, Query, Response, BackgroundTasks
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import JSONResponse, HTMLResponse, RedirectResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from pydantic import BaseModel
-from src.storage import get_today_report
-from src.agents.review import ESKALATIONSSKALA
+from src.storage import get_today_report, get_report_by_date, get_score_history, get_score_history_manifest, get_dashboard_snapshot
+from src.dashboard import TREND_DAYS, render_dashboard_body, snapshot_matches
 from datetime import datetime, timezone
-from zoneinfo import ZoneInfo
 import stytch
 from stytch.core.response_base import StytchError
 
+# Optional fast paths for the JSON report API (plain json / gzip without them)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
 app = FastAPI(title="Escalation Monitor API")
 templates = Jinja2Templates(directory="src/templates")
 
+# History changes once a day; clients may reuse it briefly, then revalidate via ETag
+HISTORY_CACHE_CONTROL = "private, max-age=300"
+
+# Report API: past reports never change; the latest one is always revalidated via ETag
+REPORT_CACHE_CONTROL_LATEST = "private, no-cache"
+REPORT_CACHE_CONTROL_PAST = "private, max-age=86400, immutable"
+
+# Responses below this size are sent uncompressed
+COMPRESS_MIN_BYTES = 1024
+
+# Stale-while-revalidate: the dashboard serves the cached report immediately and
+# refreshes it in the background once it is older than this (seconds)
+DASHBOARD_REPORT_MAX_AGE = float(os.getenv("DASHBOARD_REPORT_MAX_AGE", "60"))
+
+_dashboard_lock = threading.Lock()
+_dashboard_report: Optional[Tuple[Optional[Dict[str, Any]], str, float]] = None  # (report, body_html, loaded_at)
+_dashboard_refreshing = False
+
 # --- Stytch Configuration ---
 STYTCH_PROJECT_ID = os.getenv("STYTCH_PROJECT_ID")
 STYTCH_SECRET = os.getenv("STYTCH_SECRET")
@@ -33,9 +68,73 @@ if STYTCH_PROJECT_ID and STYTCH_SECRET:
 else:
     print("WARNING: Stytch credentials not configured. Authentication will be disabled.", file=sys.stderr)
 
+# Verified sessions are reused for this long (capped at the JWT's own expiry)
+AUTH_SESSION_CACHE_TTL = float(os.getenv("AUTH_SESSION_CACHE_TTL", "60"))
+AUTH_SESSION_CACHE_MAX = 1000
+
+_session_cache_lock = threading.Lock()
+_session_cache: Dict[str, Tuple[Tuple[Any, Any, Optional[str]], float]] = {}  # sha256(jwt) -> (user, expires_at)
+
 # --- Helper: Get authenticated user ---
+def _token_key(session_jwt: str) -> str:
+    return hashlib.sha256(session_jwt.encode()).hexdigest()
+
+def _jwt_expiry(session_jwt: str) -> Optional[float]:
+    """Read the exp claim (unverified; only used to bound the cache lifetime)."""
+    try:
+        payload = session_jwt.split(".")[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        return float(claims["exp"])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return None
+
+def get_cached_user(session_jwt: str):
+    """Return the user of a recently verified session JWT or None."""
+    key = _token_key(session_jwt)
+    with _session_cache_lock:
+        entry = _session_cache.get(key)
+        if entry is None:
+            return None
+        if entry[1] <= time.time():
+            del _session_cache[key]
+            return None
+        return entry[0]
+
+def _cache_user(session_jwt: str, user, verified_locally: bool) -> None:
+    now = time.time()
+    expires_at = now + AUTH_SESSION_CACHE_TTL
+    jwt_exp = _jwt_expiry(session_jwt) if verified_locally else None
+    if jwt_exp is not None:
+        expires_at = min(expires_at, jwt_exp)
+
+    with _session_cache_lock:
+        if len(_session_cache) >= AUTH_SESSION_CACHE_MAX:
+            for key in [k for k, (_, exp) in _session_cache.items() if exp <= now]:
+                del _session_cache[key]
+            if len(_session_cache) >= AUTH_SESSION_CACHE_MAX:
+                _session_cache.clear()
+        _session_cache[_token_key(session_jwt)] = (user, expires_at)
+
+def _session_user(session):
+    """Build the (user_id, session, email) tuple from a Stytch session."""
+    # Extract email from authentication_factors
+    email = None
+    if hasattr(session, 'authentication_factors') and session.authentication_factors:
+        for factor in session.authentication_factors:
+            if hasattr(factor, 'email_factor') and factor.email_factor:
+                email = factor.email_factor.email_address
+                break
+
+    return session.user_id, session, email
+
 def get_authenticated_user(request: Request):
-    """Validate JWT session and return Stytch user or None."""
+    """
+    Validate JWT session and return (user_id, session, email) or None.
+
+    Blocking (JWKS fetch, remote call): run it in the thread pool from async code.
+    The signature is verified locally against the cached JWKS; Stytch is only
+    called if local verification fails (e.g. JWT older than its 5 min lifetime).
+    """
     if not stytch_client:
         return None
 
@@ -43,18 +142,19 @@ def get_authenticated_user(request: Request):
     if not session_jwt:
         return None
 
-    try:
-        resp = stytch_client.sessions.authenticate_jwt(session_jwt=session_jwt)
-
-        # Extract email from authentication_factors
-        email = None
-        if hasattr(resp.session, 'authentication_factors') and resp.session.authentication_factors:
-            for factor in resp.session.authentication_factors:
-                if hasattr(factor, 'email_factor') and factor.email_factor:
-                    email = factor.email_factor.email_address
-                    break
+    user = get_cached_user(session_jwt)
+    if user:
+        return user
 
-        return resp.session.user_id, resp.session, email
+    try:
+        session = stytch_client.sessions.authenticate_jwt_local(session_jwt=session_jwt)
+        verified_locally = session is not None
+        if not verified_locally:
+            session = stytch_client.sessions.authenticate(session_jwt=session_jwt).session
+
+        user = _session_user(session)
+        _cache_user(session_jwt, user, verified_locally)
+        return user
     except StytchError:
         return None
 
@@ -78,8 +178,11 @@ async def auth_middleware(request: Request, call_next):
         response = await call_next(request)
         return response
 
-    # Check JWT authentication
-    user = get_authenticated_user(request)
+    # Check JWT authentication (cached sessions without leaving the event loop)
+    session_jwt = request.cookies.get("stytch_session_jwt")
+    user = get_cached_user(session_jwt) if session_jwt else None
+    if not user:
+        user = await run_in_threadpool(get_authenticated_user, request)
     if not user:
         # Redirect to login page with return URL
         return RedirectResponse(
@@ -119,7 +222,9 @@ async def send_magic_link(request: MagicLinkRequest):
 
     try:
         # Use send() instead of login_or_create() to only allow existing users
-        resp = stytch_client.magic_links.email.send(
+        # Sync SDK call: run in the thread pool so the event loop keeps serving
+        resp = await run_in_threadpool(
+            stytch_client.magic_links.email.send,
             email=request.email
         )
 
@@ -150,7 +255,8 @@ async def authenticate(request: Request):
 
     try:
         # Authenticate magic link with 60 days session duration
-        resp = stytch_client.magic_links.authenticate(
+        resp = await run_in_threadpool(
+            stytch_client.magic_links.authenticate,
             token=token,
             session_duration_minutes=87600  # 60 days (2 months)
         )
@@ -184,73 +290,214 @@ async def logout():
     response.delete_cookie(key="stytch_session_jwt")
     return response
 
+# --- Dashboard report (stale-while-revalidate) ---
+def _load_dashboard_report() -> Tuple[Optional[Dict[str, Any]], str]:
+    """
+    Load the latest report and its pre-rendered dashboard body, and cache both.
+
+    The body comes from the snapshot rendered by the pipeline; it is only
+    rendered here if the snapshot is missing or outdated.
+    """
+    global _dashboard_report
+    report = get_today_report()
+    snapshot = get_dashboard_snapshot(report["date"]) if report else None
+    body_html = snapshot["html"] if snapshot_matches(snapshot, report) else render_dashboard_body(report)
+    with _dashboard_lock:
+        _dashboard_report = (report, body_html, time.monotonic())
+    return report, body_html
+
+def _refresh_dashboard_report() -> None:
+    """Background task: reload the dashboard report."""
+    global _dashboard_refreshing
+    try:
+        _load_dashboard_report()
+    except Exception as e:
+        print(f"Error refreshing dashboard report: {e}")
+    finally:
+        with _dashboard_lock:
+            _dashboard_refreshing = False
+
+def _with_current_age(report: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Recompute is_today/age_days of a cached report (the day may have changed since loading)."""
+    if not report or "date" not in report:
+        return report
+    report_date = datetime.strptime(report["date"], "%Y-%m-%d").date()
+    age_days = (datetime.now(timezone.utc).date() - report_date).days
+    return {**report, "is_today": age_days == 0, "age_days": age_days}
+
+def get_dashboard_report(background_tasks: BackgroundTasks) -> Tuple[Optional[Dict[str, Any]], str, bool]:
+    """
+    Get the dashboard report without waiting for storage once a report is cached.
+
+    A cached report older than DASHBOARD_REPORT_MAX_AGE is served as is while a
+    background task (at most one at a time) reloads it.
+
+    Returns:
+        Tuple of (report or None, rendered dashboard body, whether a refresh is in progress)
+    """
+    global _dashboard_refreshing
+    with _dashboard_lock:
+        cached = _dashboard_report
+        stale = cached is not None and time.monotonic() - cached[2] >= DASHBOARD_REPORT_MAX_AGE
+        start_refresh = stale and not _dashboard_refreshing
+        if start_refresh:
+            _dashboard_refreshing = True
+        refreshing = stale or _dashboard_refreshing
+
+    if cached is None:
+        # Cold start: nothing to serve yet
+        report, body_html = _load_dashboard_report()
+        return _with_current_age(report), body_html, False
+
+    if start_refresh:
+        background_tasks.add_task(_refresh_dashboard_report)
+    return _with_current_age(cached[0]), cached[1], refreshing
+
+# Sync route on purpose: FastAPI runs it in the thread pool, so blocking storage I/O
+# (and fallback rendering) don't stall the event loop
 @app.get("/", response_class=HTMLResponse)
-def dashboard(request: Request):
+def dashboard(request: Request, background_tasks: BackgroundTasks):
     """Server-rendered dashboard with current escalation data."""
     # Get authenticated user info from request.state (set by middleware)
-    # This avoids a second authenticate_jwt() API call
+    # This avoids a second JWT verification
     user_info = getattr(request.state, 'user_info', None)
     user_email = None
     if user_info and len(user_info) >= 3:
         user_email = user_info[2]  # Extract email from tuple (user_id, session, email)
 
-    # Heutigen Report laden
-    report = get_today_report()
-
-    # Skala parsen
-    scale_lines = ESKALATIONSSKALA.strip().split('\n')
-    scale_levels = []
-    current_level = None
-
-    for line in scale_lines:
-        # Hauptdefinition erkennen: "NUMMER = LABEL: Beschreibung"
-        if '=' in line and ':' in line and not line.startswith(' ') and not line.startswith('\t'):
-            # Vorherige Stufe abschließen, falls vorhanden
-            if current_level:
-                scale_levels.append(current_level)
-
-            # Neue Stufe beginnen
-            parts = line.split('=', 1)
-            if len(parts) == 2:
-                num = parts[0].strip()
-                rest = parts[1].split(':', 1)
-                if len(rest) == 2:
-                    label = rest[0].strip()
-                    desc = rest[1].strip()
-                    try:
-                        current_level = {
-                            "number": int(num),
-                            "label": label,
-                            "description": desc
-                        }
-                    except ValueError:
-                        current_level = None
-        elif current_level and line.strip() and (line.startswith('   •') or line.startswith('   ') or line.startswith('\t')):
-            # Detail-Zeile zur aktuellen Stufe hinzufügen
-            current_level["description"] += "\n" + line
-
-    # Letzte Stufe hinzufügen
-    if current_level:
-        scale_levels.append(current_level)
-
-    # Timestamp formatieren (UTC -> Europa/Berlin)
-    if report and "timestamp" in report:
-        try:
-            dt_utc = datetime.fromisoformat(report["timestamp"].replace('Z', '+00:00'))
-            dt_berlin = dt_utc.astimezone(ZoneInfo("Europe/Berlin"))
-            formatted_timestamp = dt_berlin.strftime("%d.%m.%Y, %H:%M Uhr")
-        except:
-            formatted_timestamp = "Unbekannt"
-    else:
-        formatted_timestamp = "Keine Daten"
+    # Heutigen Report + vorgerenderten Dashboard-Inhalt laden (aus dem Cache,
+    # Aktualisierung ggf. im Hintergrund); hier kommen nur noch Nutzer-Daten dazu
+    report, dashboard_body, refreshing = get_dashboard_report(background_tasks)
 
     return templates.TemplateResponse(
         "dashboard.html",
         {
             "request": request,
             "report": report,
-            "scale_levels": scale_levels,
-            "formatted_timestamp": formatted_timestamp,
-            "user_email": user_email
+            "dashboard_body": dashboard_body,
+            "user_email": user_email,
+            "trend_days": TREND_DAYS,
+            "refreshing": refreshing
         }
-    )
\ No newline at end of file
+    )
+
+# --- History API ---
+def _parse_date_param(value: Optional[str], name: str) -> Optional[str]:
+    """Validate an optional YYYY-MM-DD query parameter."""
+    if value is None:
+        return None
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").strftime("%Y-%m-%d")
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid '{name}' date, expected YYYY-MM-DD")
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Check the If-None-Match header against an ETag (weak comparison)."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = [tag.strip().removeprefix("W/") for tag in header.split(",")]
+    return "*" in candidates or etag.removeprefix("W/") in candidates
+
+@app.get("/api/history")
+def history(
+    request: Request,
+    date_from: Optional[str] = Query(None, alias="from"),
+    date_to: Optional[str] = Query(None, alias="to"),
+):
+    """Overall and dimension scores per day (columnar) from the precomputed score history."""
+    start = _parse_date_param(date_from, "from")
+    end = _parse_date_param(date_to, "to")
+    if start and end and start > end:
+        raise HTTPException(status_code=400, detail="'from' must not be after 'to'")
+
+    # The manifest's content hash validates the range without reading the table
+    manifest = get_score_history_manifest()
+    etag = None
+    if manifest and manifest.get("etag"):
+        etag = '"' + hashlib.sha256(f"{manifest['etag']}|{start}|{end}".encode()).hexdigest()[:32] + '"'
+        if _etag_matches(request, etag):
+            return Response(status_code=304, headers={"ETag": etag, "Cache-Control": HISTORY_CACHE_CONTROL})
+
+    scores = get_score_history(start, end)
+    body = {"from": start, "to": end, "rows": len(scores["date"]), "history": scores}
+
+    if etag is None:
+        content = json.dumps(body, sort_keys=True, separators=(",", ":")).encode()
+        etag = '"' + hashlib.sha256(content).hexdigest()[:32] + '"'
+        if _etag_matches(request, etag):
+            return Response(status_code=304, headers={"ETag": etag, "Cache-Control": HISTORY_CACHE_CONTROL})
+
+    return JSONResponse(body, headers={"ETag": etag, "Cache-Control": HISTORY_CACHE_CONTROL})
+
+# --- Report API ---
+def _serialize_report(report: Dict[str, Any]) -> bytes:
+    """Compact JSON (orjson if installed)."""
+    if orjson is not None:
+        return orjson.dumps(report)
+    return json.dumps(report, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+def _choose_encoding(request: Request) -> Optional[str]:
+    """Pick "br" (if brotli is installed) or "gzip" from Accept-Encoding; None = identity."""
+    accepted = set()
+    for part in request.headers.get("accept-encoding", "").split(","):
+        name, _, params = part.strip().partition(";")
+        params = params.replace(" ", "")
+        try:
+            quality = float(params[2:]) if params.startswith("q=") else 1.0
+        except ValueError:
+            quality = 0.0
+        if name and quality > 0:
+            accepted.add(name.strip().lower())
+    if brotli is not None and "br" in accepted:
+        return "br"
+    if "gzip" in accepted:
+        return "gzip"
+    return None
+
+def _report_response(request: Request, report: Dict[str, Any], cache_control: str) -> Response:
+    """
+    JSON response for a report with strong ETag, 304 support and compression.
+
+    The ETag is derived from the report date and timestamp (plus age_days for the
+    latest report, which changes daily) and the content encoding.
+    """
+    encoding = _choose_encoding(request)
+    version = f"{report.get('date')}|{report.get('timestamp')}|{report.get('age_days')}"
+    digest = hashlib.sha256(version.encode()).hexdigest()[:32]
+    headers = {"Cache-Control": cache_control, "Vary": "Accept-Encoding"}
+
+    # Check the validator before serializing (cheap polling)
+    for candidate in (f'"{digest}-{encoding}"' if encoding else None, f'"{digest}"'):
+        if candidate and _etag_matches(request, candidate):
+            return Response(status_code=304, headers={**headers, "ETag": candidate})
+
+    body = _serialize_report(report)
+    if encoding and len(body) >= COMPRESS_MIN_BYTES:
+        body = brotli.compress(body) if encoding == "br" else gzip.compress(body, compresslevel=6)
+        headers["Content-Encoding"] = encoding
+        headers["ETag"] = f'"{digest}-{encoding}"'
+    else:
+        headers["ETag"] = f'"{digest}"'
+
+    return Response(content=body, media_type="application/json", headers=headers)
+
+@app.get("/api/report/latest")
+def report_latest(request: Request):
+    """Most recent report (up to 7 days back) as compact JSON, incl. is_today/age_days."""
+    report = get_today_report()
+    if not report:
+        raise HTTPException(status_code=404, detail="No report available")
+    return _report_response(request, report, REPORT_CACHE_CONTROL_LATEST)
+
+@app.get("/api/report/{date}")
+def report_by_date(request: Request, date: str):
+    """Report of one day (YYYY-MM-DD) as compact JSON."""
+    date = _parse_date_param(date, "date")
+    report = get_report_by_date(date)
+    if not report:
+        raise HTTPException(status_code=404, detail=f"No report for {date}")
+
+    today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    cache_control = REPORT_CACHE_CONTROL_PAST if date < today else REPORT_CACHE_CONTROL_LATEST
+    return _report_response(request, report, cache_control)
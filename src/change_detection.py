@@ -0,0 +1,161 @@
+# src/change_detection.py
+"""Detect how much today's feed items differ from the previous run (item hashes + weighted novelty)."""
+from __future__ import annotations
+import hashlib
+import os
+import re
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+try:
+    from .feeds.base import FeedItem
+    from .token_budget import AGENT_RELEVANT_TAGS
+except ImportError:
+    from feeds.base import FeedItem
+    from token_budget import AGENT_RELEVANT_TAGS
+
+# Enable the fast path (reuse previous dimension scores on quiet days)
+CHANGE_DETECTION_ENABLED = os.getenv("CHANGE_DETECTION", "1") == "1"
+
+# Share of new item weight (overall and per dimension) below which the previous result is reused
+CHANGE_NOVELTY_THRESHOLD = float(os.getenv("CHANGE_NOVELTY_THRESHOLD", "0.15"))
+
+# Max age of the previous report, and of a dimension's last real assessment, for reusing its score
+CHANGE_MAX_AGE_DAYS = int(os.getenv("CHANGE_MAX_AGE_DAYS", "1"))
+
+
+def assessment_age_days(assessed_date: str) -> int:
+    """Days since a dimension was last scored by its agent (report dates are UTC, YYYY-MM-DD)."""
+    return (datetime.now(timezone.utc).date() - datetime.strptime(assessed_date, "%Y-%m-%d").date()).days
+
+
+def item_fingerprint(item: FeedItem) -> str:
+    """Stable short hash of an item (URL + normalized full text)."""
+    text = re.sub(r"\s+", " ", (item.original_text or item.text).casefold()).strip()
+    return hashlib.sha1(f"{item.url}\n{text}".encode("utf-8")).hexdigest()[:16]
+
+
+def item_weight(item: FeedItem) -> int:
+    """Novelty weight of an item: tagged (topical) items count more."""
+    return 1 + len(item.tags)
+
+
+def _relevant_weight(items: List[FeedItem], relevant_tags: frozenset) -> int:
+    """Weight of the items carrying at least one relevant tag (1 + number of relevant tags each)."""
+    weight = 0
+    for item in items:
+        matches = relevant_tags.intersection(item.tags)
+        if matches:
+            weight += 1 + len(matches)
+    return weight
+
+
+def compute_fingerprints(results: List[Dict[str, Any]]) -> Dict[str, int]:
+    """
+    Fingerprint all items of successful feeds.
+
+    Args:
+        results: Feed results from process_all_feeds()
+
+    Returns:
+        Dict mapping item fingerprint to item weight (stored in run_metadata)
+    """
+    return {
+        item_fingerprint(item): item_weight(item)
+        for feed_result in results
+        if feed_result["result"] == "ok"
+        for item in feed_result["items"]
+    }
+
+
+def get_previous_fingerprints(report: Optional[Dict[str, Any]]) -> Optional[Dict[str, int]]:
+    """Return the item fingerprints stored in a report (None if missing)."""
+    if not report:
+        return None
+    run_metadata = report.get("escalation_result", {}).get("run_metadata", {})
+    return run_metadata.get("feed_fingerprints")
+
+
+def filter_new_items(results: List[Dict[str, Any]], previous: Dict[str, int]) -> List[Dict[str, Any]]:
+    """
+    Keep only items that were not part of the previous run.
+
+    Args:
+        results: Feed results from process_all_feeds()
+        previous: Item fingerprints of the previous run
+
+    Returns:
+        Feed results with the same structure, containing only new items
+    """
+    return [
+        {**feed_result, "items": [item for item in feed_result["items"] if item_fingerprint(item) not in previous]}
+        if feed_result["result"] == "ok" else feed_result
+        for feed_result in results
+    ]
+
+
+def detect_changes(
+    results: List[Dict[str, Any]],
+    previous_report: Optional[Dict[str, Any]],
+    threshold: float = CHANGE_NOVELTY_THRESHOLD,
+) -> Dict[str, Any]:
+    """
+    Compare today's items with the items of the previous run.
+
+    Novelty is the weight of new items divided by the weight of all current
+    items, overall and per dimension agent (counting only items carrying one of
+    the agent's relevant tags). The fast path is taken when the previous report
+    is recent and successful and the overall novelty is below the threshold;
+    dimensions whose own novelty reaches the threshold are still re-run.
+
+    Args:
+        results: Feed results from process_all_feeds()
+        previous_report: Stored report of the previous run (from get_latest_report())
+        threshold: Novelty threshold
+
+    Returns:
+        Dict with novelty, item counts, per-agent novelty, affected agents and fast_path flag
+    """
+    previous = get_previous_fingerprints(previous_report)
+
+    items = [
+        item
+        for feed_result in results
+        if feed_result["result"] == "ok"
+        for item in feed_result["items"]
+    ]
+    new_items = [item for item in items if previous is None or item_fingerprint(item) not in previous]
+
+    total_weight = sum(item_weight(item) for item in items)
+    new_weight = sum(item_weight(item) for item in new_items)
+    novelty = new_weight / total_weight if total_weight else 0.0
+
+    agent_novelty = {}
+    for agent_name, relevant_tags in AGENT_RELEVANT_TAGS.items():
+        if not relevant_tags:
+            continue  # Review agent always runs
+        relevant_total = _relevant_weight(items, relevant_tags)
+        relevant_new = _relevant_weight(new_items, relevant_tags)
+        agent_novelty[agent_name] = round(relevant_new / relevant_total, 3) if relevant_total else 0.0
+
+    reason = None
+    if previous is None:
+        reason = "no previous fingerprints"
+    elif previous_report.get("escalation_result", {}).get("result") != "ok":
+        reason = "previous run failed"
+    elif previous_report.get("age_days", 0) > CHANGE_MAX_AGE_DAYS:
+        reason = f"previous report older than {CHANGE_MAX_AGE_DAYS} day(s)"
+    elif novelty >= threshold:
+        reason = f"novelty {novelty:.2f} >= {threshold:.2f}"
+
+    return {
+        "previous_date": previous_report.get("date") if previous_report else None,
+        "items": len(items),
+        "new_items": len(new_items),
+        "novelty": round(novelty, 3),
+        "threshold": threshold,
+        "agent_novelty": agent_novelty,
+        "affected_agents": sorted(name for name, value in agent_novelty.items() if value >= threshold),
+        "fast_path": reason is None,
+        "full_run_reason": reason,
+    }
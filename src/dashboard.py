@@ -0,0 +1,154 @@
+# src/dashboard.py
+"""Render the report-dependent dashboard body once per report (snapshot stored next to the report)."""
+import re
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from zoneinfo import ZoneInfo
+from jinja2 import Environment, FileSystemLoader
+from markdown_it import MarkdownIt
+
+try:
+    from .agents.review import ESKALATIONSSKALA
+except ImportError:
+    from agents.review import ESKALATIONSSKALA
+
+# Bump when dashboard_body.html or the rendering changes (older snapshots are re-rendered)
+DASHBOARD_SNAPSHOT_VERSION = 2
+
+# Days shown in the dashboard's trend sparkline
+TREND_DAYS = 90
+
+TEMPLATES_DIR = Path(__file__).parent / "templates"
+
+_environment = Environment(loader=FileSystemLoader(str(TEMPLATES_DIR)), autoescape=True)
+
+# CommonMark with GFM tables and line breaks (as marked.js rendered it in the browser before):
+# lists may follow a paragraph without a blank line and nest with 2-space indents
+_markdown = MarkdownIt("commonmark", {"breaks": True, "html": False}).enable(["table", "strikethrough"])
+
+
+def parse_scale_levels(scale: str = ESKALATIONSSKALA) -> List[Dict[str, Any]]:
+    """
+    Parse the escalation scale into levels.
+
+    Args:
+        scale: Scale text ("NUMMER = LABEL: Beschreibung" plus indented detail lines)
+
+    Returns:
+        List of {"number", "label", "description"} dicts
+    """
+    scale_levels = []
+    current_level = None
+
+    for line in scale.strip().split('\n'):
+        # Hauptdefinition erkennen: "NUMMER = LABEL: Beschreibung"
+        if '=' in line and ':' in line and not line.startswith(' ') and not line.startswith('\t'):
+            # Vorherige Stufe abschließen, falls vorhanden
+            if current_level:
+                scale_levels.append(current_level)
+
+            # Neue Stufe beginnen
+            parts = line.split('=', 1)
+            if len(parts) == 2:
+                num = parts[0].strip()
+                rest = parts[1].split(':', 1)
+                if len(rest) == 2:
+                    label = rest[0].strip()
+                    desc = rest[1].strip()
+                    try:
+                        current_level = {
+                            "number": int(num),
+                            "label": label,
+                            "description": desc
+                        }
+                    except ValueError:
+                        current_level = None
+        elif current_level and line.strip() and (line.startswith('   •') or line.startswith('   ') or line.startswith('\t')):
+            # Detail-Zeile zur aktuellen Stufe hinzufügen
+            current_level["description"] += "\n" + line
+
+    # Letzte Stufe hinzufügen
+    if current_level:
+        scale_levels.append(current_level)
+
+    return scale_levels
+
+
+# Parsed once per process (the scale is static)
+SCALE_LEVELS = parse_scale_levels()
+
+
+def format_timestamp(report: Optional[Dict[str, Any]]) -> str:
+    """Format the report timestamp (UTC) for display in Europe/Berlin."""
+    if not report or "timestamp" not in report:
+        return "Keine Daten"
+    try:
+        dt_utc = datetime.fromisoformat(report["timestamp"].replace('Z', '+00:00'))
+        dt_berlin = dt_utc.astimezone(ZoneInfo("Europe/Berlin"))
+        return dt_berlin.strftime("%d.%m.%Y, %H:%M Uhr")
+    except (AttributeError, ValueError):
+        return "Unbekannt"
+
+
+def render_markdown(text: str) -> str:
+    """Render LLM markdown to HTML (HTML tags in the input are stripped; line breaks kept like GFM)."""
+    text = re.sub(r"<[^>]*>", "", text)
+    return _markdown.render(text)
+
+
+def render_dashboard_body(report: Optional[Dict[str, Any]]) -> str:
+    """
+    Render the report-dependent part of the dashboard (dashboard_body.html).
+
+    Contains score, level, timestamp, summary, scale and dimensions with the
+    markdown already rendered; per-request bits (user, age warning) stay in
+    dashboard.html.
+
+    Args:
+        report: Stored report or None
+
+    Returns:
+        HTML fragment
+    """
+    escalation_result = (report or {}).get("escalation_result") or {}
+    escalation_score = escalation_result.get("escalation_score")
+
+    summary_html = None
+    dimensions = []
+    if escalation_score:
+        if escalation_score.get("summary"):
+            summary_html = render_markdown(escalation_score["summary"])
+        dimensions = [
+            {"name": dim["name"], "score": dim["score"], "rationale_html": render_markdown(dim["rationale"])}
+            for dim in escalation_score.get("dimensions") or []
+        ]
+
+    return _environment.get_template("dashboard_body.html").render(
+        escalation_score=escalation_score,
+        summary_html=summary_html,
+        dimensions=dimensions,
+        scale_levels=SCALE_LEVELS,
+        formatted_timestamp=format_timestamp(report),
+        trend_days=TREND_DAYS,
+    )
+
+
+def build_dashboard_snapshot(report: Dict[str, Any]) -> Dict[str, Any]:
+    """Render the dashboard body of a stored report as snapshot (stored via storage.py)."""
+    return {
+        "date": report["date"],
+        "timestamp": report.get("timestamp"),
+        "version": DASHBOARD_SNAPSHOT_VERSION,
+        "html": render_dashboard_body(report),
+    }
+
+
+def snapshot_matches(snapshot: Optional[Dict[str, Any]], report: Optional[Dict[str, Any]]) -> bool:
+    """Check that a stored snapshot was rendered from this report with the current version."""
+    return (
+        snapshot is not None and report is not None
+        and snapshot.get("version") == DASHBOARD_SNAPSHOT_VERSION
+        and snapshot.get("date") == report.get("date")
+        and snapshot.get("timestamp") == report.get("timestamp")
+    )
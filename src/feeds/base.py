@@ -2,11 +2,18 @@
 from __future__ import annotations
 import datetime as dt
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional, List
-from dataclasses import dataclass
+from typing import Any, Dict, Optional, List, Set
+from dataclasses import dataclass, field
 import httpx
 import feedparser
 
+try:
+    from .summarizer import compress_items
+    from .tagging import tag_items
+except ImportError:
+    from summarizer import compress_items
+    from tagging import tag_items
+
 ISO_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
 
 def to_iso_utc(d: Optional[dt.datetime]) -> str:
@@ -23,10 +30,19 @@ class FeedItem:
     date: dt.datetime  # UTC datetime object
     text: str
     url: str
+    original_text: Optional[str] = None  # Full text if `text` was compressed
+    tags: List[str] = field(default_factory=list)  # Lexicon tags (see tagging.py)
 
 class FeedSource(ABC):
     """Abstract base class for RSS/Atom feed sources."""
 
+    # Max characters per item text for agent prompts (None = no compression).
+    # Longer texts are compressed extractively; the full text stays in original_text.
+    summary_char_budget: Optional[int] = None
+
+    # Tags required by filter_by_tags() (None = keep all items)
+    tag_filter: Optional[Set[str]] = None
+
     def __init__(self, source_name: str, feed_url: str):
         self.source_name = source_name
         self.feed_url = feed_url
@@ -60,6 +76,15 @@ class FeedSource(ABC):
         """
         pass
 
+    def filter_by_tags(self, items: List[FeedItem]) -> List[FeedItem]:
+        """
+        Keep items with at least one tag from tag_filter.
+        Items are tagged in fetch() before filter() is called.
+        """
+        if not self.tag_filter:
+            return items
+        return [item for item in items if self.tag_filter.intersection(item.tags)]
+
     async def fetch(self, client: httpx.AsyncClient) -> Dict[str, Any]:
         """
         Fetch and parse RSS feed.
@@ -89,9 +114,16 @@ class FeedSource(ABC):
                     # Skip individual entry errors
                     continue
 
+            # Tag items with the shared keyword automaton (used for filtering and routing)
+            tag_items(items)
+
             # Apply filtering
             filtered_items = self.filter(items)
 
+            # Compress long item texts (after filtering, so filters see the full text)
+            if self.summary_char_budget:
+                compress_items(filtered_items, self.summary_char_budget)
+
             return {
                 "source_name": self.source_name,
                 "date": to_iso_utc(None),
@@ -30,6 +30,9 @@ class BundestagAktuelleThemenFeed(LLMFilterMixin, FeedSource):
         self.time_filter_days = 7  # Last week
         self.llm_filter_threshold = 1  # Allways activate LLM filter
 
+        # Compress long texts for agent prompts
+        self.summary_char_budget = 600
+
         # Relevance filtering criteria for parliamentary news
         self.filter_criteria = """
 **BEHALTEN - Verteidigung & Sicherheit:**
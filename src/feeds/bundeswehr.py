@@ -15,6 +15,10 @@ except ImportError:
 class BundeswehrFeed(FeedSource):
     """RSS feed source for Bundeswehr news."""
 
+    # Keep only items with escalation-relevant tags (skip ceremonies, sports, careers)
+    tag_filter = {"ukraine", "russia", "belarus", "baltics", "nato", "mobilization",
+                  "military_activity", "nuclear", "hybrid", "weapons", "civil_defense"}
+
     def __init__(self):
         super().__init__(
             source_name="Bundeswehr",
@@ -82,10 +86,8 @@ class BundeswehrFeed(FeedSource):
         )
 
     def filter(self, items: List[FeedItem]) -> List[FeedItem]:
-        """Filter items based on relevance criteria. Default: no filtering."""
-        # Default implementation: return all items
-        # Child classes can override for specific filtering logic
-        return items
+        """Filter items by escalation-relevant tags (see tag_filter)."""
+        return self.filter_by_tags(items)
 
 
 async def main():
@@ -2,15 +2,32 @@
 """LLM-based filtering mixin for feed sources."""
 from __future__ import annotations
 import datetime as dt
-from typing import List, Optional
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Optional, Tuple
 from pydantic import BaseModel, Field
 from agno.agent import Agent
 from agno.models.xai import xAI
 
 try:
     from .base import FeedItem
+    from .tokens import estimate_tokens
 except ImportError:
     from base import FeedItem
+    from tokens import estimate_tokens
+
+try:
+    from ..agents.pool import get_http_client
+    from ..agents.metrics import record_call
+    from ..agents.scheduler import run_agent, PRIORITY_FILTER
+except ImportError:
+    # Direct run from src/feeds: import the agents modules the way they import each other
+    # (as siblings; `agents` itself isn't importable as a top-level package, see agents/military.py)
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "agents"))
+    from pool import get_http_client
+    from metrics import record_call
+    from scheduler import run_agent, PRIORITY_FILTER
 
 
 class FilteredItemNumbers(BaseModel):
@@ -32,6 +49,10 @@ class LLMFilterMixin:
     - time_filter_days: int = Number of days for time-based pre-filtering
     - llm_filter_threshold: int = Min items to trigger LLM filtering
     - filter_criteria: str = Feed-specific filtering criteria (markdown)
+
+    Optional chunking configuration:
+    - llm_filter_chunk_tokens: int = Approx. token budget for the item list of one LLM call
+    - llm_filter_max_parallel: int = Max concurrent LLM calls per filter run
     """
 
     # Type hint for attribute from FeedSource (to satisfy type checkers)
@@ -40,6 +61,8 @@ class LLMFilterMixin:
     # Default values (can be overridden by child classes)
     time_filter_days: int = 1
     llm_filter_threshold: int = 30
+    llm_filter_chunk_tokens: int = 6000
+    llm_filter_max_parallel: int = 4
     filter_criteria: str = """
 **Keep items about:**
 - Military conflicts, operations, tensions
@@ -63,43 +86,78 @@ class LLMFilterMixin:
             temperature=0,
             search_parameters={
                 "mode": "off"  # Explicitly disable search
-            }
+            },
+            # Pooled sync client: chunks run in worker threads via Agent.run
+            http_client=get_http_client("xai", asynchronous=False)
         )
 
-    def _llm_filter(self, items: List[FeedItem]) -> List[FeedItem]:
+    def _filter_prompt_prefix(self) -> str:
+        """Static part of the filter prompt (identical for every call of this feed)."""
+        return f"""Filter the {self.source_name} items below for geopolitical escalation relevance.
+
+{self.filter_criteria}
+
+Return ONLY the numbers of relevant items as a JSON list.
+
+**Example output format:**
+{{
+  "numbers": [1, 3, 5, 7, 9, 12, 15, 18, 21, 24],
+  "reasoning": "Selected items focus on military tensions, diplomatic incidents, and geopolitical conflicts."
+}}
+"""
+
+    def _chunk_items(self, items: List[FeedItem]) -> List[Tuple[int, int]]:
         """
-        Apply LLM-based filtering to items.
+        Split items into contiguous chunks that fit the token budget.
 
         Args:
-            items: Pre-filtered items (usually time-filtered)
+            items: Items to split
 
         Returns:
-            Filtered list of relevant items
+            List of (start, end) index ranges (0-based, end exclusive)
         """
-        # If below threshold, return all items
-        if len(items) <= self.llm_filter_threshold:
-            return items
+        chunks: List[Tuple[int, int]] = []
+        start = 0
+        chunk_tokens = 0
 
-        try:
-            # Prepare numbered items for LLM (full text)
-            items_text = "\n\n".join([
-                f"[{i+1}] {item.text}"
-                for i, item in enumerate(items)
-            ])
+        for i, item in enumerate(items):
+            item_tokens = estimate_tokens(item.text)
+            # Start new chunk if budget exceeded (a single oversized item gets its own chunk)
+            if i > start and chunk_tokens + item_tokens > self.llm_filter_chunk_tokens:
+                chunks.append((start, i))
+                start = i
+                chunk_tokens = 0
+            chunk_tokens += item_tokens
 
-            prompt = f"""Filter these {len(items)} {self.source_name} items for geopolitical escalation relevance.
+        if start < len(items):
+            chunks.append((start, len(items)))
 
-{self.filter_criteria}
+        return chunks
 
-Return ONLY the numbers of relevant items as a JSON list.
+    def _filter_chunk(self, items: List[FeedItem], start: int, end: int, label: str) -> List[int]:
+        """
+        Run one LLM filter call for items[start:end].
 
-**Example output format:**
-{{
-  "numbers": [1, 3, 5, 7, 9, 12, 15, 18, 21, 24],
-  "reasoning": "Selected items focus on military tensions, diplomatic incidents, and geopolitical conflicts."
-}}
+        Args:
+            items: Full item list
+            start: First index of the chunk (0-based)
+            end: End index of the chunk (exclusive)
+            label: Chunk label for logging (e.g. "2/3")
+
+        Returns:
+            Selected global indices (0-based); all chunk indices on error
+        """
+        chunk = items[start:end]
+        try:
+            # Prepare numbered items for LLM (full text, numbering local to chunk)
+            items_text = "\n\n".join([
+                f"[{i+1}] {item.text}"
+                for i, item in enumerate(chunk)
+            ])
 
-Items:
+            # Static instructions first (cacheable prefix per feed), volatile items last
+            prompt = f"""{self._filter_prompt_prefix()}
+Items ({len(chunk)}):
 {items_text}"""
 
             agent = Agent(
@@ -110,24 +168,67 @@ Items:
                 structured_outputs=True
             )
 
-            response = agent.run(prompt)
+            # Rate-limited together with all other LLM calls (lowest priority)
+            response, queued = run_agent(agent, prompt, "xai", estimate_tokens(prompt), PRIORITY_FILTER)
+            record_call(f"filter:{self.source_name}:{label}", response, queued)
 
             # Extract content from RunOutput
             filtered_result = response.content
             if not filtered_result:
-                print(f"[{self.source_name} LLM Filter] No content in response, falling back to input items")
-                return items
+                print(f"[{self.source_name} LLM Filter {label}] No content in response, keeping chunk items")
+                return list(range(start, end))
 
-            # Get selected items by numbers (convert 1-based to 0-based index)
-            filtered = [
-                items[num - 1]
+            # Map chunk-local numbers (1-based) to global indices (0-based)
+            selected = sorted({
+                start + num - 1
                 for num in filtered_result.numbers
-                if 1 <= num <= len(items)
-            ]
+                if 1 <= num <= len(chunk)
+            })
 
-            print(f"[{self.source_name} LLM Filter] {len(items)} → {len(filtered)} items")
-            print(f"[{self.source_name} LLM Filter] Selected numbers: {filtered_result.numbers[:10]}{'...' if len(filtered_result.numbers) > 10 else ''}")
-            print(f"[{self.source_name} LLM Filter] Reasoning: {filtered_result.reasoning}")
+            print(f"[{self.source_name} LLM Filter {label}] {len(chunk)} → {len(selected)} items")
+            print(f"[{self.source_name} LLM Filter {label}] Reasoning: {filtered_result.reasoning}")
+            return selected
+
+        except Exception as e:
+            print(f"[{self.source_name} LLM Filter {label}] Error: {e}, keeping chunk items")
+            return list(range(start, end))
+
+    def _llm_filter(self, items: List[FeedItem]) -> List[FeedItem]:
+        """
+        Apply LLM-based filtering to items.
+
+        Large item lists are split into token-bounded chunks which are filtered
+        concurrently (bounded by llm_filter_max_parallel) and merged back in
+        original order.
+
+        Args:
+            items: Pre-filtered items (usually time-filtered)
+
+        Returns:
+            Filtered list of relevant items
+        """
+        # If below threshold, return all items
+        if len(items) <= self.llm_filter_threshold:
+            return items
+
+        try:
+            chunks = self._chunk_items(items)
+            labels = [f"{i+1}/{len(chunks)}" for i in range(len(chunks))]
+
+            if len(chunks) == 1:
+                selected_per_chunk = [self._filter_chunk(items, *chunks[0], labels[0])]
+            else:
+                max_workers = max(1, min(self.llm_filter_max_parallel, len(chunks)))
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    selected_per_chunk = list(executor.map(
+                        lambda args: self._filter_chunk(items, *args),
+                        [(start, end, label) for (start, end), label in zip(chunks, labels)]
+                    ))
+
+            # Merge chunk results (chunks are contiguous, so order is preserved)
+            filtered = [items[i] for selected in selected_per_chunk for i in selected]
+
+            print(f"[{self.source_name} LLM Filter] {len(items)} → {len(filtered)} items ({len(chunks)} chunk(s))")
             return filtered
 
         except Exception as e:
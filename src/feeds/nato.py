@@ -13,6 +13,10 @@ except ImportError:
 class NatoFeed(FeedSource):
     """RSS feed source for NATO Latest News."""
 
+    # Keep only items with escalation-relevant tags
+    tag_filter = {"ukraine", "russia", "belarus", "baltics", "nato", "mobilization",
+                  "military_activity", "nuclear", "hybrid", "weapons", "diplomacy"}
+
     def __init__(self):
         super().__init__(
             source_name="NATO",
@@ -89,10 +93,8 @@ class NatoFeed(FeedSource):
         )
 
     def filter(self, items: List[FeedItem]) -> List[FeedItem]:
-        """Filter items based on relevance criteria. Default: no filtering."""
-        # Default implementation: return all items
-        # Child classes can override for specific filtering logic
-        return items
+        """Filter items by escalation-relevant tags (see tag_filter)."""
+        return self.filter_by_tags(items)
 
 
 async def main():
@@ -14,6 +14,9 @@ except ImportError:
 class RBCPoliticsFeed(FeedSource):
     """RSS feed source for RBC News - Politics category only."""
 
+    # Full article texts are compressed for agent prompts
+    summary_char_budget = 800
+
     def __init__(self):
         super().__init__(
             source_name="RBC Politics",
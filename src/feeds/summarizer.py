@@ -0,0 +1,101 @@
+# src/feeds/summarizer.py
+"""Local extractive compression of long item texts (no LLM)."""
+from __future__ import annotations
+import re
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+try:
+    from .tfidf import tokenize, compute_idf
+except ImportError:
+    from tfidf import tokenize, compute_idf
+
+if TYPE_CHECKING:
+    from .base import FeedItem
+
+# Sentence boundary: end punctuation followed by an upper-case letter, digit or quote
+_SENTENCE_SPLIT = re.compile(r"(?<=[.!?…])\s+(?=[A-ZÄÖÜА-ЯЁ0-9«\"„])")
+
+
+def split_sentences(text: str) -> List[str]:
+    """Split text into sentences (heuristic, DE/EN/RU)."""
+    return [s.strip() for s in _SENTENCE_SPLIT.split(text) if s.strip()]
+
+
+def truncate_text(text: str, char_budget: int) -> str:
+    """Cut text at a word boundary within char_budget and append an ellipsis."""
+    if len(text) <= char_budget:
+        return text
+    cut = text[:max(1, char_budget - 1)]
+    if " " in cut:
+        cut = cut.rsplit(" ", 1)[0]
+    return cut.rstrip(" ,;:") + "…"
+
+
+def summarize_text(text: str, char_budget: int, idf: Optional[Dict[str, float]] = None) -> str:
+    """
+    Compress text to char_budget by selecting its most informative sentences.
+
+    The first sentence (usually the title) is always kept. Remaining sentences
+    are scored by mean TF-IDF weight with a bonus for early position (lead bias
+    of news texts) and added greedily; the output keeps the original order.
+
+    Args:
+        text: Item text
+        char_budget: Max characters of the result
+        idf: Optional idf table (e.g. computed over all items of a feed)
+
+    Returns:
+        Compressed text (unchanged if already within budget)
+    """
+    if len(text) <= char_budget:
+        return text
+
+    sentences = split_sentences(text)
+    if len(sentences) <= 1:
+        return truncate_text(text, char_budget)
+
+    idf = idf or {}
+    scores = {}
+    for position, sentence in enumerate(sentences[1:], start=1):
+        tokens = tokenize(sentence)
+        if not tokens:
+            continue
+        weight = sum(idf.get(token, 1.0) for token in set(tokens)) / len(set(tokens))
+        scores[position] = weight * (1.0 + 1.0 / position)
+
+    lead = truncate_text(sentences[0], char_budget)
+    selected = [0]
+    length = len(lead)
+
+    for position in sorted(scores, key=scores.get, reverse=True):
+        sentence_length = len(sentences[position]) + 1
+        if length + sentence_length <= char_budget:
+            selected.append(position)
+            length += sentence_length
+
+    selected.sort()
+    return " ".join([lead] + [sentences[i] for i in selected[1:]])
+
+
+def compress_items(items: List[FeedItem], char_budget: int) -> List[FeedItem]:
+    """
+    Compress item texts in place; the full text is kept in item.original_text.
+
+    Args:
+        items: Feed items
+        char_budget: Max characters per item text
+
+    Returns:
+        The same items (for chaining)
+    """
+    long_items = [item for item in items if len(item.text) > char_budget]
+    if not long_items:
+        return items
+
+    idf = compute_idf(tokenize(item.text) for item in items)
+    for item in long_items:
+        if item.original_text is None:
+            item.original_text = item.text
+        item.text = summarize_text(item.original_text, char_budget, idf)
+
+    return items
@@ -30,6 +30,9 @@ class TagesschauAuslandFeed(LLMFilterMixin, FeedSource):
         self.time_filter_days = 7  # Last week
         self.llm_filter_threshold = 15  # Activate LLM filter at 15+ items
 
+        # Compress long descriptions for agent prompts
+        self.summary_char_budget = 500
+
         # Geographic and thematic filtering criteria
         self.filter_criteria = """
 **BEHALTEN - Geografische Hotspots:**
@@ -0,0 +1,238 @@
+# src/feeds/tagging.py
+"""Multilingual keyword tagging of feed items with a single Aho-Corasick automaton."""
+from __future__ import annotations
+from collections import deque
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Set, Tuple
+
+if TYPE_CHECKING:
+    from .base import FeedItem
+
+# Tag -> terms (DE/EN/RU). Terms match at word start, so stems like "украин"
+# cover all inflections. Terms ending with "$" and terms shorter than
+# MIN_PREFIX_TERM_LENGTH must match the whole word (e.g. "EU" must not match "Euro").
+DEFAULT_LEXICON: Dict[str, List[str]] = {
+    "ukraine": ["ukrain", "kyiv", "kiew", "kiev", "donbas", "donezk", "donetsk", "charkiw", "kharkiv",
+                "saporischschja", "zaporizh", "krim$", "crimea", "украин", "киев", "донбасс", "донецк", "крым", "харьков", "запорож"],
+    "russia": ["russland", "russisch", "russia", "kreml", "kremlin", "moskau", "moscow", "putin",
+               "росси", "российск", "кремл", "москв", "путин"],
+    "belarus": ["belarus", "weißrussland", "minsk", "lukaschenko", "lukashenko", "беларус", "белорус", "минск", "лукашенко"],
+    "baltics": ["baltikum", "baltic", "baltisch", "estland", "estonia", "lettland", "latvia", "litauen", "lithuania",
+                "kaliningrad", "suwałki", "suwalki", "прибалтик", "балтийск", "эстони", "латви", "литв", "калининград"],
+    "nato": ["nato", "otan", "нато", "allianz", "alliance", "article 5", "artikel 5", "article 4", "artikel 4", "ostflanke", "eastern flank"],
+    "mobilization": ["mobilmachung", "mobilisierung", "mobilization", "mobilisation", "reservist", "wehrpflicht",
+                     "wehrdienst", "conscription", "мобилизац", "призыв", "резервист"],
+    # Exercises only as compounds/phrases: a bare "Übung"/"exercise" is mostly not military,
+    # and the stem "учени" would also match "ученик" (pupil)
+    "military_activity": ["manöver", "militärübung", "großübung", "truppenübung", "nato-übung", "military exercise",
+                          "joint exercise", "naval exercise", "military drills", "truppen", "troops", "brigade",
+                          "bataillon", "battalion", "kampfjet", "fighter jet", "luftraum", "airspace", "drohne", "drone",
+                          "rakete", "missile", "учения$", "учений$", "учениях$", "учениями$", "войск", "истребител",
+                          "воздушное пространство", "беспилотник", "дрон", "ракет"],
+    "nuclear": ["nuklear", "atomwaff", "nuclear", "iskander", "oreschnik", "oreshnik", "ядерн", "искандер", "орешник"],
+    "sanctions": ["sanktion", "sanction", "embargo", "exportkontroll", "export control", "price cap", "preisdeckel",
+                  "санкци", "эмбарго"],
+    "hybrid": ["sabotage", "hybrid", "cyber", "desinformation", "disinformation", "spionage", "espionage", "unterseekabel",
+               "undersea cable", "саботаж", "диверси", "кибер", "шпион"],
+    "diplomacy": ["botschaft", "embassy", "botschafter", "ambassador", "diplomat", "ausweisung", "expel", "verhandlung",
+                  "negotiation", "ceasefire", "waffenstillstand", "gipfel", "summit",
+                  "посол", "дипломат", "переговор", "перемири", "саммит"],
+    # Crossings and visas only in border context (not street crossings or Visa cards)
+    "border": ["grenze", "grenzkontroll", "border", "grenzschließung", "grenzübergang", "crossing point", "frontex",
+               "migration", "flüchtling", "refugee", "visumpflicht", "visaverbot", "einreiseverbot", "visa ban",
+               "visa regime", "entry ban", "граница", "границ", "погранич", "визов", "запрет на въезд", "беженц"],
+    "weapons": ["waffenliefer", "arms deliver", "taurus", "patriot", "leopard", "haubitze", "howitzer", "munition",
+                "ammunition", "rüstung", "defence industry", "defense industry", "оружи", "поставки вооружений", "боеприпас"],
+    "civil_defense": ["zivilschutz", "bevölkerungsschutz", "bunker", "schutzraum", "civil defence", "civil defense",
+                      "warntag", "sirene", "katastrophenschutz", "гражданская оборона", "убежищ"],
+    # Gas and oil only as compounds/phrases ("Gas geben", "Speiseöl" are not energy supply)
+    "energy": ["erdgas", "gasliefer", "gaspreis", "gasspeicher", "gasversorgung", "natural gas", "gas supply",
+               "gas supplies", "gas price", "erdöl", "rohöl", "ölpreis", "öllieferung", "crude oil", "oil price",
+               "oil export", "schattenflotte", "shadow fleet", "pipeline", "nord stream", "gazprom", "lng", "energie",
+               "energy", "газпром", "газопровод", "природный газ", "нефт", "трубопровод", "теневой флот"],
+    "eu": ["eu", "ес", "europäische union", "european union", "евросоюз"],
+}
+
+# Named entity -> terms (DE/EN/RU), same matching rules as DEFAULT_LEXICON. Unlike the
+# topic tags, shared entities identify one event across languages (story clustering).
+# Names that occur in almost every item (Russland, Ukraine, NATO, ...) are left out.
+ENTITY_LEXICON: Dict[str, List[str]] = {
+    # People
+    "putin": ["putin", "путин"],
+    "zelensky": ["selenskyj", "zelensky", "zelenskyy", "зеленск"],
+    "lukashenko": ["lukaschenko", "lukashenko", "лукашенко"],
+    "lavrov": ["lawrow", "lavrov", "лавров"],
+    "peskov": ["peskow", "peskov", "песков"],
+    "pistorius": ["pistorius", "писториус"],
+    "merz": ["merz$", "мерц"],
+    "rutte": ["rutte", "рютте"],
+    "tusk": ["tusk$", "туск"],
+    "trump": ["trump", "трамп"],
+    "macron": ["macron", "макрон"],
+    # Places
+    "kaliningrad": ["kaliningrad", "калининград"],
+    "suwalki": ["suwałki", "suwalki", "сувалк"],
+    "narva": ["narva", "нарва", "нарве", "нарвы", "нарву"],
+    "kyiv": ["kyiv", "kiew", "kiev", "киев"],
+    "kharkiv": ["charkiw", "kharkiv", "харьков"],
+    "zaporizhzhia": ["saporischschja", "zaporizh", "запорож"],
+    "odesa": ["odessa", "odesa", "одесс"],
+    "donetsk": ["donezk", "donetsk", "донецк"],
+    "crimea": ["krim$", "crimea", "крым"],
+    "kursk": ["kursk", "курск"],
+    "belgorod": ["belgorod", "белгород"],
+    "minsk": ["minsk", "минск"],
+    "warsaw": ["warschau", "warsaw", "варшав"],
+    "vilnius": ["vilnius", "wilna", "вильнюс"],
+    "riga": ["riga$", "рига$", "риге$"],
+    "tallinn": ["tallinn", "таллин"],
+    "helsinki": ["helsinki", "хельсинки"],
+    "estonia": ["estland", "estonia", "estnisch", "эстони"],
+    "latvia": ["lettland", "latvia", "lettisch", "латви"],
+    "lithuania": ["litauen", "lithuania", "litauisch", "литв"],
+    "poland": ["polen$", "poland", "polish", "polnisch", "польш", "польск"],
+    "finland": ["finnland", "finland", "finnisch", "finnish", "финлянд"],
+    "baltic_sea": ["ostsee", "baltic sea", "балтийское море", "балтийском море"],
+    # Weapon systems
+    "taurus": ["taurus", "таурус"],
+    "patriot": ["patriot$", "пэтриот"],
+    "iskander": ["iskander", "искандер"],
+    "oreshnik": ["oreschnik", "oreshnik", "орешник"],
+    "leopard": ["leopard", "леопард"],
+    "f16": ["f-16", "ф-16"],
+    "atacms": ["atacms"],
+    "storm_shadow": ["storm shadow"],
+    "shahed": ["shahed", "шахед"],
+    # Infrastructure and organisations
+    "nord_stream": ["nord stream", "северный поток", "северного потока"],
+    "frontex": ["frontex", "фронтекс"],
+    "iaea": ["iaea", "iaeo", "магатэ"],
+    "osce": ["osze", "osce", "обсе"],
+    "wagner": ["wagner", "вагнер"],
+}
+
+# Shorter terms only match whole words
+MIN_PREFIX_TERM_LENGTH = 4
+
+
+class KeywordAutomaton:
+    """
+    Aho-Corasick automaton over a tag lexicon.
+
+    Building is linear in the total lexicon size; tagging a text is a single
+    pass over its characters (plus the number of matches), independent of the
+    number of terms.
+    """
+
+    def __init__(self, lexicon: Dict[str, Iterable[str]]):
+        # State 0 is the root; each state has goto transitions, a fail link and outputs
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._outputs: List[List[Tuple[str, int, bool]]] = [[]]  # (tag, term length, whole word)
+
+        for tag, terms in lexicon.items():
+            for term in terms:
+                whole_word = term.endswith("$")
+                term = term.rstrip("$").casefold()
+                self._add_term(term, tag, whole_word or len(term) < MIN_PREFIX_TERM_LENGTH)
+        self._build_fail_links()
+
+    def _add_term(self, term: str, tag: str, whole_word: bool) -> None:
+        state = 0
+        for char in term:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._outputs.append([])
+                self._goto[state][char] = next_state
+            state = next_state
+        self._outputs[state].append((tag, len(term), whole_word))
+
+    def _build_fail_links(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(char, 0)
+                if self._fail[next_state] == next_state:
+                    self._fail[next_state] = 0
+                # Inherit outputs of the fail state (suffix matches)
+                self._outputs[next_state] = self._outputs[next_state] + self._outputs[self._fail[next_state]]
+
+    def find_tags(self, text: str) -> Set[str]:
+        """
+        Return all tags whose terms occur in text (case-insensitive, word start).
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Set of matched tags
+        """
+        text = text.casefold()
+        tags: Set[str] = set()
+        state = 0
+
+        for i, char in enumerate(text):
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+
+            for tag, length, whole_word in self._outputs[state]:
+                if tag in tags:
+                    continue
+                start = i - length + 1
+                if start > 0 and text[start - 1].isalnum():
+                    continue  # Not at word start
+                if whole_word and i + 1 < len(text) and text[i + 1].isalnum():
+                    continue  # Whole-word term inside a longer word
+                tags.add(tag)
+
+        return tags
+
+
+_default_automaton: Optional[KeywordAutomaton] = None
+_entity_automaton: Optional[KeywordAutomaton] = None
+
+
+def get_default_automaton() -> KeywordAutomaton:
+    """Return the shared automaton for DEFAULT_LEXICON (built once per process)."""
+    global _default_automaton
+    if _default_automaton is None:
+        _default_automaton = KeywordAutomaton(DEFAULT_LEXICON)
+    return _default_automaton
+
+
+def get_entity_automaton() -> KeywordAutomaton:
+    """Return the shared automaton for ENTITY_LEXICON (built once per process)."""
+    global _entity_automaton
+    if _entity_automaton is None:
+        _entity_automaton = KeywordAutomaton(ENTITY_LEXICON)
+    return _entity_automaton
+
+
+def find_entities(text: str) -> Set[str]:
+    """Return the ENTITY_LEXICON entities mentioned in text (language independent)."""
+    return get_entity_automaton().find_tags(text)
+
+
+def tag_items(items: List[FeedItem], automaton: Optional[KeywordAutomaton] = None) -> List[FeedItem]:
+    """
+    Attach sorted tags to items in place (one pass per item).
+
+    Args:
+        items: Feed items
+        automaton: Automaton to use (default: shared DEFAULT_LEXICON automaton)
+
+    Returns:
+        The same items (for chaining)
+    """
+    automaton = automaton or get_default_automaton()
+    for item in items:
+        item.tags = sorted(automaton.find_tags(item.text))
+    return items
@@ -0,0 +1,66 @@
+# src/feeds/tfidf.py
+"""Minimal TF-IDF helpers (sparse dict vectors) for DE/EN/RU feed text."""
+from __future__ import annotations
+import math
+import re
+from collections import Counter
+from typing import Dict, Iterable, List
+
+_WORD_PATTERN = re.compile(r"[^\W\d_]{2,}", re.UNICODE)
+
+STOPWORDS = frozenset("""
+der die das den dem des ein eine einer eines einem einen und oder aber auch als an auf aus bei bis durch
+für gegen hat haben hatte ist sind war waren wird werden wurde wurden im in ins mit nach nicht noch nur
+ob sich sie er es wir ihr ihre sein seine so um unter vom von vor zu zum zur über dass wie was wenn
+the a an and or but of to in on at for from by with as is are was were be been has have had it its
+this that these those not no will would can could said says he she they their which who
+и в во не на что с со как а то по к из за от для о об у же ли бы это был была были его ее их
+он она они мы вы при до после также уже который которые которая
+""".split())
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens without stopwords."""
+    return [
+        word for word in (m.group().lower() for m in _WORD_PATTERN.finditer(text))
+        if word not in STOPWORDS
+    ]
+
+
+def compute_idf(documents: Iterable[List[str]]) -> Dict[str, float]:
+    """
+    Compute smoothed inverse document frequencies.
+
+    Args:
+        documents: Tokenized documents
+
+    Returns:
+        Dict mapping term to idf = log((1 + N) / (1 + df)) + 1
+    """
+    doc_freq: Counter = Counter()
+    doc_count = 0
+    for tokens in documents:
+        doc_count += 1
+        doc_freq.update(set(tokens))
+
+    return {
+        term: math.log((1 + doc_count) / (1 + df)) + 1.0
+        for term, df in doc_freq.items()
+    }
+
+
+def tfidf_vector(tokens: List[str], idf: Dict[str, float]) -> Dict[str, float]:
+    """L2-normalized sparse TF-IDF vector (unknown terms get idf 1.0)."""
+    counts = Counter(tokens)
+    vector = {term: count * idf.get(term, 1.0) for term, count in counts.items()}
+    norm = math.sqrt(sum(w * w for w in vector.values()))
+    if norm == 0:
+        return {}
+    return {term: w / norm for term, w in vector.items()}
+
+
+def cosine_similarity(a: Dict[str, float], b: Dict[str, float]) -> float:
+    """Dot product of two L2-normalized sparse vectors."""
+    if len(a) > len(b):
+        a, b = b, a
+    return sum(w * b.get(term, 0.0) for term, w in a.items())
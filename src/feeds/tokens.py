@@ -0,0 +1,41 @@
+# src/feeds/tokens.py
+"""Local token count approximation for DE/EN/RU feed text."""
+from __future__ import annotations
+import math
+import re
+
+# Words, numbers and single punctuation marks (roughly how BPE tokenizers split text)
+_PIECE_PATTERN = re.compile(r"[^\W\d_]+|\d+|[^\w\s]", re.UNICODE)
+_CYRILLIC_PATTERN = re.compile(r"[Ѐ-ӿ]")
+
+# Average characters per token (Cyrillic is tokenized less efficiently than Latin script)
+CHARS_PER_TOKEN_LATIN = 4.0
+CHARS_PER_TOKEN_CYRILLIC = 2.5
+CHARS_PER_TOKEN_DIGITS = 3.0
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the number of LLM tokens for a text without a remote tokenizer.
+
+    Args:
+        text: Text in German, English or Russian (mixed is fine)
+
+    Returns:
+        Approximate token count
+    """
+    if not text:
+        return 0
+
+    tokens = 0
+    for match in _PIECE_PATTERN.finditer(text):
+        piece = match.group()
+        if piece[0].isdigit():
+            tokens += math.ceil(len(piece) / CHARS_PER_TOKEN_DIGITS)
+        elif piece[0].isalpha():
+            chars_per_token = CHARS_PER_TOKEN_CYRILLIC if _CYRILLIC_PATTERN.match(piece) else CHARS_PER_TOKEN_LATIN
+            tokens += math.ceil(len(piece) / chars_per_token)
+        else:
+            tokens += 1
+
+    return tokens
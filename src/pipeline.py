@@ -1,23 +1,57 @@
 # src/pipeline.py
 import asyncio
-from typing import List, Dict, Any
+import os
+from datetime import datetime, timezone
+from typing import List, Dict, Any, Optional, Tuple
 import httpx
 
 try:
     from .feeds import BundeswehrFeed, BMVgFeed, NatoFeed, AuswaertigesAmtFeed, AftershockFeed, RussianEmbassyFeed, RBCPoliticsFeed, JungeWeltFeed, FrontexFeed, KommersantFeed, RajaFeed, TagesschauAuslandFeed, TagesschauInlandFeed, TagesschauWirtschaftFeed, BundestagAktuelleThemenFeed, IRUFeed
     from .feeds.base import FeedSource, to_iso_utc
-    from .scoring3 import calculate_escalation_score
-    from .storage import save_escalation_report, save_feed_markdown
+    from .scoring3 import calculate_escalation_score, previous_dimension_results, previous_hedge_latencies
+    from .storage import save_escalation_report_async, save_feed_markdown_async, save_dashboard_snapshot_async, get_latest_report, get_report_by_date
+    from .dashboard import build_dashboard_snapshot
+    from .change_detection import CHANGE_DETECTION_ENABLED, CHANGE_MAX_AGE_DAYS, assessment_age_days, compute_fingerprints, detect_changes, filter_new_items, get_previous_fingerprints
+    from .token_budget import AGENT_TOKEN_BUDGETS, AGENT_RELEVANT_TAGS, FEED_OVERHEAD_TOKENS, apply_token_budget, estimate_feed_tokens, tag_relevance
+    from .feeds.tokens import estimate_tokens
+    from .story_clustering import Story, cluster_stories
+    from .feeds.summarizer import split_sentences, truncate_text
+    from .agents.metrics import drain_call_log
+    from .agents.pool import aclose_async_clients
+    from .run_status import RunTracker
 except ImportError:
     # For direct execution
     from feeds import BundeswehrFeed, BMVgFeed, NatoFeed, AuswaertigesAmtFeed, AftershockFeed, RussianEmbassyFeed, RBCPoliticsFeed, JungeWeltFeed, FrontexFeed, KommersantFeed, RajaFeed, TagesschauAuslandFeed, TagesschauInlandFeed, TagesschauWirtschaftFeed, BundestagAktuelleThemenFeed, IRUFeed
     from feeds.base import FeedSource, to_iso_utc
-    from scoring3 import calculate_escalation_score
-    from storage import save_escalation_report, save_feed_markdown
-
-
-def format_feed_results_as_markdown(results: List[Dict[str, Any]]) -> str:
-    """Format feed processing results as Markdown."""
+    from scoring3 import calculate_escalation_score, previous_dimension_results, previous_hedge_latencies
+    from storage import save_escalation_report_async, save_feed_markdown_async, save_dashboard_snapshot_async, get_latest_report, get_report_by_date
+    from dashboard import build_dashboard_snapshot
+    from change_detection import CHANGE_DETECTION_ENABLED, CHANGE_MAX_AGE_DAYS, assessment_age_days, compute_fingerprints, detect_changes, filter_new_items, get_previous_fingerprints
+    from token_budget import AGENT_TOKEN_BUDGETS, AGENT_RELEVANT_TAGS, FEED_OVERHEAD_TOKENS, apply_token_budget, estimate_feed_tokens, tag_relevance
+    from feeds.tokens import estimate_tokens
+    from story_clustering import Story, cluster_stories
+    from feeds.summarizer import split_sentences, truncate_text
+    from agents.metrics import drain_call_log
+    from agents.pool import aclose_async_clients
+    from run_status import RunTracker
+
+# Agents read a story digest (clustered across feeds and languages, see story_clustering.py)
+# instead of the feed-grouped list; STORY_DIGEST=0 restores the feed-grouped list
+STORY_DIGEST_ENABLED = os.getenv("STORY_DIGEST", "1") == "1"
+
+# "full": dimension agents assess from scratch; "incremental": they update the previous
+# assessment from the items that are new since the previous run
+SCORING_MODE = os.getenv("SCORING_MODE", "full")
+
+
+def format_feed_results_as_markdown(results: List[Dict[str, Any]], use_original_text: bool = False) -> str:
+    """
+    Format feed processing results as Markdown.
+
+    Args:
+        results: Feed results from process_all_feeds()
+        use_original_text: Use the full item text instead of the compressed one (archive)
+    """
     markdown_lines = ["# Feed Processing Results\n"]
 
     successful_feeds = [r for r in results if r["result"] == "ok"]
@@ -43,13 +77,21 @@ def format_feed_results_as_markdown(results: List[Dict[str, Any]]) -> str:
                 for i, item in enumerate(items):  # Show all items
                     # Convert datetime to readable format for markdown
                     date_str = item.date.strftime("%Y-%m-%d %H:%M UTC")
-                    text = item.text
+                    text = (item.original_text or item.text) if use_original_text else item.text
 
                     markdown_lines.append(f"{i+1}. **{date_str}** - {text}")
 
             markdown_lines.append("")  # Empty line between feeds
 
     # Failed feeds
+    markdown_lines.extend(_format_failed_feeds(failed_feeds))
+
+    return "\n".join(markdown_lines)
+
+
+def _format_failed_feeds(failed_feeds: List[Dict[str, Any]]) -> List[str]:
+    """Format the failed feeds section as Markdown lines."""
+    markdown_lines = []
     if failed_feeds:
         markdown_lines.append("## Failed Feeds\n")
 
@@ -62,9 +104,160 @@ def format_feed_results_as_markdown(results: List[Dict[str, Any]]) -> str:
             markdown_lines.append(f"- **Error:** {error_message}")
             markdown_lines.append(f"- **Timestamp:** {feed_result['date']}\n")
 
+    return markdown_lines
+
+
+def _format_story(number: int, story: Story) -> List[str]:
+    """Markdown lines of one story block (lead item in full, headlines of the others)."""
+    lead_source, lead_item = story.lead
+    sources = story.sources
+
+    lines = [f"### Story {number} ({len(sources)} source{'s' if len(sources) > 1 else ''}: {', '.join(sources)})"]
+    lines.append(f"- **{lead_item.date.strftime('%Y-%m-%d %H:%M UTC')} | {lead_source}:** {lead_item.text}")
+
+    for j, (source_name, item) in enumerate(story.items):
+        if j == story.lead_index:
+            continue
+        sentences = split_sentences(item.text)
+        headline = truncate_text(sentences[0] if sentences else item.text, 200)
+        lines.append(f"  - Also: **{item.date.strftime('%Y-%m-%d %H:%M UTC')} | {source_name}:** {headline}")
+
+    lines.append("")  # Empty line between stories
+    return lines
+
+
+def apply_story_budget(
+    results: List[Dict[str, Any]],
+    stories: List[Story],
+    budget: int,
+    relevance=None,
+) -> Tuple[List[Story], Dict[str, Any]]:
+    """
+    Trim stories so the rendered story digest fits into a token budget.
+
+    Stories are ranked by the relevance of their most relevant item (if given),
+    then by number of sources and recency; each story is costed as the block
+    format_story_digest_as_markdown() emits for it.
+
+    Args:
+        results: Feed results from process_all_feeds()
+        stories: Stories from cluster_stories()
+        budget: Max approx. tokens for the digest
+        relevance: Optional item relevance function (higher = more relevant)
+
+    Returns:
+        Tuple of (kept stories in original order, trimming report like apply_token_budget())
+    """
+    failed_feeds = [r for r in results if r["result"] == "error"]
+    used_tokens = FEED_OVERHEAD_TOKENS + estimate_tokens("\n".join(_format_failed_feeds(failed_feeds)))
+    story_tokens = [estimate_tokens("\n".join(_format_story(i + 1, story))) for i, story in enumerate(stories)]
+    tokens_before = used_tokens + sum(story_tokens)
+
+    ranked = sorted(range(len(stories)), key=lambda i: (
+        -(max(relevance(item) for _, item in stories[i].items) if relevance else 0.0),
+        i,  # cluster_stories() order: most sources, newest
+    ))
+
+    kept = set()
+    for i in ranked:
+        if used_tokens + story_tokens[i] <= budget:
+            kept.add(i)
+            used_tokens += story_tokens[i]
+
+    dropped = {}
+    for i, story in enumerate(stories):
+        if i in kept:
+            continue
+        for source_name, item in story.items:
+            entry = dropped.setdefault(source_name, {"count": 0, "urls": []})
+            entry["count"] += 1
+            entry["urls"].append(item.url)
+
+    report = {
+        "budget": budget,
+        "tokens_before": tokens_before,
+        "tokens_after": used_tokens,
+        "items_before": sum(len(story.items) for story in stories),
+        "items_after": sum(len(stories[i].items) for i in kept),
+        "dropped": dropped,
+    }
+    return [story for i, story in enumerate(stories) if i in kept], report
+
+
+def format_story_digest_as_markdown(results: List[Dict[str, Any]], stories: List[Story]) -> str:
+    """
+    Format clustered stories as Markdown: one block per story with the most
+    informative text and the headlines of all supporting sources.
+
+    Args:
+        results: Feed results from process_all_feeds() (for the summary and failed feeds)
+        stories: Stories from cluster_stories()
+    """
+    successful_feeds = [r for r in results if r["result"] == "ok"]
+    failed_feeds = [r for r in results if r["result"] == "error"]
+    item_count = sum(len(story.items) for story in stories)
+
+    markdown_lines = ["# Feed Story Digest\n"]
+    markdown_lines.append(
+        f"**Summary:** {len(stories)} stories from {item_count} items, "
+        f"{len(successful_feeds)} successful feeds, {len(failed_feeds)} failed\n"
+    )
+
+    if stories:
+        markdown_lines.append("## Stories\n")
+
+        for i, story in enumerate(stories):
+            markdown_lines.extend(_format_story(i + 1, story))
+
+    # Failed feeds
+    markdown_lines.extend(_format_failed_feeds(failed_feeds))
+
     return "\n".join(markdown_lines)
 
 
+def build_agent_markdown(results: List[Dict[str, Any]]) -> Tuple[Dict[str, str], Dict[str, Any]]:
+    """
+    Build the feed markdown for each agent within its token budget.
+
+    Args:
+        results: Feed results from process_all_feeds()
+
+    Returns:
+        Tuple of (markdown per agent name, token budget report for run metadata)
+    """
+    markdown_by_agent = {}
+    trimming = {}
+    markdown_cache = {}  # Agents with equal budget and routing tags share the same markdown
+    stories = cluster_stories(results) if STORY_DIGEST_ENABLED else None
+
+    for agent_name, budget in AGENT_TOKEN_BUDGETS.items():
+        relevant_tags = AGENT_RELEVANT_TAGS.get(agent_name, frozenset())
+        cache_key = (budget, relevant_tags)
+        if cache_key not in markdown_cache:
+            if STORY_DIGEST_ENABLED:
+                # Budget the digest as emitted (story blocks), not the feed-grouped format
+                kept_stories, report = apply_story_budget(results, stories, budget, relevance=tag_relevance(relevant_tags))
+                markdown = format_story_digest_as_markdown(results, kept_stories)
+            else:
+                trimmed_results, report = apply_token_budget(results, budget, relevance=tag_relevance(relevant_tags))
+                markdown = format_feed_results_as_markdown(trimmed_results)
+            markdown_cache[cache_key] = (markdown, report)
+
+        markdown_by_agent[agent_name], trimming[agent_name] = markdown_cache[cache_key]
+
+        report = trimming[agent_name]
+        if report["dropped"]:
+            print(f"[Token Budget] {agent_name}: {report['items_before']} → {report['items_after']} items "
+                  f"(~{report['tokens_before']} → ~{report['tokens_after']} tokens, budget {budget})")
+
+    budget_report = {
+        "feeds": estimate_feed_tokens(results),
+        "agents": trimming,
+    }
+
+    return markdown_by_agent, budget_report
+
+
 CONCURRENCY_LIMIT = 2  # maximal gleichzeitige Feed-Requests
 
 
@@ -118,43 +311,188 @@ async def process_all_feeds() -> List[Dict[str, Any]]:
     return processed_results
 
 
-async def run_daily_pipeline():
-    """Run the daily pipeline and return escalation scoring results."""
+def detect_quiet_day(
+    results: List[Dict[str, Any]],
+    previous_report: Optional[Dict[str, Any]],
+) -> Tuple[Optional[Dict[str, Any]], Dict[str, Dict[str, Any]]]:
+    """
+    Decide which dimension results of the previous run can be reused.
+
+    Args:
+        results: Feed results from process_all_feeds()
+        previous_report: Most recent stored report (None if there is none)
+
+    Returns:
+        Tuple of (change report or None if disabled, dimension results to reuse by agent name)
+    """
+    if not CHANGE_DETECTION_ENABLED:
+        return None, {}
+
+    change_report = detect_changes(results, previous_report)
+    if not change_report["fast_path"]:
+        print(f"[Change Detection] Full run: {change_report['full_run_reason']}")
+        return change_report, {}
+
+    # Reused scores carry their original assessment date; rescore once that is too old
+    previous_results = previous_dimension_results(previous_report)
+    expired = sorted(
+        name for name, result in previous_results.items()
+        if assessment_age_days(result["assessed_date"]) > CHANGE_MAX_AGE_DAYS
+    )
+    reuse_dimensions = {
+        name: result
+        for name, result in previous_results.items()
+        if name not in change_report["affected_agents"] and name not in expired
+    }
+    change_report["expired_agents"] = expired
+    change_report["reused_agents"] = sorted(reuse_dimensions)
+    rerun_agents = [name for name in change_report["agent_novelty"] if name not in reuse_dimensions]
+    print(f"[Change Detection] Fast path: {change_report['new_items']}/{change_report['items']} new items "
+          f"(novelty {change_report['novelty']:.2f}), re-running {', '.join(rerun_agents) or 'review only'}")
+    return change_report, reuse_dimensions
+
+
+def build_incremental_inputs(
+    results: List[Dict[str, Any]],
+    previous_report: Optional[Dict[str, Any]],
+    markdown_by_agent: Dict[str, str],
+) -> Tuple[Dict[str, str], Dict[str, Dict[str, Any]]]:
+    """
+    Prepare incremental scoring: dimension agents get only the new items plus their previous result.
+
+    Dimensions without a usable previous result (e.g. the agent failed and the
+    default score was stored) keep the full feed markdown and are scored from scratch.
+
+    Args:
+        results: Feed results from process_all_feeds()
+        previous_report: Most recent stored report (None if there is none)
+        markdown_by_agent: Full feed markdown per agent from build_agent_markdown()
+
+    Returns:
+        Tuple of (markdown per agent with new items only for incremental agents,
+        previous dimension results by agent name; empty if no usable previous run)
+    """
+    previous_fingerprints = get_previous_fingerprints(previous_report)
+    previous_dimensions = previous_dimension_results(previous_report)
+    if (not previous_fingerprints or not previous_dimensions
+            or previous_report.get("escalation_result", {}).get("result") != "ok"):
+        print("[Incremental] No usable previous run, scoring from scratch")
+        return markdown_by_agent, {}
+
+    delta_by_agent, _ = build_agent_markdown(filter_new_items(results, previous_fingerprints))
+    markdown_by_agent = {
+        name: delta_by_agent[name] if name in previous_dimensions else markdown
+        for name, markdown in markdown_by_agent.items()
+    }
+    # Dimensions that failed last time (default score) are not in previous_dimensions: scored from scratch
+    from_scratch = sorted(name for name in markdown_by_agent if name != "review" and name not in previous_dimensions)
+    print(f"[Incremental] Updating {', '.join(sorted(previous_dimensions))} from report {previous_report.get('date')}"
+          + (f", scoring {', '.join(from_scratch)} from scratch" if from_scratch else ""))
+    return markdown_by_agent, previous_dimensions
+
+
+async def run_daily_pipeline(tracker: Optional[RunTracker] = None):
+    """
+    Run the daily pipeline and return escalation scoring results.
+
+    Args:
+        tracker: Run tracker persisting per-stage checkpoints (default: untracked run)
+    """
     import time
 
+    tracker = tracker or RunTracker()
+
     # Process all feeds
     print("Processing RSS feeds...")
+    await tracker.start_stage("feeds")
     feed_start = time.time()
     feed_results = await process_all_feeds()
     feed_duration = time.time() - feed_start
+    await tracker.finish_stage("feeds", feeds=len(feed_results), failed=sum(1 for r in feed_results if r["result"] == "error"))
     print(f"RSS feeds processed in {feed_duration:.2f} seconds")
 
-    # Format feed results as markdown for agent input
+    await tracker.start_stage("prepare")
+
+    # Format feed results as markdown for agent input (archive keeps the full texts)
     print("Formatting feed data for escalation analysis...")
     markdown_data = format_feed_results_as_markdown(feed_results)
+    archive_markdown = format_feed_results_as_markdown(feed_results, use_original_text=True)
     print(f"Markdown Data:\n\n{markdown_data}")
 
-    # Save feed markdown
+    # Upload feed markdown in the background (awaited together with the report upload)
     print("Saving feed markdown...")
-    if save_feed_markdown(markdown_data):
-        print("Feed markdown saved successfully")
-    else:
-        print("Failed to save feed markdown")
-
-    # Calculate escalation score using the markdown data
-    print("Calculating escalation score...")
-    scoring_start = time.time()
-    escalation_result = await calculate_escalation_score(markdown_data)
-    scoring_duration = time.time() - scoring_start
-    print(f"Escalation score calculated in {scoring_duration:.2f} seconds")
-
-    # Save escalation result to storage
-    print("Saving escalation report...")
-    save_success = save_escalation_report(escalation_result)
-    if save_success:
-        print("Escalation report saved successfully")
-    else:
-        print("Failed to save escalation report")
+    markdown_upload = asyncio.create_task(save_feed_markdown_async(archive_markdown))
+    try:
+        # Trim feed data per agent to fit the token budgets
+        markdown_by_agent, token_budget_report = build_agent_markdown(feed_results)
+
+        # Compare items with the previous run; on quiet days reuse unaffected dimension scores.
+        # The previous report also carries the agent latency samples for the hedge thresholds.
+        previous_report = await asyncio.to_thread(get_latest_report, max_days_back=CHANGE_MAX_AGE_DAYS)
+        change_report, reuse_dimensions = detect_quiet_day(feed_results, previous_report)
+
+        # Incremental mode: remaining dimension agents update their previous assessment
+        previous_dimensions = {}
+        if SCORING_MODE == "incremental":
+            markdown_by_agent, previous_dimensions = build_incremental_inputs(feed_results, previous_report, markdown_by_agent)
+        await tracker.finish_stage(
+            "prepare",
+            fast_path=bool(change_report and change_report["fast_path"]),  # None: change detection off
+            incremental=bool(previous_dimensions),
+        )
+
+        # Calculate escalation score using the markdown data
+        print("Calculating escalation score...")
+        await tracker.start_stage("scoring")
+        scoring_start = time.time()
+        escalation_result = await calculate_escalation_score(
+            markdown_data,
+            rss_by_agent=markdown_by_agent,
+            reuse_dimensions=reuse_dimensions,
+            previous_dimensions=previous_dimensions,
+            previous_date=previous_report.get("date") if previous_report else None,
+            feed_results=feed_results,
+            hedge_latencies=previous_hedge_latencies(previous_report),
+        )
+        run_metadata = escalation_result.setdefault("run_metadata", {})
+        run_metadata["scoring_mode"] = "incremental" if previous_dimensions else "full"
+        run_metadata["change_detection"] = change_report
+        run_metadata["feed_fingerprints"] = compute_fingerprints(feed_results)
+        run_metadata["token_budget"] = token_budget_report
+        run_metadata["llm_calls"] = drain_call_log()  # Filter + agent calls incl. prompt cache hits
+        if tracker.run:
+            run_metadata["run_id"] = tracker.run["run_id"]
+        scoring_duration = time.time() - scoring_start
+        await tracker.finish_stage("scoring", result=escalation_result.get("result"))
+        print(f"Escalation score calculated in {scoring_duration:.2f} seconds")
+
+        # Save escalation result to storage (concurrently with a still running markdown upload)
+        print("Saving escalation report...")
+        await tracker.start_stage("save")
+        markdown_success, save_success = await asyncio.gather(
+            markdown_upload,
+            save_escalation_report_async(escalation_result),
+        )
+        if markdown_success:
+            print("Feed markdown saved successfully")
+        else:
+            print("Failed to save feed markdown")
+        if save_success:
+            print("Escalation report saved successfully")
+            if await save_dashboard_snapshot():
+                print("Dashboard snapshot saved successfully")
+            else:
+                print("Failed to save dashboard snapshot")
+        else:
+            print("Failed to save escalation report")
+        await tracker.finish_stage("save", report_saved=save_success, markdown_saved=markdown_success)
+    finally:
+        # Scoring raised before the save stage: still finish the feed archive upload
+        # instead of leaving the task to be destroyed when the loop shuts down
+        if not markdown_upload.done():
+            await asyncio.gather(markdown_upload, return_exceptions=True)
+        # LLM clients are bound to this run's event loop: close their connections now
+        await aclose_async_clients()
 
     total_duration = feed_duration + scoring_duration
     print(f"Total pipeline duration: {total_duration:.2f} seconds")
@@ -162,6 +500,48 @@ async def run_daily_pipeline():
     return escalation_result
 
 
+async def run_tracked_pipeline(run: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Run the pipeline for a queued run (see run_status.py), persisting checkpoints.
+
+    Args:
+        run: Run status from run_status.new_run()
+
+    Returns:
+        Escalation scoring results
+    """
+    tracker = RunTracker(run)
+    try:
+        escalation_result = await run_daily_pipeline(tracker)
+    except Exception as e:
+        await tracker.fail(e)
+        raise
+    await tracker.complete(escalation_result)
+    return escalation_result
+
+
+async def save_dashboard_snapshot() -> bool:
+    """
+    Pre-render the dashboard body of today's saved report and store it.
+
+    The report comes from the storage cache (written through on save); the app
+    renders on demand if the snapshot is missing.
+
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    try:
+        date_str = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        report = await asyncio.to_thread(get_report_by_date, date_str)
+        if not report:
+            return False
+        snapshot = await asyncio.to_thread(build_dashboard_snapshot, report)
+        return await save_dashboard_snapshot_async(snapshot)
+    except Exception as e:
+        print(f"Error saving dashboard snapshot: {e}")
+        return False
+
+
 async def main():
     """Test the complete pipeline with escalation scoring."""
     import json
@@ -0,0 +1,148 @@
+# src/review_digest.py
+"""Compact evidence digest for the review agent (cited items + top-ranked stories instead of the full RSS)."""
+from __future__ import annotations
+import os
+from typing import Any, Dict, List, Tuple
+
+try:
+    from .feeds.base import FeedItem
+    from .feeds.tfidf import tokenize, compute_idf, tfidf_vector, cosine_similarity
+    from .feeds.summarizer import split_sentences
+    from .feeds.tokens import estimate_tokens
+    from .story_clustering import cluster_stories
+except ImportError:
+    from feeds.base import FeedItem
+    from feeds.tfidf import tokenize, compute_idf, tfidf_vector, cosine_similarity
+    from feeds.summarizer import split_sentences
+    from feeds.tokens import estimate_tokens
+    from story_clustering import cluster_stories
+
+# Review agent gets the full RSS markdown again (previous behaviour) instead of the digest
+REVIEW_FULL_RSS = os.getenv("REVIEW_FULL_RSS", "0") == "1"
+
+# Min cosine similarity between an item and a rationale sentence to count as cited
+CITED_SIMILARITY_THRESHOLD = 0.3
+
+# Number of top-ranked stories added besides the cited items
+REVIEW_DIGEST_TOP_STORIES = int(os.getenv("REVIEW_DIGEST_TOP_STORIES", "10"))
+
+
+def find_cited_items(
+    entries: List[Tuple[str, FeedItem]],
+    rationales: Dict[str, str],
+    threshold: float = CITED_SIMILARITY_THRESHOLD,
+) -> Dict[int, List[str]]:
+    """
+    Find items the dimension rationales refer to.
+
+    An item counts as cited by a dimension if its URL appears in the rationale
+    or one rationale sentence is similar to the item text (TF-IDF cosine).
+
+    Args:
+        entries: (source_name, item) pairs
+        rationales: Rationale per dimension key
+        threshold: Min cosine similarity
+
+    Returns:
+        Dict mapping entry index to the citing dimension keys
+    """
+    item_tokens = [tokenize(item.text) for _, item in entries]
+    sentences = [
+        (dimension, tokenize(sentence))
+        for dimension, rationale in rationales.items()
+        for sentence in split_sentences(rationale)
+    ]
+    idf = compute_idf(item_tokens + [tokens for _, tokens in sentences])
+    sentence_vectors = [(dimension, tfidf_vector(tokens, idf)) for dimension, tokens in sentences]
+
+    cited: Dict[int, List[str]] = {}
+    for i, (_, item) in enumerate(entries):
+        vector = tfidf_vector(item_tokens[i], idf)
+        for dimension, rationale in rationales.items():
+            by_url = bool(item.url) and item.url in rationale
+            by_text = vector and any(
+                cosine_similarity(vector, sentence_vector) >= threshold
+                for sentence_dimension, sentence_vector in sentence_vectors
+                if sentence_dimension == dimension
+            )
+            if by_url or by_text:
+                cited.setdefault(i, []).append(dimension)
+
+    return cited
+
+
+def _format_item(source_name: str, item: FeedItem) -> str:
+    return f"- **{item.date.strftime('%Y-%m-%d %H:%M UTC')} | {source_name}:** {item.text}"
+
+
+def build_review_digest(
+    results: List[Dict[str, Any]],
+    dim_results: Dict[str, Dict[str, Any]],
+    dimension_names: Dict[str, str],
+    top_stories: int = REVIEW_DIGEST_TOP_STORIES,
+) -> Tuple[str, Dict[str, Any]]:
+    """
+    Build the review agent's feed context from the evidence the dimensions used.
+
+    Contains the items cited in the dimension rationales plus the lead items of
+    the top-ranked stories (most sources, newest) that were not cited.
+
+    Args:
+        results: Feed results from process_all_feeds()
+        dim_results: Dimension results ({"score", "rationale"} per dimension key)
+        dimension_names: Display name per dimension key
+        top_stories: Number of top-ranked stories to add
+
+    Returns:
+        Tuple of (digest markdown, digest report for run metadata)
+    """
+    entries = [
+        (feed_result["source_name"], item)
+        for feed_result in results
+        if feed_result["result"] == "ok"
+        for item in feed_result["items"]
+    ]
+    failed_sources = [r["source_name"] for r in results if r["result"] == "error"]
+
+    rationales = {key: result["rationale"] for key, result in dim_results.items()}
+    cited = find_cited_items(entries, rationales)
+    cited_ids = {id(entries[i][1]) for i in cited}
+
+    top_entries = []
+    for story in cluster_stories(results):
+        if len(top_entries) >= top_stories:
+            break
+        if any(id(item) in cited_ids for _, item in story.items):
+            continue  # Story already represented by a cited item
+        top_entries.append((story.lead, story.sources))
+
+    markdown_lines = ["# Feed Evidence Digest\n"]
+    markdown_lines.append(
+        f"**Summary:** {len(cited)} cited items and {len(top_entries)} top stories "
+        f"from {len(entries)} items; failed feeds: {', '.join(failed_sources) or 'none'}\n"
+    )
+
+    if cited:
+        markdown_lines.append("## Items Cited in Dimension Rationales\n")
+        for i in sorted(cited, key=lambda i: entries[i][1].date, reverse=True):
+            source_name, item = entries[i]
+            dimensions = ", ".join(dimension_names.get(d, d) for d in cited[i])
+            markdown_lines.append(f"{_format_item(source_name, item)} _(cited: {dimensions})_")
+        markdown_lines.append("")
+
+    if top_entries:
+        markdown_lines.append("## Further Top Stories\n")
+        for (source_name, item), sources in top_entries:
+            also = [s for s in sources if s != source_name]
+            suffix = f" _(also: {', '.join(also)})_" if also else ""
+            markdown_lines.append(f"{_format_item(source_name, item)}{suffix}")
+        markdown_lines.append("")
+
+    markdown = "\n".join(markdown_lines)
+    report = {
+        "items": len(entries),
+        "cited_items": len(cited),
+        "top_stories": len(top_entries),
+        "tokens": estimate_tokens(markdown),
+    }
+    return markdown, report
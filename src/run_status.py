@@ -0,0 +1,130 @@
+# src/run_status.py
+"""Pipeline run tracking: run id, per-stage progress and timings, persisted as checkpoints."""
+from __future__ import annotations
+import os
+import re
+import secrets
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+try:
+    from .feeds.base import to_iso_utc
+    from .storage import save_run_status_async
+except ImportError:
+    from feeds.base import to_iso_utc
+    from storage import save_run_status_async
+
+# Run ids: start time (sortable) + random suffix, e.g. "20251015T080001Z-1a2b3c4d"
+RUN_ID_PATTERN = re.compile(r"^\d{8}T\d{6}Z-[0-9a-f]{8}$")
+
+# A run still queued/running after this long is treated as dead (function limit: 300s, see vercel.json)
+RUN_STALE_SECONDS = int(os.getenv("RUN_STALE_SECONDS", "600"))
+
+PIPELINE_STAGES = ["feeds", "prepare", "scoring", "save"]
+
+
+def new_run_id() -> str:
+    """Create a new, time-sortable run id."""
+    return f"{datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%SZ')}-{secrets.token_hex(4)}"
+
+
+def new_run(run_id: str, trigger: str = "cron") -> Dict[str, Any]:
+    """Initial status of a queued run (all stages pending)."""
+    now = to_iso_utc(None)
+    return {
+        "run_id": run_id,
+        "trigger": trigger,
+        "status": "queued",
+        "created": now,
+        "updated": now,
+        "current_stage": None,
+        "stages": {name: {"status": "pending"} for name in PIPELINE_STAGES},
+        "error": None,
+        "result": None,
+    }
+
+
+def is_active(run: Optional[Dict[str, Any]]) -> bool:
+    """Check whether a run is queued/running and was updated recently (i.e. not dead)."""
+    if not run or run.get("status") not in ("queued", "running"):
+        return False
+    updated = datetime.fromisoformat(run["updated"].replace("Z", "+00:00"))
+    return (datetime.now(timezone.utc) - updated).total_seconds() < RUN_STALE_SECONDS
+
+
+class RunTracker:
+    """
+    Tracks one pipeline run; every state change is persisted as checkpoint.
+
+    Without a run (e.g. local runs via `python src/pipeline.py`) nothing is persisted.
+    """
+
+    def __init__(self, run: Optional[Dict[str, Any]] = None):
+        self.run = run
+        self._started: Dict[str, float] = {}
+        self._run_started = time.time()
+
+    async def _checkpoint(self) -> None:
+        if not self.run:
+            return
+        self.run["updated"] = to_iso_utc(None)
+        if not await save_run_status_async(self.run):
+            print(f"[Run {self.run['run_id']}] Failed to save checkpoint")
+
+    async def start_stage(self, name: str) -> None:
+        """Mark a stage as running."""
+        self._started[name] = time.time()
+        if not self.run:
+            return
+        self.run["status"] = "running"
+        self.run["current_stage"] = name
+        self.run["stages"][name] = {"status": "running", "started": to_iso_utc(None)}
+        await self._checkpoint()
+
+    async def finish_stage(self, name: str, **details: Any) -> float:
+        """
+        Mark a stage as done.
+
+        Args:
+            name: Stage name
+            **details: Extra fields stored with the stage (e.g. item counts)
+
+        Returns:
+            Stage duration in seconds
+        """
+        seconds = time.time() - self._started.get(name, time.time())
+        if self.run:
+            self.run["stages"][name].update(status="done", finished=to_iso_utc(None), seconds=round(seconds, 2), **details)
+            self.run["current_stage"] = None
+            await self._checkpoint()
+        return seconds
+
+    async def complete(self, escalation_result: Dict[str, Any]) -> None:
+        """Mark the run as finished with a short result summary."""
+        if not self.run:
+            return
+        escalation_score = escalation_result.get("escalation_score") or {}
+        succeeded = escalation_result.get("result") == "ok"
+        self.run["status"] = "succeeded" if succeeded else "failed"
+        self.run["seconds"] = round(time.time() - self._run_started, 2)
+        self.run["result"] = {
+            "result": escalation_result.get("result"),
+            "score": escalation_score.get("score"),
+            "level": escalation_score.get("level"),
+        }
+        if not succeeded:
+            self.run["error"] = escalation_result.get("error_message", "scoring failed")
+        await self._checkpoint()
+
+    async def fail(self, error: BaseException) -> None:
+        """Mark the run (and its current stage) as failed."""
+        if not self.run:
+            return
+        stage = self.run.get("current_stage")
+        if stage:
+            self.run["stages"][stage].update(status="failed", finished=to_iso_utc(None))
+        self.run["status"] = "failed"
+        self.run["seconds"] = round(time.time() - self._run_started, 2)
+        self.run["error"] = f"{type(error).__name__}: {error}"
+        await self._checkpoint()
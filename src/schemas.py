@@ -1,6 +1,6 @@
 # src/schemas.py
 from __future__ import annotations
-from typing import List
+from typing import List, Optional
 from pydantic import BaseModel, Field
 
 class DimensionScore(BaseModel):
@@ -11,4 +11,18 @@ class DimensionScore(BaseModel):
 class OverallAssessment(BaseModel):
     """Overall escalation assessment focused on synthesis and neutrality"""
     overall_score: float = Field(..., ge=1.0, le=10.0, description="Overall escalation score")
-    situation_summary: str = Field(..., description="Neutral summary of current situation using markdown formatting for structure")
\ No newline at end of file
+    situation_summary: str = Field(..., description="Neutral summary of current situation using markdown formatting for structure")
+
+class Evidence(BaseModel):
+    """Attributed statement found by the shared research pass"""
+    claim: str = Field(..., description="Attributed statement (Laut [Quelle, Datum] ...)")
+    source: str = Field(..., description="Source (organisation, outlet or X account)")
+    date: str = Field(..., description="Publication date (YYYY-MM-DD) or 'unbekannt'")
+    url: Optional[str] = Field(None, description="URL of the source")
+    dimensions: List[str] = Field(default_factory=list, description="Relevant dimensions: military, diplomatic, economic, societal, russians")
+    counter_position: Optional[str] = Field(None, description="Contradicting statement of the other side, if found")
+
+class EvidencePack(BaseModel):
+    """Deduplicated evidence for all dimension agents"""
+    evidence: List[Evidence] = Field(default_factory=list, description="Evidence items")
+    gaps: List[str] = Field(default_factory=list, description="Topics without current data")
@@ -0,0 +1,131 @@
+# src/score_history.py
+"""Columnar score history table (one row per report date), maintained when reports are saved."""
+from __future__ import annotations
+import hashlib
+import json
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+HISTORY_VERSION = 1
+
+DIMENSION_KEYS = ["military", "diplomatic", "economic", "societal", "russians"]
+
+# Column order of the table; all columns have one value per date (sorted ascending)
+HISTORY_COLUMNS = ["date", "score", "calculated_score", *DIMENSION_KEYS, "level"]
+
+
+def empty_table() -> Dict[str, List[Any]]:
+    """Return a table without rows."""
+    return {column: [] for column in HISTORY_COLUMNS}
+
+
+def report_to_row(report: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Extract the history row of a stored report.
+
+    Args:
+        report: Stored report ({"date", "timestamp", "escalation_result"})
+
+    Returns:
+        Row dict with all HISTORY_COLUMNS, or None for failed runs
+    """
+    escalation_result = report.get("escalation_result", {})
+    if escalation_result.get("result") != "ok":
+        return None
+
+    escalation_score = escalation_result["escalation_score"]
+    methodology = escalation_score.get("methodology", {})
+    dimension_scores = methodology.get("dimension_scores", {})
+
+    row = {
+        "date": report["date"],
+        "score": escalation_score["score"],
+        "calculated_score": methodology.get("calculated_score"),
+        "level": escalation_score.get("level"),
+    }
+    for key in DIMENSION_KEYS:
+        row[key] = dimension_scores.get(key, {}).get("score")
+    return row
+
+
+def upsert_row(table: Dict[str, List[Any]], row: Dict[str, Any]) -> Dict[str, List[Any]]:
+    """
+    Insert or replace the row for row["date"] in place, keeping dates sorted.
+
+    Args:
+        table: Columnar table
+        row: Row from report_to_row()
+
+    Returns:
+        The same table (for chaining)
+    """
+    dates = table["date"]
+    index = bisect_left(dates, row["date"])
+    replace = index < len(dates) and dates[index] == row["date"]
+
+    for column in HISTORY_COLUMNS:
+        if replace:
+            table[column][index] = row.get(column)
+        else:
+            table[column].insert(index, row.get(column))
+    return table
+
+
+def select_range(table: Dict[str, List[Any]], start: Optional[str] = None, end: Optional[str] = None) -> Dict[str, List[Any]]:
+    """
+    Select the rows with start <= date <= end (binary search on the date column).
+
+    Args:
+        table: Columnar table
+        start: First date (YYYY-MM-DD, inclusive; None = from the beginning)
+        end: Last date (YYYY-MM-DD, inclusive; None = until the end)
+
+    Returns:
+        New columnar table with the selected rows
+    """
+    dates = table["date"]
+    low = bisect_left(dates, start) if start else 0
+    high = bisect_right(dates, end) if end else len(dates)
+    return {column: table[column][low:high] for column in HISTORY_COLUMNS}
+
+
+def normalize_table(data: Optional[Dict[str, Any]]) -> Dict[str, List[Any]]:
+    """Return the columns of a stored history file (empty table if missing or outdated)."""
+    if not data or data.get("version") != HISTORY_VERSION:
+        return empty_table()
+    columns = data.get("columns", {})
+    rows = len(columns.get("date", []))
+    return {column: list(columns.get(column, [None] * rows)) for column in HISTORY_COLUMNS}
+
+
+def to_document(table: Dict[str, List[Any]]) -> Dict[str, Any]:
+    """Wrap a table into the stored history file format."""
+    return {"version": HISTORY_VERSION, "columns": table}
+
+
+def build_manifest(table: Dict[str, List[Any]], pathname: str) -> Dict[str, Any]:
+    """
+    Build the manifest describing the stored history file.
+
+    The etag is a content hash of the table, usable as HTTP validator.
+
+    Args:
+        table: Columnar table
+        pathname: Storage path of the history file
+
+    Returns:
+        Manifest dict
+    """
+    content = json.dumps(table, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    dates = table["date"]
+    return {
+        "version": HISTORY_VERSION,
+        "pathname": pathname,
+        "columns": HISTORY_COLUMNS,
+        "rows": len(dates),
+        "first_date": dates[0] if dates else None,
+        "last_date": dates[-1] if dates else None,
+        "etag": hashlib.sha256(content).hexdigest()[:32],
+        "updated": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+    }
@@ -1,7 +1,9 @@
 # src/scoring3.py
 from __future__ import annotations
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Tuple
+from collections import defaultdict, deque
 import asyncio
+import os
 import time
 from datetime import datetime
 
@@ -9,14 +11,378 @@ try:
     from .feeds.base import to_iso_utc
     from .agents import AGENTS
     from .agents.review import create_agent as create_review_agent, build_prompt
-    from .schemas import DimensionScore, OverallAssessment
+    from .agents.pool import get_agent, get_pool_stats
+    from .agents.metrics import record_call
+    from .agents.scheduler import arun_agent, get_scheduler_stats, PRIORITY_DIMENSION, PRIORITY_REVIEW
+    from .agents.models import create_fallback_model, create_analysis_model
+    from .agents import research
+    from .schemas import DimensionScore, EvidencePack, OverallAssessment
+    from .feeds.tokens import estimate_tokens
+    from .review_digest import REVIEW_FULL_RSS, build_review_digest
 except ImportError:
     from feeds.base import to_iso_utc
     from agents import AGENTS
     from agents.review import create_agent as create_review_agent, build_prompt
-    from schemas import DimensionScore, OverallAssessment
+    from agents.pool import get_agent, get_pool_stats
+    from agents.metrics import record_call
+    from agents.scheduler import arun_agent, get_scheduler_stats, PRIORITY_DIMENSION, PRIORITY_REVIEW
+    from agents.models import create_fallback_model, create_analysis_model
+    from agents import research
+    from schemas import DimensionScore, EvidencePack, OverallAssessment
+    from feeds.tokens import estimate_tokens
+    from review_digest import REVIEW_FULL_RSS, build_review_digest
 
-async def calculate_escalation_score(rss_markdown: str) -> Dict[str, Any]:
+# Per-agent latency budget: after the hedge threshold (percentile of recent primary
+# latencies) a backup request goes to the fallback model; after the timeout the
+# dimension falls back to the default score. The latency samples are stored with the
+# report (run_metadata["hedge_latencies"]) and seed the next run, since each
+# serverless invocation starts without them.
+AGENT_TIMEOUT_SECONDS = float(os.getenv("AGENT_TIMEOUT_SECONDS", "240"))
+HEDGE_DEFAULT_SECONDS = float(os.getenv("HEDGE_AFTER_SECONDS", "120"))
+HEDGE_PERCENTILE = 0.9
+HEDGE_MIN_SAMPLES = 5
+HEDGE_MAX_SAMPLES = 50
+DEFAULT_DIMENSION_SCORE = 2.0
+
+# Time limit of the review agent (Phase 3), which runs after the dimension agents'
+# budget is used up (function limit: 300s, see vercel.json)
+REVIEW_TIMEOUT_SECONDS = float(os.getenv("REVIEW_TIMEOUT_SECONDS", "50"))
+
+# Primary latencies per agent variant (pool key, e.g. "military" vs "military:no-search"):
+# searching and evidence-only requests have very different latencies
+_primary_latencies: Dict[str, deque] = defaultdict(lambda: deque(maxlen=HEDGE_MAX_SAMPLES))
+
+# Appended to prompts for agents without live search (evidence pack or fallback model):
+# the static task of the dimension agents asks for an active search
+NO_SEARCH_NOTE = """
+HINWEIS: Die Live-Suche ist für diese Bewertung deaktiviert. Die Anweisungen zur AKTIVEN SUCHE
+entfallen; stütze dich ausschließlich auf die Daten in diesem Prompt (mit Quelle + Datum).
+Lücken als "Keine aktuellen Daten zu [X] im vorliegenden Material" kennzeichnen.
+"""
+
+# Live search results per dimension agent in incremental mode (only new items to verify)
+INCREMENTAL_SEARCH_RESULTS = int(os.getenv("INCREMENTAL_SEARCH_RESULTS", "5"))
+
+INCREMENTAL_TASK = """
+INKREMENTELLE AKTUALISIERUNG:
+Der RSS-FEED-KONTEXT oben enthält NUR die Meldungen, die seit der letzten Bewertung neu sind.
+Ausgangspunkt ist die letzte Bewertung dieser Dimension (oben). Prüfe, ob die neuen Meldungen
+den Score verändern:
+- Belege aus der letzten Begründung, die weiterhin gültig sind, übernehmen (mit Quelle + Datum)
+- Neue Entwicklungen ergänzen, überholte Aussagen korrigieren oder streichen
+- Score nur bei belegten neuen Entwicklungen ändern; Änderung in der Begründung benennen
+- Live-Suche nur gezielt zur Verifikation neuer Meldungen einsetzen
+"""
+
+# One shared live-search pass for the dimension agents, which then run without search
+# (except agents with USES_SHARED_RESEARCH = False, e.g. russians with its own X search)
+SHARED_RESEARCH_ENABLED = os.getenv("SHARED_RESEARCH", "1") == "1"
+
+# Time limit of the shared research pass; on timeout the dimension agents search themselves.
+# Phase 1 gets AGENT_TIMEOUT_SECONDS minus the time Phase 0 used (function limit: 300s, see vercel.json)
+RESEARCH_TIMEOUT_SECONDS = float(os.getenv("RESEARCH_TIMEOUT_SECONDS", "60"))
+
+# Display names of the dimensions in the report
+DIMENSION_NAMES = {
+    'military': 'Militärisch',
+    'diplomatic': 'Diplomatisch',
+    'economic': 'Wirtschaftlich',
+    'societal': 'Gesellschaftlich',
+    'russians': 'Russen in DE'
+}
+
+
+def previous_dimension_results(report: Optional[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """
+    Extract the dimension results of a stored report.
+
+    Dimensions that fell back to the default score (agent failed) are skipped;
+    they are a placeholder, not an assessment to reuse or update. The
+    assessed_date is the date the agent last actually scored the dimension
+    (carried over when the result was reused).
+
+    Args:
+        report: Stored report (from storage.get_latest_report())
+
+    Returns:
+        Dict mapping dimension key to {"score", "rationale", "assessed_date"} (empty if unavailable)
+    """
+    if not report:
+        return {}
+    escalation_result = report.get("escalation_result", {})
+    escalation_score = escalation_result.get("escalation_score", {})
+    dimension_paths = escalation_result.get("run_metadata", {}).get("dimension_paths", {})
+    keys_by_name = {display_name: key for key, display_name in DIMENSION_NAMES.items()}
+
+    results = {}
+    for dimension in escalation_score.get("dimensions", []):
+        key = keys_by_name.get(dimension.get("name"))
+        if key is None:
+            continue
+        path = dimension_paths.get(key, {})
+        if path.get("path") == "default":
+            continue
+        results[key] = {
+            "score": dimension["score"],
+            "rationale": dimension["rationale"],
+            "assessed_date": path.get("assessed_date") or report.get("date"),
+        }
+    return results
+
+
+def previous_hedge_latencies(report: Optional[Dict[str, Any]]) -> Dict[str, List[float]]:
+    """
+    Extract the primary latency samples stored with a report.
+
+    Args:
+        report: Stored report (from storage.get_latest_report())
+
+    Returns:
+        Dict mapping agent variant to latency samples in seconds (empty if unavailable)
+    """
+    if not report:
+        return {}
+    samples = report.get("escalation_result", {}).get("run_metadata", {}).get("hedge_latencies")
+    return samples if isinstance(samples, dict) else {}
+
+
+def seed_hedge_latencies(samples: Dict[str, List[float]]) -> None:
+    """Load stored latency samples for variants this process has not measured yet."""
+    for variant, latencies in samples.items():
+        if not _primary_latencies[variant]:
+            _primary_latencies[variant].extend(float(latency) for latency in latencies[-HEDGE_MAX_SAMPLES:])
+
+
+def get_hedge_threshold(key: str, timeout: float = AGENT_TIMEOUT_SECONDS) -> float:
+    """Seconds after which a hedged request is started for a dimension agent variant (capped at its timeout)."""
+    samples = sorted(_primary_latencies[key])
+    if len(samples) < HEDGE_MIN_SAMPLES:
+        return min(HEDGE_DEFAULT_SECONDS, timeout)
+    return min(samples[int(HEDGE_PERCENTILE * (len(samples) - 1))], timeout)
+
+
+def build_evidence_prompt(prompt: str, evidence: str) -> str:
+    """
+    Extend a dimension prompt with the shared evidence pack (agent runs without live search).
+
+    Args:
+        prompt: Prompt from the agent module's build_prompt()
+        evidence: Evidence for the dimension from research.format_evidence()
+
+    Returns:
+        Prompt with the evidence section
+    """
+    return f"""{prompt}
+EVIDENZ AUS DER GEMEINSAMEN RECHERCHE (ersetzt die AKTIVE SUCHE):
+{evidence}
+{NO_SEARCH_NOTE}"""
+
+
+async def run_research(current_date: str, rss_data: str) -> Tuple[Optional[EvidencePack], Dict[str, Any]]:
+    """
+    Run the shared research pass once for all dimension agents.
+
+    Args:
+        current_date: Reference date (YYYY-MM-DD)
+        rss_data: Feed markdown
+
+    Returns:
+        Tuple of (deduplicated evidence pack or None on failure/timeout, research metadata)
+    """
+    start = time.perf_counter()
+    run_input = research.build_research_prompt(current_date, rss_data)
+    prompt_tokens = estimate_tokens(run_input)
+    agent = get_agent("research", research.create_agent)
+
+    try:
+        response, queued = await asyncio.wait_for(
+            arun_agent(agent, run_input, "xai", prompt_tokens, PRIORITY_DIMENSION),
+            timeout=RESEARCH_TIMEOUT_SECONDS,
+        )
+        record_call("research", response, queued)
+    except Exception as e:
+        if isinstance(e, asyncio.TimeoutError):
+            error = f"no response within {RESEARCH_TIMEOUT_SECONDS:.0f}s"
+        else:
+            error = f"{type(e).__name__}: {e}"
+        print(f"Warning: research pass failed ({error}), dimension agents search themselves")
+        return None, {"status": "failed", "error": error,
+                      "duration": round(time.perf_counter() - start, 3)}
+
+    if not (hasattr(response, 'content') and isinstance(response.content, EvidencePack)):
+        print("Warning: research agent did not return proper EvidencePack, dimension agents search themselves")
+        return None, {"status": "failed", "error": "no proper EvidencePack",
+                      "duration": round(time.perf_counter() - start, 3)}
+
+    pack = research.dedup_evidence(response.content)
+    duration = time.perf_counter() - start
+    print(f"Research pass: {len(response.content.evidence)} → {len(pack.evidence)} evidence items in {duration:.1f}s")
+    return pack, {
+        "status": "ok",
+        "prompt_tokens": prompt_tokens,
+        "evidence": len(response.content.evidence),
+        "evidence_deduplicated": len(pack.evidence),
+        "gaps": len(pack.gaps),
+        "duration": round(duration, 3),
+    }
+
+
+def build_incremental_prompt(prompt: str, previous_result: Dict[str, Any], previous_date: Optional[str]) -> str:
+    """
+    Extend a dimension prompt (built from new items only) with the previous assessment.
+
+    Args:
+        prompt: Prompt from the agent module's build_prompt()
+        previous_result: Previous {"score", "rationale", "assessed_date"} of the dimension
+        previous_date: Date of the previous report (if the result has no assessed_date)
+
+    Returns:
+        Prompt asking the agent to update the previous score
+    """
+    assessed_date = previous_result.get("assessed_date") or previous_date
+    return f"""{prompt}
+LETZTE BEWERTUNG ({assessed_date or "unbekannt"}):
+Score: {previous_result['score']}
+Begründung:
+{previous_result['rationale']}
+{INCREMENTAL_TASK}"""
+
+
+async def run_dimension_agent(
+    name: str,
+    agent_module,
+    run_input: str,
+    search_results: Optional[int] = None,
+    timeout: float = AGENT_TIMEOUT_SECONDS,
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    Run a dimension agent with latency budget and hedged fallback.
+
+    The primary (research model) request starts immediately. If it has not
+    answered within the hedge threshold, or fails, a second request goes to the
+    fallback model. The first valid DimensionScore wins and the other request
+    is cancelled. If nothing valid arrives before the timeout, the default
+    score is used. The fallback model has no live search, so its prompt gets
+    NO_SEARCH_NOTE unless the prompt is already evidence-only.
+
+    Args:
+        name: Dimension name (e.g. "military")
+        agent_module: Agent module with create_agent() and create_model()
+        run_input: Prompt
+        search_results: Live search results of the primary model (None = agent default,
+            0 = search off when working from the shared evidence pack)
+        timeout: Latency budget in seconds (Phase 1 budget left after the research pass)
+
+    Returns:
+        Tuple of (dimension result dict, path info for run metadata)
+    """
+    start = time.perf_counter()
+    if search_results is None:
+        variant = name
+        primary_agent = get_agent(variant, agent_module.create_agent)
+    elif search_results == 0:
+        variant = f"{name}:no-search"
+        primary_agent = get_agent(variant, lambda: agent_module.create_agent(model=create_analysis_model()))
+    else:
+        variant = f"{name}:search-{search_results}"
+        primary_agent = get_agent(
+            variant,
+            lambda: agent_module.create_agent(model=agent_module.create_model(search_results=search_results)),
+        )
+    hedge_after = get_hedge_threshold(variant, timeout)
+    prompt_tokens = estimate_tokens(run_input)
+    tasks = {asyncio.create_task(run_agent_async(primary_agent, run_input, "xai", prompt_tokens)): "primary"}
+    hedged = False
+    errors = []
+
+    fallback_input = run_input if search_results == 0 else f"{run_input}{NO_SEARCH_NOTE}"
+
+    def start_hedge():
+        fallback_agent = get_agent(
+            f"{name}:fallback",
+            lambda: agent_module.create_agent(model=create_fallback_model()),
+            provider="anthropic",
+        )
+        tasks[asyncio.create_task(
+            run_agent_async(fallback_agent, fallback_input, "anthropic", estimate_tokens(fallback_input))
+        )] = "fallback"
+        print(f"[{name}] Hedged request to fallback model after {time.perf_counter() - start:.1f}s")
+
+    try:
+        while tasks or not hedged:
+            if not tasks:
+                # Primary failed before the hedge threshold
+                hedged = True
+                start_hedge()
+
+            elapsed = time.perf_counter() - start
+            wait_until = hedge_after if not hedged else timeout
+            done, _ = await asyncio.wait(
+                tasks.keys(),
+                timeout=max(0.0, wait_until - elapsed),
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+
+            if not done:
+                if hedged:
+                    break  # Latency budget exhausted
+                hedged = True
+                start_hedge()
+                continue
+
+            for task in done:
+                path = tasks.pop(task)
+                try:
+                    response, queued = task.result()
+                    record_call(f"{name}:{path}", response, queued)
+                except Exception as e:
+                    print(f"Error in {name} agent ({path}): {str(e)}")
+                    errors.append(f"{path}: {str(e)}")
+                    continue
+
+                if hasattr(response, 'content') and isinstance(response.content, DimensionScore):
+                    duration = time.perf_counter() - start
+                    if path == "primary" or "primary" in tasks.values():
+                        # A primary still running when the hedge wins took at least this long
+                        # (censored sample); leaving it out would bias the threshold low
+                        _primary_latencies[variant].append(duration)
+                    return response.content.model_dump(), {
+                        "path": path,
+                        "hedged": hedged,
+                        "hedge_after": round(hedge_after, 1),
+                        "duration": round(duration, 3),
+                        "search_results": search_results,
+                    }
+
+                print(f"Warning: {name} agent ({path}) did not return proper DimensionScore")
+                errors.append(f"{path}: no proper DimensionScore")
+    finally:
+        for task in tasks:
+            task.cancel()
+
+    duration = time.perf_counter() - start
+    if "primary" in tasks.values():
+        _primary_latencies[variant].append(duration)  # Censored: primary still running at the timeout
+    reason = "; ".join(errors) if errors else f"no response within {timeout:.0f}s"
+    print(f"Warning: {name} agent failed ({reason}), using default score")
+    return {"score": DEFAULT_DIMENSION_SCORE, "rationale": f"{name} agent failed: {reason}"}, {
+        "path": "default",
+        "hedged": hedged,
+        "hedge_after": round(hedge_after, 1),
+        "duration": round(duration, 3),
+        "search_results": search_results,
+    }
+
+
+async def calculate_escalation_score(
+    rss_markdown: str,
+    rss_by_agent: Optional[Dict[str, str]] = None,
+    reuse_dimensions: Optional[Dict[str, Dict[str, Any]]] = None,
+    previous_dimensions: Optional[Dict[str, Dict[str, Any]]] = None,
+    previous_date: Optional[str] = None,
+    feed_results: Optional[List[Dict[str, Any]]] = None,
+    hedge_latencies: Optional[Dict[str, List[float]]] = None,
+) -> Dict[str, Any]:
     """
     Calculate escalation score using 6-agent architecture:
     - 5 parallel dimension agents (xAI/Grok)
@@ -24,39 +390,82 @@ async def calculate_escalation_score(rss_markdown: str) -> Dict[str, Any]:
 
     Args:
         rss_markdown: Markdown-formatted RSS feed results
+        rss_by_agent: Optional per-agent feed markdown (e.g. trimmed to token budgets),
+            keyed by agent name ("military", ..., "review"); falls back to rss_markdown
+        reuse_dimensions: Optional dimension results of the previous run to reuse
+            instead of running the agent (change-detection fast path), keyed by agent name
+        previous_dimensions: Optional previous dimension results for incremental scoring;
+            these agents get their previous rationale and rss_by_agent holds only new items
+        previous_date: Date of the previous report (incremental scoring)
+        feed_results: Feed results from process_all_feeds(); if given, the review agent
+            gets a compact evidence digest instead of the full RSS (unless REVIEW_FULL_RSS=1)
+        hedge_latencies: Optional primary latency samples of the previous run
+            (previous_hedge_latencies()); seed the hedge thresholds
 
     Returns:
-        Dict with result, timestamp, and escalation data or error message
+        Dict with result, timestamp, escalation data or error message, and run_metadata
     """
+    rss_by_agent = rss_by_agent or {}
+    reuse_dimensions = reuse_dimensions or {}
+    previous_dimensions = previous_dimensions or {}
+    run_metadata: Dict[str, Any] = {"prompt_tokens": {}}
+    seed_hedge_latencies(hedge_latencies or {})
     try:
         start_total = time.perf_counter()
         current_date = datetime.now().strftime("%Y-%m-%d")
 
-        # Phase 1: Create all dimension agents and run in parallel
+        # Phase 0: Shared research pass (one live search instead of one per dimension agent)
+        start_phase0 = time.perf_counter()
+        evidence_pack = None
+        if SHARED_RESEARCH_ENABLED and any(
+            name not in reuse_dimensions and getattr(agent_module, "USES_SHARED_RESEARCH", True)
+            for name, agent_module in AGENTS.items()
+        ):
+            print("\n=== Phase 0: Shared Research ===")
+            evidence_pack, run_metadata["research"] = await run_research(
+                current_date, rss_by_agent.get("review", rss_markdown)
+            )
+        duration_phase0 = time.perf_counter() - start_phase0
+        phase1_timeout = max(0.0, AGENT_TIMEOUT_SECONDS - duration_phase0)
+        run_metadata["phase1_timeout"] = round(phase1_timeout, 1)
+
+        # Phase 1: Run all dimension agents in parallel (each with latency budget and hedging)
         print("\n=== Phase 1: Dimension Agents (Parallel) ===")
         start_phase1 = time.perf_counter()
         dimension_tasks = {}
+        dimension_results = {}
+        run_metadata["dimension_paths"] = {}
         for name, agent_module in AGENTS.items():
-            agent = agent_module.create_agent()
-            run_input = agent_module.build_prompt(current_date, rss_markdown)
-            dimension_tasks[name] = asyncio.create_task(run_agent_async(agent, run_input))
+            if name in reuse_dimensions:
+                reused = reuse_dimensions[name]
+                print(f"[{name}] Reusing previous result (score {reused['score']}, assessed {reused.get('assessed_date')})")
+                dimension_results[name] = {"score": reused["score"], "rationale": reused["rationale"]}
+                run_metadata["dimension_paths"][name] = {"path": "reused", "assessed_date": reused.get("assessed_date")}
+                continue
+            run_input = agent_module.build_prompt(current_date, rss_by_agent.get(name, rss_markdown))
+            search_results = None
+            if name in previous_dimensions:
+                run_input = build_incremental_prompt(run_input, previous_dimensions[name], previous_date)
+                search_results = INCREMENTAL_SEARCH_RESULTS
+            if evidence_pack is not None and getattr(agent_module, "USES_SHARED_RESEARCH", True):
+                run_input = build_evidence_prompt(run_input, research.format_evidence(evidence_pack, name))
+                search_results = 0
+            run_metadata["prompt_tokens"][name] = estimate_tokens(run_input)
+            dimension_tasks[name] = asyncio.create_task(run_dimension_agent(
+                name, agent_module, run_input, search_results, phase1_timeout
+            ))
 
         # Wait for all dimension agents to complete
-        dimension_results = {}
         for name, task in dimension_tasks.items():
-            try:
-                response = await task
-                if hasattr(response, 'content') and isinstance(response.content, DimensionScore):
-                    dimension_results[name] = response.content.model_dump()
-                else:
-                    print(f"Warning: {name} agent did not return proper DimensionScore")
-                    dimension_results[name] = {"score": 2.0, "rationale": f"{name} agent failed to respond properly"}
-            except Exception as e:
-                print(f"Error in {name} agent: {str(e)}")
-                dimension_results[name] = {"score": 2.0, "rationale": f"{name} agent failed: {str(e)}"}
+            dimension_results[name], run_metadata["dimension_paths"][name] = await task
 
         duration_phase1 = time.perf_counter() - start_phase1
         print(f"Phase 1 completed in {duration_phase1:.3f}s")
+        run_metadata["hedge_latencies"] = {
+            variant: [round(latency, 1) for latency in latencies]
+            for variant, latencies in _primary_latencies.items()
+            if latencies
+        }
 
         # Phase 2: Calculate weighted score
         print("\n=== Phase 2: Weighted Score Calculation ===")
@@ -81,34 +490,48 @@ async def calculate_escalation_score(rss_markdown: str) -> Dict[str, Any]:
         # Phase 3: Review agent synthesis
         print("\n=== Phase 3: Review Agent Synthesis ===")
         start_phase3 = time.perf_counter()
-        review_agent = create_review_agent()
-        review_input = build_prompt(current_date, rss_markdown, dimension_results, calculated_score)
-        final_response = await review_agent.arun(review_input)
+        review_agent = get_agent("review", create_review_agent)
+        review_rss = rss_by_agent.get("review", rss_markdown)
+        if feed_results is not None and not REVIEW_FULL_RSS:
+            # Cited items + top stories instead of re-sending the full RSS
+            review_rss, run_metadata["review_digest"] = build_review_digest(feed_results, dimension_results, DIMENSION_NAMES)
+        review_input = build_prompt(current_date, review_rss, dimension_results, calculated_score)
+        run_metadata["prompt_tokens"]["review"] = estimate_tokens(review_input)
+        try:
+            final_response, queued = await asyncio.wait_for(
+                arun_agent(review_agent, review_input, "xai", run_metadata["prompt_tokens"]["review"], PRIORITY_REVIEW),
+                timeout=REVIEW_TIMEOUT_SECONDS,
+            )
+        except asyncio.TimeoutError:
+            print(f"Warning: review agent did not respond within {REVIEW_TIMEOUT_SECONDS:.0f}s")
+            return {
+                "result": "error",
+                "timestamp": to_iso_utc(None),
+                "error_message": f"Review agent: no response within {REVIEW_TIMEOUT_SECONDS:.0f}s",
+                "run_metadata": run_metadata
+            }
+        record_call("review", final_response, queued)
 
         duration_phase3 = time.perf_counter() - start_phase3
         print(f"Phase 3 completed in {duration_phase3:.3f}s")
 
         duration_total = time.perf_counter() - start_total
         print(f"\n=== Total Duration: {duration_total:.3f}s ===")
+        print(f"  Phase 0 (Research):        {duration_phase0:7.3f}s ({duration_phase0/duration_total*100:5.1f}%)")
         print(f"  Phase 1 (Dimensions):      {duration_phase1:7.3f}s ({duration_phase1/duration_total*100:5.1f}%)")
         print(f"  Phase 2 (Calculation):     {duration_phase2:7.3f}s ({duration_phase2/duration_total*100:5.1f}%)")
         print(f"  Phase 3 (Review):          {duration_phase3:7.3f}s ({duration_phase3/duration_total*100:5.1f}%)")
 
+        run_metadata["llm_pool"] = get_pool_stats()
+        run_metadata["llm_scheduler"] = get_scheduler_stats()
+
         if hasattr(final_response, 'content') and isinstance(final_response.content, OverallAssessment):
             assessment_data = final_response.content.model_dump()
 
             # Build dimensions array from original Phase 1 results (not from review agent)
-            dimension_names = {
-                'military': 'Militärisch',
-                'diplomatic': 'Diplomatisch',
-                'economic': 'Wirtschaftlich',
-                'societal': 'Gesellschaftlich',
-                'russians': 'Russen in DE'
-            }
-
             dimensions = [
                 {
-                    "name": dimension_names[key],
+                    "name": DIMENSION_NAMES[key],
                     "score": dimension_results[key]['score'],
                     "rationale": dimension_results[key]['rationale']
                 }
@@ -133,25 +556,28 @@ async def calculate_escalation_score(rss_markdown: str) -> Dict[str, Any]:
                         "final_score": assessment_data["overall_score"],
                         "adjustment": assessment_data["overall_score"] - calculated_score
                     }
-                }
+                },
+                "run_metadata": run_metadata
             }
         else:
             return {
                 "result": "error",
                 "timestamp": to_iso_utc(None),
-                "error_message": f"Review agent failed to return proper OverallAssessment. Content type: {type(final_response.content) if hasattr(final_response, 'content') else 'no content'}"
+                "error_message": f"Review agent failed to return proper OverallAssessment. Content type: {type(final_response.content) if hasattr(final_response, 'content') else 'no content'}",
+                "run_metadata": run_metadata
             }
 
     except Exception as e:
         return {
             "result": "error",
             "timestamp": to_iso_utc(None),
-            "error_message": f"Escalation scoring failed: {str(e)}"
+            "error_message": f"Escalation scoring failed: {str(e)}",
+            "run_metadata": run_metadata
         }
 
-async def run_agent_async(agent, input_text: str):
-    """Run agent asynchronously"""
-    return await agent.arun(input_text)
+async def run_agent_async(agent, input_text: str, provider: str, tokens: int):
+    """Run dimension agent asynchronously through the rate limiter (returns response and queue time)"""
+    return await arun_agent(agent, input_text, provider, tokens, PRIORITY_DIMENSION)
 
 def get_escalation_level(score: float) -> str:
     """Convert numerical score to level name"""
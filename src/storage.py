@@ -1,11 +1,27 @@
 # src/storage.py
+import asyncio
+import gzip
 import json
 import os
+import re
+import tempfile
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Any, Awaitable, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar
 import httpx
 
+try:
+    from .score_history import report_to_row, upsert_row, select_range, normalize_table, to_document, build_manifest
+except ImportError:
+    from score_history import report_to_row, upsert_row, select_range, normalize_table, to_document, build_manifest
+
+T = TypeVar("T")
+
 # Environment detection
 ENVIRONMENT = os.getenv("ENVIRONMENT", "local")
 BLOB_TOKEN = os.getenv("BLOB_READ_WRITE_TOKEN")
@@ -14,52 +30,396 @@ BLOB_TOKEN = os.getenv("BLOB_READ_WRITE_TOKEN")
 REPORTS_DIR = Path(__file__).parent / "reports"
 FEEDS_MARKDOWN_DIR = Path(__file__).parent / "feeds-markdown"
 
+# Score history: columnar table (one column per field, one entry per report date),
+# updated on every report save so range queries need a single read
+HISTORY_DIR = Path(__file__).parent / "history"
+HISTORY_PATHNAME = "history/scores.json"
+HISTORY_MANIFEST_PATHNAME = "history/manifest.json"
+
+# Pre-rendered dashboard bodies (one per report date, see dashboard.py)
+DASHBOARD_SNAPSHOT_DIR = Path(__file__).parent / "dashboard-snapshots"
+
+# Pipeline run status (one file per run id, see run_status.py) and a pointer to the latest run
+RUNS_DIR = Path(__file__).parent / "runs"
+LATEST_RUN_PATHNAME = "runs/latest.json"
+
+# Archive compression: new reports/markdown are written gzip-compressed with a ".gz"
+# suffix; reads accept compressed and plain files (detected by the gzip magic bytes)
+COMPRESS_ARCHIVE = os.getenv("COMPRESS_ARCHIVE", "1") == "1"
+GZIP_SUFFIX = ".gz"
+GZIP_MAGIC = b"\x1f\x8b"
+
+# Blob prefixes of the dated archive (stored as "<pathname>.gz" if COMPRESS_ARCHIVE). All
+# other blobs (history, run status, dashboard snapshots) are stored plain under their own
+# pathname, so each blob has one expected variant and a cold read is a single GET
+ARCHIVE_PREFIXES = ("reports/", "feeds/")
+
+# First archive date (YYYY-MM-DD) written compressed only: reads of dated archive files from
+# this day on don't fall back to the plain legacy variant
+COMPRESS_ARCHIVE_SINCE = os.getenv("COMPRESS_ARCHIVE_SINCE")
+ARCHIVE_DATE_PATTERN = re.compile(r"/(\d{4}-\d{2}-\d{2})\.")
+STREAM_CHUNK_SIZE = 64 * 1024
+
 # Vercel Blob API configuration
 BLOB_API_BASE = "https://blob.vercel-storage.com"
+BLOB_TIMEOUT = 30.0
+BLOB_LIMITS = httpx.Limits(max_connections=10, max_keepalive_connections=5, keepalive_expiry=60.0)
 
-def _save_to_blob(pathname: str, data: Dict[str, Any]) -> bool:
+# Public base URL of the blob store (e.g. https://<storeid>.public.blob.vercel-storage.com).
+# If unset, it is learned from upload responses or derived from the store id in the token.
+BLOB_PUBLIC_BASE_URL = os.getenv("BLOB_PUBLIC_BASE_URL")
+
+# CDN cache lifetime of blobs overwritten during the day (history, run status; 60s is Vercel's minimum)
+MUTABLE_BLOB_MAX_AGE = 60
+
+# Manifest of known blob URLs (pathname -> url) and stored variants (pathname -> pathname
+# with or without ".gz"), kept across warm invocations
+BLOB_MANIFEST_FILE = Path(os.getenv("BLOB_MANIFEST_FILE", str(Path(tempfile.gettempdir()) / "blob-manifest.json")))
+
+_manifest_lock = threading.Lock()
+_manifest: Optional[Dict[str, Any]] = None
+
+# Shared async client, bound to the event loop it was created in
+_async_client: Optional[Tuple[asyncio.AbstractEventLoop, httpx.AsyncClient]] = None
+
+# Report cache: past dates never change once written and stay cached; today's
+# report (and missing reports) are refetched after the TTL
+REPORT_CACHE_SIZE = int(os.getenv("REPORT_CACHE_SIZE", "64"))
+REPORT_CACHE_TTL = float(os.getenv("REPORT_CACHE_TTL", "300"))
+
+# Optional second tier on disk for past reports (e.g. /tmp/report-cache, kept across warm invocations)
+REPORT_CACHE_DIR = Path(os.getenv("REPORT_CACHE_DIR")) if os.getenv("REPORT_CACHE_DIR") else None
+
+_report_cache_lock = threading.Lock()
+_report_cache: "OrderedDict[str, Tuple[Optional[Dict[str, Any]], float]]" = OrderedDict()  # date -> (report, fetched_at)
+_report_fetches: Dict[str, "_Flight"] = {}
+
+
+class _Flight:
+    """One in-progress fetch that concurrent callers for the same key wait on."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Optional[Dict[str, Any]] = None
+
+
+def _serialize_json(data: Dict[str, Any]) -> str:
+    """Serialize a report (compact when compressed, pretty-printed otherwise)."""
+    if COMPRESS_ARCHIVE:
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
+
+def _encode_archive(text: str) -> Tuple[bytes, str]:
     """
-    Save data to Vercel Blob Storage.
+    Encode text for the archive.
+
+    Returns:
+        Tuple of (content, suffix to append to the pathname: ".gz" or "")
+    """
+    if COMPRESS_ARCHIVE:
+        return gzip.compress(text.encode('utf-8'), compresslevel=9, mtime=0), GZIP_SUFFIX
+    return text.encode('utf-8'), ""
+
+
+def _decompress_stream(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """
+    Decompress a byte stream on the fly if it is gzip data, pass it through otherwise.
+
+    Args:
+        chunks: Byte chunks (e.g. response.iter_bytes() or file reads)
+
+    Yields:
+        Decoded byte chunks
+    """
+    decompressor = None
+    detected = False
+    pending = b""
+    for chunk in chunks:
+        if not detected:
+            # Collect enough bytes to check the gzip magic
+            pending += chunk
+            if len(pending) < len(GZIP_MAGIC):
+                continue
+            detected = True
+            chunk, pending = pending, b""
+            if chunk.startswith(GZIP_MAGIC):
+                decompressor = zlib.decompressobj(wbits=31)  # gzip container
+        if decompressor is not None:
+            chunk = decompressor.decompress(chunk)
+        if chunk:
+            yield chunk
+
+    if pending:
+        yield pending  # Stream shorter than the magic bytes
+    if decompressor is not None:
+        tail = decompressor.flush()
+        if tail:
+            yield tail
+
+
+def _read_archive(chunks: Iterable[bytes]) -> str:
+    """Read a (possibly gzip-compressed) archive stream as text."""
+    return b"".join(_decompress_stream(chunks)).decode('utf-8')
+
+
+def _read_local_archive(file_path: Path) -> str:
+    """Read a local archive file as text (decompressed while reading)."""
+    with open(file_path, 'rb') as f:
+        return _read_archive(iter(lambda: f.read(STREAM_CHUNK_SIZE), b""))
+
+
+def _load_manifest() -> Dict[str, Any]:
+    """Return the blob manifest ({"base_url", "urls", "variants"}), loading it once."""
+    global _manifest
+    if _manifest is None:
+        try:
+            with open(BLOB_MANIFEST_FILE, 'r', encoding='utf-8') as f:
+                _manifest = json.load(f)
+        except (OSError, ValueError):
+            _manifest = {}
+        _manifest.setdefault("base_url", None)
+        _manifest.setdefault("urls", {})
+        _manifest.setdefault("variants", {})
+    return _manifest
+
+
+def _write_manifest(manifest: Dict[str, Any]) -> None:
+    """Persist the manifest (call with _manifest_lock held)."""
+    try:
+        BLOB_MANIFEST_FILE.write_text(json.dumps(manifest), encoding='utf-8')
+    except OSError as e:
+        print(f"Could not write blob manifest: {e}")
+
+
+def _remember_blob_url(pathname: str, url: str) -> None:
+    """Store the URL of a blob (and the store's base URL) in the manifest."""
+    with _manifest_lock:
+        manifest = _load_manifest()
+        if manifest["urls"].get(pathname) == url:
+            return
+        manifest["urls"][pathname] = url
+        if url.endswith(f"/{pathname}"):
+            manifest["base_url"] = url[:-len(pathname) - 1]
+        _write_manifest(manifest)
+
+
+def _remember_blob_variant(pathname: str, stored_pathname: Optional[str]) -> None:
+    """Store which variant of pathname is stored (None = unknown again, e.g. after a 404)."""
+    with _manifest_lock:
+        manifest = _load_manifest()
+        if manifest["variants"].get(pathname) == stored_pathname:
+            return
+        if stored_pathname is None:
+            manifest["variants"].pop(pathname, None)
+        else:
+            manifest["variants"][pathname] = stored_pathname
+        _write_manifest(manifest)
+
+
+def _known_blob_variant(pathname: str) -> Optional[str]:
+    """Stored variant of pathname recorded in the manifest (None if unknown)."""
+    with _manifest_lock:
+        return _load_manifest()["variants"].get(pathname)
+
+
+def _is_archive_pathname(pathname: str) -> bool:
+    return pathname.startswith(ARCHIVE_PREFIXES)
+
+
+def _compressed_only(pathname: str) -> bool:
+    """Check whether a dated archive file was written after the compression cutover."""
+    match = ARCHIVE_DATE_PATTERN.search(pathname)
+    return bool(COMPRESS_ARCHIVE_SINCE and match and match.group(1) >= COMPRESS_ARCHIVE_SINCE)
+
+
+def _blob_variants(pathname: str) -> List[str]:
+    """
+    Stored pathnames to try when reading pathname, the one current writers use first.
+
+    Archive files: "<pathname>.gz" (plain if COMPRESS_ARCHIVE is off), then the
+    other variant for files written before (or after) the switch. Other blobs:
+    the plain pathname, then "<pathname>.gz" as written by earlier versions.
+    """
+    compressed = pathname + GZIP_SUFFIX
+    if not _is_archive_pathname(pathname):
+        return [pathname, compressed]
+    if _compressed_only(pathname):
+        return [compressed]
+    return [compressed, pathname] if COMPRESS_ARCHIVE else [pathname, compressed]
+
+
+def _blob_base_url() -> Optional[str]:
+    """
+    Public base URL of the blob store.
+
+    Order: BLOB_PUBLIC_BASE_URL, base URL learned from an upload response,
+    store id from the token (vercel_blob_rw_<storeId>_<secret>).
+    """
+    if BLOB_PUBLIC_BASE_URL:
+        return BLOB_PUBLIC_BASE_URL.rstrip("/")
+    with _manifest_lock:
+        base_url = _load_manifest()["base_url"]
+    if base_url:
+        return base_url
+    match = re.match(r"^vercel_blob_rw_([a-z0-9]+)_", BLOB_TOKEN or "", re.IGNORECASE)
+    if match:
+        return f"https://{match.group(1).lower()}.public.blob.vercel-storage.com"
+    return None
+
+
+def _blob_url(pathname: str) -> Optional[str]:
+    """Direct download URL of a blob (None if the store's base URL is unknown)."""
+    with _manifest_lock:
+        url = _load_manifest()["urls"].get(pathname)
+    if url:
+        return url
+    base_url = _blob_base_url()
+    return f"{base_url}/{pathname}" if base_url else None
+
+
+def _get_async_client() -> httpx.AsyncClient:
+    """
+    Return the pooled AsyncClient for blob requests of the running event loop.
+
+    A new client is created when the loop changes (e.g. a new asyncio.run()).
+    """
+    global _async_client
+    loop = asyncio.get_running_loop()
+    if _async_client is None or _async_client[0] is not loop or _async_client[1].is_closed:
+        _async_client = (loop, httpx.AsyncClient(limits=BLOB_LIMITS, timeout=BLOB_TIMEOUT))
+    return _async_client[1]
+
+
+def _run_sync(func: Callable[..., Awaitable[T]], *args: Any) -> T:
+    """
+    Run an async storage function from sync code with a dedicated client.
+
+    asyncio.run() cannot be nested, so when called from a thread with a running
+    event loop the function runs in a worker thread instead (the caller blocks;
+    async code should await the *_async variant).
+    """
+    async def runner() -> T:
+        async with httpx.AsyncClient(limits=BLOB_LIMITS, timeout=BLOB_TIMEOUT) as client:
+            return await func(*args, client=client)
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(runner())
+    print(f"Warning: sync storage call {func.__name__} inside a running event loop, running it in a worker thread")
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(lambda: asyncio.run(runner())).result()
+
+
+async def _put_blob(
+    pathname: str,
+    content: bytes,
+    content_type: str,
+    client: Optional[httpx.AsyncClient] = None,
+    cache_max_age: Optional[int] = None,
+) -> bool:
+    """
+    Upload content to Vercel Blob Storage.
 
     Args:
         pathname: Path in blob storage (e.g. "reports/2025-01-15.json")
-        data: Data to save
+        content: Encoded content
+        content_type: MIME type
+        client: AsyncClient to use (default: shared pooled client)
+        cache_max_age: CDN cache lifetime in seconds for blobs that are overwritten
+            often (default: Vercel's default)
 
     Returns:
         bool: True if successful, False otherwise
     """
+    if not BLOB_TOKEN:
+        print("BLOB_READ_WRITE_TOKEN not found, falling back to local storage")
+        return False
+
+    # Upload to Blob Storage
+    # x-add-random-suffix: 0 = Use exact pathname without random hash
+    # x-allow-overwrite: 1 = Allow overwriting existing files (like local filesystem)
+    headers = {
+        "Authorization": f"Bearer {BLOB_TOKEN}",
+        "x-content-type": content_type,
+        "x-add-random-suffix": "0",
+        "x-allow-overwrite": "1",
+    }
+    if cache_max_age is not None:
+        headers["x-cache-control-max-age"] = str(cache_max_age)
+
+    client = client or _get_async_client()
+    response = await client.put(f"{BLOB_API_BASE}/{pathname}", content=content, headers=headers)
+    response.raise_for_status()
+
+    # Remember the blob URL for direct reads (the upload succeeded even if the body is unusable)
     try:
-        if not BLOB_TOKEN:
-            print("BLOB_READ_WRITE_TOKEN not found, falling back to local storage")
-            return False
+        url = response.json().get("url")
+    except (ValueError, AttributeError) as e:
+        print(f"Warning: uploaded {pathname}, but could not read the blob URL from the response: {e}")
+        url = None
+    if url:
+        _remember_blob_url(pathname, url)
+    return True
+
+
+async def _save_to_blob_async(
+    pathname: str,
+    data: Dict[str, Any],
+    client: Optional[httpx.AsyncClient] = None,
+    cache_max_age: Optional[int] = None,
+) -> bool:
+    """
+    Save data to Vercel Blob Storage.
 
-        # Prepare JSON content
-        content = json.dumps(data, indent=2, ensure_ascii=False)
-
-        # Upload to Blob Storage
-        # x-add-random-suffix: 0 = Use exact pathname without random hash
-        # x-allow-overwrite: 1 = Allow overwriting existing files (like local filesystem)
-        with httpx.Client() as client:
-            response = client.put(
-                f"{BLOB_API_BASE}/{pathname}",
-                content=content.encode('utf-8'),
-                headers={
-                    "Authorization": f"Bearer {BLOB_TOKEN}",
-                    "x-content-type": "application/json",
-                    "x-add-random-suffix": "0",
-                    "x-allow-overwrite": "1",
-                },
-                timeout=30.0
-            )
-            response.raise_for_status()
+    Args:
+        pathname: Path in blob storage (e.g. "reports/2025-01-15.json")
+        data: Data to save
+        client: AsyncClient to use (default: shared pooled client)
+        cache_max_age: CDN cache lifetime in seconds (see _put_blob())
 
-        return True
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    try:
+        # Prepare JSON content (archive files are stored as "<pathname>.gz" if compressed)
+        text = _serialize_json(data)
+        if _is_archive_pathname(pathname):
+            content, suffix = _encode_archive(text)
+        else:
+            content, suffix = text.encode('utf-8'), ""
+        content_type = "application/gzip" if suffix else "application/json"
+        success = await _put_blob(pathname + suffix, content, content_type, client, cache_max_age)
+        if success:
+            _remember_blob_variant(pathname, pathname + suffix)
+        return success
 
     except Exception as e:
         print(f"Error saving to Blob Storage: {e}")
         return False
 
 
+def _save_to_blob(pathname: str, data: Dict[str, Any]) -> bool:
+    """Sync wrapper of _save_to_blob_async() (e.g. for scripts/migrate_to_blob.py)."""
+    return _run_sync(_save_to_blob_async, pathname, data)
+
+
+def _write_local_json(file_path: Path, data: Dict[str, Any]) -> None:
+    """Write JSON to file_path (as "<file_path>.gz" if compressed), creating the directory."""
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    content, suffix = _encode_archive(_serialize_json(data))
+    file_path.with_name(file_path.name + suffix).write_bytes(content)
+
+
+def _read_local_json(file_path: Path) -> Optional[Dict[str, Any]]:
+    """Read JSON from file_path, preferring the compressed variant ("<file_path>.gz")."""
+    for candidate in (file_path.with_name(file_path.name + GZIP_SUFFIX), file_path):
+        if candidate.exists():
+            return json.loads(_read_local_archive(candidate))
+    return None
+
+
 def _save_to_local(date_str: str, data: Dict[str, Any]) -> bool:
     """
     Save data to local filesystem.
@@ -72,14 +432,8 @@ def _save_to_local(date_str: str, data: Dict[str, Any]) -> bool:
         bool: True if successful, False otherwise
     """
     try:
-        # Ensure reports directory exists
-        REPORTS_DIR.mkdir(exist_ok=True)
-
-        # Save to file
-        file_path = REPORTS_DIR / f"{date_str}.json"
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-
+        # Save to file ("YYYY-MM-DD.json.gz" if compressed)
+        _write_local_json(REPORTS_DIR / f"{date_str}.json", data)
         return True
 
     except Exception as e:
@@ -87,15 +441,17 @@ def _save_to_local(date_str: str, data: Dict[str, Any]) -> bool:
         return False
 
 
-def save_escalation_report(escalation_result: Dict[str, Any]) -> bool:
+async def save_escalation_report_async(escalation_result: Dict[str, Any], client: Optional[httpx.AsyncClient] = None) -> bool:
     """
-    Save escalation report to JSON file with format YYYY-MM-DD.json.
+    Save escalation report to JSON file with format YYYY-MM-DD.json
+    (YYYY-MM-DD.json.gz if COMPRESS_ARCHIVE is enabled).
     Storage backend determined by ENVIRONMENT variable:
     - "local" (or unset): Local filesystem
     - "dev" or "prod": Vercel Blob Storage with fallback to local
 
     Args:
         escalation_result: Result from calculate_escalation_score()
+        client: AsyncClient to use (default: shared pooled client)
 
     Returns:
         bool: True if successful, False otherwise
@@ -116,79 +472,396 @@ def save_escalation_report(escalation_result: Dict[str, Any]) -> bool:
         # Determine storage backend
         if ENVIRONMENT in ["dev", "prod"]:
             pathname = f"reports/{date_str}.json"
-            success = _save_to_blob(pathname, report_data)
+            success = await _save_to_blob_async(pathname, report_data, client)
 
             # Fallback to local if blob fails
             if not success:
                 print(f"Blob storage failed, falling back to local storage")
-                return _save_to_local(date_str, report_data)
-
-            return True
+                success = await asyncio.to_thread(_save_to_local, date_str, report_data)
         else:
             # Local storage
-            return _save_to_local(date_str, report_data)
+            success = await asyncio.to_thread(_save_to_local, date_str, report_data)
+
+        # Maintain the score history at write time (failures don't fail the report save)
+        if success:
+            _cache_report(date_str, report_data)
+            await update_score_history_async(report_data, client)
+
+        return success
 
     except Exception as e:
         print(f"Error saving escalation report: {e}")
         return False
 
-def _get_from_blob(pathname: str) -> Optional[Dict[str, Any]]:
+
+def save_escalation_report(escalation_result: Dict[str, Any]) -> bool:
+    """Sync wrapper of save_escalation_report_async()."""
+    return _run_sync(save_escalation_report_async, escalation_result)
+
+
+def _load_score_history() -> Dict[str, List[Any]]:
+    """
+    Read the stored score history table for an update.
+
+    Returns an empty table only if no history exists yet; a failed read raises,
+    so the caller doesn't overwrite the stored history with a table holding just one row.
     """
-    Get data from Vercel Blob Storage using List API with prefix filter.
+    data = None
+    if ENVIRONMENT in ["dev", "prod"]:
+        data = _read_blob_json(HISTORY_PATHNAME)
+    if data is None:
+        data = _read_local_json(HISTORY_DIR / Path(HISTORY_PATHNAME).name)
+    return normalize_table(data)
 
-    This function uses a 2-step process:
-    1. List blobs with pathname as prefix to find the download URL
-    2. Download the actual data using the returned URL
+
+async def save_score_history_async(table: Dict[str, List[Any]], client: Optional[httpx.AsyncClient] = None) -> bool:
+    """
+    Save the score history table and its manifest.
 
     Args:
-        pathname: Path in blob storage (e.g. "reports/2025-01-15.json")
+        table: Columnar table (see score_history.py)
+        client: AsyncClient to use (default: shared pooled client)
 
     Returns:
-        Dict with data or None if not found/error
+        bool: True if successful, False otherwise
+    """
+    document = to_document(table)
+    manifest = build_manifest(table, HISTORY_PATHNAME)
+
+    def save_local() -> bool:
+        try:
+            _write_local_json(HISTORY_DIR / Path(HISTORY_PATHNAME).name, document)
+            _write_local_json(HISTORY_DIR / Path(HISTORY_MANIFEST_PATHNAME).name, manifest)
+            return True
+        except Exception as e:
+            print(f"Error saving score history to local storage: {e}")
+            return False
+
+    if ENVIRONMENT in ["dev", "prod"]:
+        # Table first: a manifest must never describe a table that wasn't written
+        if await _save_to_blob_async(HISTORY_PATHNAME, document, client, MUTABLE_BLOB_MAX_AGE):
+            if await _save_to_blob_async(HISTORY_MANIFEST_PATHNAME, manifest, client, MUTABLE_BLOB_MAX_AGE):
+                return True
+        print(f"Blob storage failed, falling back to local storage")
+
+    return await asyncio.to_thread(save_local)
+
+
+async def update_score_history_async(report_data: Dict[str, Any], client: Optional[httpx.AsyncClient] = None) -> bool:
+    """
+    Insert (or replace) the row of a saved report in the score history.
+
+    Args:
+        report_data: Stored report ({"date", "timestamp", "escalation_result"})
+        client: AsyncClient to use (default: shared pooled client)
+
+    Returns:
+        bool: True if successful or nothing to record, False otherwise
     """
     try:
-        if not BLOB_TOKEN:
-            print("BLOB_READ_WRITE_TOKEN not found, falling back to local storage")
+        row = report_to_row(report_data)
+        if row is None:
+            return True  # Failed runs have no scores
+
+        try:
+            table = await asyncio.to_thread(_load_score_history)
+        except Exception as e:
+            # Keep the stored history; scripts/rebuild_score_history.py can add the row later
+            print(f"Error reading score history, not updating it: {e}")
+            return False
+        upsert_row(table, row)
+        return await save_score_history_async(table, client)
+
+    except Exception as e:
+        print(f"Error updating score history: {e}")
+        return False
+
+
+def get_score_history(start: Optional[str] = None, end: Optional[str] = None) -> Dict[str, List[Any]]:
+    """
+    Get score history rows in a date range with a single read.
+
+    Args:
+        start: First date (YYYY-MM-DD, inclusive; None = from the beginning)
+        end: Last date (YYYY-MM-DD, inclusive; None = until the end)
+
+    Returns:
+        Columnar dict (date, score, calculated_score, military, diplomatic,
+        economic, societal, russians, level), each a list sorted by date
+    """
+    try:
+        return select_range(_load_score_history(), start, end)
+    except Exception as e:
+        print(f"Error reading score history: {e}")
+        return normalize_table(None)
+
+
+def get_score_history_manifest() -> Optional[Dict[str, Any]]:
+    """Get the score history manifest (rows, first/last date, etag) or None if not found."""
+    try:
+        data = None
+        if ENVIRONMENT in ["dev", "prod"]:
+            data = _get_from_blob(HISTORY_MANIFEST_PATHNAME)
+        if data is None:
+            data = _read_local_json(HISTORY_DIR / Path(HISTORY_MANIFEST_PATHNAME).name)
+        return data
+    except Exception as e:
+        print(f"Error reading score history manifest: {e}")
+        return None
+
+async def save_dashboard_snapshot_async(snapshot: Dict[str, Any], client: Optional[httpx.AsyncClient] = None) -> bool:
+    """
+    Save a pre-rendered dashboard snapshot (dashboard/YYYY-MM-DD.json).
+
+    Args:
+        snapshot: Snapshot from dashboard.build_dashboard_snapshot()
+        client: AsyncClient to use (default: shared pooled client)
+
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    date_str = snapshot["date"]
+
+    def save_local() -> bool:
+        try:
+            _write_local_json(DASHBOARD_SNAPSHOT_DIR / f"{date_str}.json", snapshot)
+            return True
+        except Exception as e:
+            print(f"Error saving dashboard snapshot to local storage: {e}")
+            return False
+
+    if ENVIRONMENT in ["dev", "prod"]:
+        if await _save_to_blob_async(f"dashboard/{date_str}.json", snapshot, client):
+            return True
+        print(f"Blob storage failed, falling back to local storage")
+
+    return await asyncio.to_thread(save_local)
+
+
+def get_dashboard_snapshot(date: str) -> Optional[Dict[str, Any]]:
+    """Get the pre-rendered dashboard snapshot of a report date or None if not found."""
+    try:
+        data = None
+        if ENVIRONMENT in ["dev", "prod"]:
+            data = _get_from_blob(f"dashboard/{date}.json")
+        if data is None:
+            data = _read_local_json(DASHBOARD_SNAPSHOT_DIR / f"{date}.json")
+        return data
+    except Exception as e:
+        print(f"Error reading dashboard snapshot for date {date}: {e}")
+        return None
+
+
+async def save_run_status_async(run: Dict[str, Any], client: Optional[httpx.AsyncClient] = None) -> bool:
+    """
+    Save the status of a pipeline run (runs/<run_id>.json).
+
+    Args:
+        run: Run status from run_status.RunTracker
+        client: AsyncClient to use (default: shared pooled client)
+
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    run_id = run["run_id"]
+
+    def save_local() -> bool:
+        try:
+            _write_local_json(RUNS_DIR / f"{run_id}.json", run)
+            return True
+        except Exception as e:
+            print(f"Error saving run status to local storage: {e}")
+            return False
+
+    if ENVIRONMENT in ["dev", "prod"]:
+        if await _save_to_blob_async(f"runs/{run_id}.json", run, client, MUTABLE_BLOB_MAX_AGE):
+            return True
+        print(f"Blob storage failed, falling back to local storage")
+
+    return await asyncio.to_thread(save_local)
+
+
+def save_run_status(run: Dict[str, Any]) -> bool:
+    """Sync wrapper of save_run_status_async()."""
+    return _run_sync(save_run_status_async, run)
+
+
+async def save_latest_run_id_async(run_id: str, client: Optional[httpx.AsyncClient] = None) -> bool:
+    """
+    Point runs/latest.json at a newly queued run (lets get_run_status() find it without listing runs/).
+
+    Args:
+        run_id: Run id
+        client: AsyncClient to use (default: shared pooled client)
+
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    pointer = {"run_id": run_id}
+
+    def save_local() -> bool:
+        try:
+            _write_local_json(RUNS_DIR / Path(LATEST_RUN_PATHNAME).name, pointer)
+            return True
+        except Exception as e:
+            print(f"Error saving latest run pointer to local storage: {e}")
+            return False
+
+    if ENVIRONMENT in ["dev", "prod"]:
+        if await _save_to_blob_async(LATEST_RUN_PATHNAME, pointer, client, MUTABLE_BLOB_MAX_AGE):
+            return True
+        print(f"Blob storage failed, falling back to local storage")
+
+    return await asyncio.to_thread(save_local)
+
+
+def save_latest_run_id(run_id: str) -> bool:
+    """Sync wrapper of save_latest_run_id_async()."""
+    return _run_sync(save_latest_run_id_async, run_id)
+
+
+def _latest_run_id() -> Optional[str]:
+    """Id of the newest run from the runs/latest.json pointer (None if no run was queued yet)."""
+    data = None
+    if ENVIRONMENT in ["dev", "prod"]:
+        data = _get_from_blob(LATEST_RUN_PATHNAME)
+    if data is None:
+        data = _read_local_json(RUNS_DIR / Path(LATEST_RUN_PATHNAME).name)
+    return data.get("run_id") if data else None
+
+
+def get_run_status(run_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """
+    Get the status of a pipeline run.
+
+    Args:
+        run_id: Run id (None = latest run)
+
+    Returns:
+        Dict with run status or None if not found/error
+    """
+    try:
+        run_id = run_id or _latest_run_id()
+        if not run_id:
             return None
 
-        with httpx.Client() as client:
-            # Step 1: List blobs with prefix (without .json extension for broader match)
-            prefix = pathname.replace('.json', '')
-
-            list_response = client.get(
-                f"{BLOB_API_BASE}/",
-                params={"prefix": prefix},
-                headers={
-                    "Authorization": f"Bearer {BLOB_TOKEN}",
-                },
-                timeout=30.0
-            )
-
-            if list_response.status_code == 404:
-                return None
-
-            list_response.raise_for_status()
-            list_data = list_response.json()
-
-            # Step 2: Find matching blob
-            blobs = list_data.get('blobs', [])
-            if not blobs:
-                return None
-
-            # Use first match (should be exactly one with our naming scheme)
-            blob = blobs[0]
-            download_url = blob['url']
-
-            # Step 3: Download actual data using the blob's URL
-            data_response = client.get(download_url, timeout=30.0)
-            data_response.raise_for_status()
-            return data_response.json()
-
-    except httpx.HTTPStatusError as e:
-        if e.response.status_code == 404:
+        data = None
+        if ENVIRONMENT in ["dev", "prod"]:
+            data = _get_from_blob(f"runs/{run_id}.json")
+        if data is None:
+            data = _read_local_json(RUNS_DIR / f"{run_id}.json")
+        return data
+    except Exception as e:
+        print(f"Error reading run status {run_id}: {e}")
+        return None
+
+
+def _list_blobs(client: httpx.Client, prefix: str) -> List[Dict[str, Any]]:
+    """List all blobs below prefix (follows the List API cursor)."""
+    blobs = []
+    cursor = None
+    while True:
+        params = {"prefix": prefix, "limit": 1000}
+        if cursor:
+            params["cursor"] = cursor
+        response = client.get(
+            f"{BLOB_API_BASE}/",
+            params=params,
+            headers={"Authorization": f"Bearer {BLOB_TOKEN}"},
+            timeout=BLOB_TIMEOUT,
+        )
+        response.raise_for_status()
+        data = response.json()
+        blobs.extend(data.get('blobs', []))
+        cursor = data.get('cursor')
+        if not data.get('hasMore') or not cursor:
+            return blobs
+
+
+def _list_blob_url(client: httpx.Client, pathname: str) -> Optional[str]:
+    """Find the URL of the blob with exactly this pathname via the List API."""
+    list_response = client.get(
+        f"{BLOB_API_BASE}/",
+        params={"prefix": pathname},
+        headers={
+            "Authorization": f"Bearer {BLOB_TOKEN}",
+        },
+        timeout=BLOB_TIMEOUT
+    )
+
+    if list_response.status_code == 404:
+        return None
+
+    list_response.raise_for_status()
+
+    # Exact match only (the prefix also matches e.g. "reports/2025-01-15.json.bak")
+    for blob in list_response.json().get('blobs', []):
+        if blob.get('pathname') == pathname:
+            _remember_blob_url(pathname, blob['url'])
+            return blob['url']
+    return None
+
+
+def _fetch_blob_text(client: httpx.Client, pathname: str) -> Optional[str]:
+    """Download one blob (decompressed on the fly); None if it does not exist."""
+    download_url = _blob_url(pathname) or _list_blob_url(client, pathname)
+    if not download_url:
+        return None
+
+    with client.stream("GET", download_url, timeout=BLOB_TIMEOUT) as data_response:
+        if data_response.status_code == 404:
             return None
-        print(f"Error getting from Blob Storage: {e}")
+        data_response.raise_for_status()
+        return _read_archive(data_response.iter_bytes(STREAM_CHUNK_SIZE))
+
+
+def _read_blob_json(pathname: str) -> Optional[Dict[str, Any]]:
+    """
+    Read JSON from Vercel Blob Storage; unlike _get_from_blob(), read errors raise.
+
+    GETs the variants of _blob_variants() on their public URLs until one
+    exists, starting with the variant recorded in the manifest (on upload or an
+    earlier read). A blob written by the current version is a single GET.
+
+    Args:
+        pathname: Path in blob storage (e.g. "reports/2025-01-15.json")
+
+    Returns:
+        Dict with data, or None if the blob does not exist (or no token is configured)
+    """
+    if not BLOB_TOKEN:
+        print("BLOB_READ_WRITE_TOKEN not found, falling back to local storage")
         return None
+
+    candidates = _blob_variants(pathname)
+    known = _known_blob_variant(pathname)
+    if known in candidates:
+        candidates.remove(known)
+        candidates.insert(0, known)
+
+    with httpx.Client() as client:
+        for stored in candidates:
+            text = _fetch_blob_text(client, stored)
+            if text is not None:
+                _remember_blob_variant(pathname, stored)
+                return json.loads(text)
+
+    _remember_blob_variant(pathname, None)
+    return None
+
+
+def _get_from_blob(pathname: str) -> Optional[Dict[str, Any]]:
+    """
+    Get data from Vercel Blob Storage (see _read_blob_json()).
+
+    Args:
+        pathname: Path in blob storage (e.g. "reports/2025-01-15.json")
+
+    Returns:
+        Dict with data or None if not found/error
+    """
+    try:
+        return _read_blob_json(pathname)
     except Exception as e:
         print(f"Error getting from Blob Storage: {e}")
         return None
@@ -205,13 +878,7 @@ def _get_from_local(date_str: str) -> Optional[Dict[str, Any]]:
         Dict with data or None if not found/error
     """
     try:
-        file_path = REPORTS_DIR / f"{date_str}.json"
-
-        if not file_path.exists():
-            return None
-
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return _read_local_json(REPORTS_DIR / f"{date_str}.json")
 
     except Exception as e:
         print(f"Error reading from local storage: {e}")
@@ -266,9 +933,118 @@ def get_today_report() -> Optional[Dict[str, Any]]:
     """
     return get_latest_report(max_days_back=7)
 
+def _is_past_date(date: str) -> bool:
+    return date < datetime.now(timezone.utc).strftime("%Y-%m-%d")
+
+
+def _cache_report(date: str, report: Optional[Dict[str, Any]]) -> None:
+    """Store a report in the memory cache (LRU eviction) and past reports on disk."""
+    with _report_cache_lock:
+        _report_cache[date] = (report, time.monotonic())
+        _report_cache.move_to_end(date)
+        while len(_report_cache) > REPORT_CACHE_SIZE:
+            _report_cache.popitem(last=False)
+
+    if REPORT_CACHE_DIR and report is not None and _is_past_date(date):
+        try:
+            _write_local_json(REPORT_CACHE_DIR / f"{date}.json", report)
+        except Exception as e:
+            print(f"Error writing report cache: {e}")
+
+
+def _cached_report(date: str) -> Tuple[bool, Optional[Dict[str, Any]]]:
+    """
+    Look up a report in the memory cache, then the disk cache.
+
+    Returns:
+        Tuple of (hit, report); today's entries and misses only hit within REPORT_CACHE_TTL
+    """
+    with _report_cache_lock:
+        entry = _report_cache.get(date)
+        if entry is not None:
+            report, fetched_at = entry
+            if (report is not None and _is_past_date(date)) or time.monotonic() - fetched_at < REPORT_CACHE_TTL:
+                _report_cache.move_to_end(date)
+                return True, report
+
+    if REPORT_CACHE_DIR and _is_past_date(date):
+        try:
+            report = _read_local_json(REPORT_CACHE_DIR / f"{date}.json")
+        except Exception as e:
+            print(f"Error reading report cache: {e}")
+            report = None
+        if report is not None:
+            _cache_report(date, report)
+            return True, report
+
+    return False, None
+
+
+def _single_flight(key: str, fetch: Callable[[], Optional[Dict[str, Any]]]) -> Optional[Dict[str, Any]]:
+    """Run fetch() once for concurrent callers with the same key; the others wait for its result."""
+    with _report_cache_lock:
+        flight = _report_fetches.get(key)
+        leader = flight is None
+        if leader:
+            flight = _report_fetches[key] = _Flight()
+
+    if not leader:
+        flight.done.wait()
+        return flight.result
+
+    try:
+        flight.result = fetch()
+    finally:
+        with _report_cache_lock:
+            del _report_fetches[key]
+        flight.done.set()
+    return flight.result
+
+
+def clear_report_cache() -> None:
+    """Drop all in-memory cached reports (the disk cache only holds immutable past reports)."""
+    with _report_cache_lock:
+        _report_cache.clear()
+
+
 def get_report_by_date(date: str) -> Optional[Dict[str, Any]]:
     """
-    Get escalation report for specific date.
+    Get escalation report for specific date (cached).
+
+    Past reports are cached without expiry (in memory and, if REPORT_CACHE_DIR
+    is set, on disk). Today's report is refetched after REPORT_CACHE_TTL; if
+    its timestamp is unchanged, the cached object is kept. Concurrent misses
+    for the same date share a single storage fetch.
+
+    Args:
+        date: Date string in format YYYY-MM-DD
+
+    Returns:
+        Dict with report data (a shallow copy, callers may add keys) or None if not found/error
+    """
+    hit, report = _cached_report(date)
+    if not hit:
+        report = _single_flight(date, lambda: _revalidate_report(date))
+    return dict(report) if report is not None else None
+
+
+def _revalidate_report(date: str) -> Optional[Dict[str, Any]]:
+    """Fetch a report from storage and update the cache (keeping the cached object if unchanged)."""
+    report = _fetch_report_by_date(date)
+
+    with _report_cache_lock:
+        entry = _report_cache.get(date)
+    if entry is not None and entry[0] is not None and report is not None \
+            and entry[0].get("timestamp") == report.get("timestamp"):
+        report = entry[0]
+
+    _cache_report(date, report)
+    return report
+
+
+def _fetch_report_by_date(date: str) -> Optional[Dict[str, Any]]:
+    """
+    Get escalation report for specific date from storage (uncached).
     Storage backend determined by ENVIRONMENT variable:
     - "local" (or unset): Local filesystem
     - "dev" or "prod": Vercel Blob Storage with fallback to local
@@ -299,46 +1075,37 @@ def get_report_by_date(date: str) -> Optional[Dict[str, Any]]:
         return None
 
 
-def _save_markdown_to_blob(pathname: str, content: str) -> bool:
+async def _save_markdown_to_blob_async(pathname: str, content: str, client: Optional[httpx.AsyncClient] = None) -> bool:
     """
     Save markdown content to Vercel Blob Storage.
 
     Args:
         pathname: Path in blob storage (e.g. "feeds/2025-01-15.md")
         content: Markdown content as string
+        client: AsyncClient to use (default: shared pooled client)
 
     Returns:
         bool: True if successful, False otherwise
     """
     try:
-        if not BLOB_TOKEN:
-            print("BLOB_READ_WRITE_TOKEN not found, falling back to local storage")
-            return False
-
-        # Upload to Blob Storage as plain text
-        # x-add-random-suffix: 0 = Use exact pathname without random hash
-        # x-allow-overwrite: 1 = Allow overwriting existing files
-        with httpx.Client() as client:
-            response = client.put(
-                f"{BLOB_API_BASE}/{pathname}",
-                content=content.encode('utf-8'),
-                headers={
-                    "Authorization": f"Bearer {BLOB_TOKEN}",
-                    "x-content-type": "text/plain",
-                    "x-add-random-suffix": "0",
-                    "x-allow-overwrite": "1",
-                },
-                timeout=30.0
-            )
-            response.raise_for_status()
-
-        return True
+        # Upload to Blob Storage as plain text (stored as "<pathname>.gz" if compressed)
+        encoded, suffix = _encode_archive(content)
+        content_type = "application/gzip" if suffix else "text/plain"
+        success = await _put_blob(pathname + suffix, encoded, content_type, client)
+        if success:
+            _remember_blob_variant(pathname, pathname + suffix)
+        return success
 
     except Exception as e:
         print(f"Error saving markdown to Blob Storage: {e}")
         return False
 
 
+def _save_markdown_to_blob(pathname: str, content: str) -> bool:
+    """Sync wrapper of _save_markdown_to_blob_async()."""
+    return _run_sync(_save_markdown_to_blob_async, pathname, content)
+
+
 def _save_markdown_to_local(date_str: str, content: str) -> bool:
     """
     Save markdown content to local filesystem.
@@ -354,10 +1121,10 @@ def _save_markdown_to_local(date_str: str, content: str) -> bool:
         # Ensure feeds-markdown directory exists
         FEEDS_MARKDOWN_DIR.mkdir(exist_ok=True)
 
-        # Save to file
-        file_path = FEEDS_MARKDOWN_DIR / f"{date_str}.md"
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        # Save to file ("YYYY-MM-DD.md.gz" if compressed)
+        encoded, suffix = _encode_archive(content)
+        file_path = FEEDS_MARKDOWN_DIR / f"{date_str}.md{suffix}"
+        file_path.write_bytes(encoded)
 
         return True
 
@@ -366,15 +1133,17 @@ def _save_markdown_to_local(date_str: str, content: str) -> bool:
         return False
 
 
-def save_feed_markdown(markdown_content: str) -> bool:
+async def save_feed_markdown_async(markdown_content: str, client: Optional[httpx.AsyncClient] = None) -> bool:
     """
-    Save feed markdown to file with format YYYY-MM-DD.md.
+    Save feed markdown to file with format YYYY-MM-DD.md
+    (YYYY-MM-DD.md.gz if COMPRESS_ARCHIVE is enabled).
     Storage backend determined by ENVIRONMENT variable:
     - "local" (or unset): Local filesystem
     - "dev" or "prod": Vercel Blob Storage with fallback to local
 
     Args:
         markdown_content: Markdown content as string
+        client: AsyncClient to use (default: shared pooled client)
 
     Returns:
         bool: True if successful, False otherwise
@@ -387,18 +1156,23 @@ def save_feed_markdown(markdown_content: str) -> bool:
         # Determine storage backend
         if ENVIRONMENT in ["dev", "prod"]:
             pathname = f"feeds/{date_str}.md"
-            success = _save_markdown_to_blob(pathname, markdown_content)
+            success = await _save_markdown_to_blob_async(pathname, markdown_content, client)
 
             # Fallback to local if blob fails
             if not success:
                 print(f"Blob storage failed, falling back to local storage")
-                return _save_markdown_to_local(date_str, markdown_content)
+                return await asyncio.to_thread(_save_markdown_to_local, date_str, markdown_content)
 
             return True
         else:
             # Local storage
-            return _save_markdown_to_local(date_str, markdown_content)
+            return await asyncio.to_thread(_save_markdown_to_local, date_str, markdown_content)
 
     except Exception as e:
         print(f"Error saving feed markdown: {e}")
-        return False
\ No newline at end of file
+        return False
+
+
+def save_feed_markdown(markdown_content: str) -> bool:
+    """Sync wrapper of save_feed_markdown_async()."""
+    return _run_sync(save_feed_markdown_async, markdown_content)
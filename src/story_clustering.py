@@ -0,0 +1,164 @@
+# src/story_clustering.py
+"""Cluster feed items from all sources into stories (same URL, TF-IDF similarity, shared named entities)."""
+from __future__ import annotations
+import math
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+try:
+    from .feeds.base import FeedItem
+    from .feeds.tfidf import tokenize, compute_idf, tfidf_vector, cosine_similarity
+    from .feeds.tagging import find_entities
+except ImportError:
+    from feeds.base import FeedItem
+    from feeds.tfidf import tokenize, compute_idf, tfidf_vector, cosine_similarity
+    from feeds.tagging import find_entities
+
+# Min cosine similarity between an item and a story centroid to join the story
+# (bag-of-words, so this only groups items in the same language)
+SIMILARITY_THRESHOLD = 0.35
+
+# Cross-language matching on named entities (feeds/tagging.py ENTITY_LEXICON): an item
+# joins a story if they share at least ENTITY_MIN_SHARED entities, covering at least
+# ENTITY_MIN_OVERLAP of the smaller entity set, within ENTITY_WINDOW of the story's items
+ENTITY_MIN_SHARED = 2
+ENTITY_MIN_OVERLAP = 0.5
+ENTITY_WINDOW = timedelta(hours=48)
+
+
+def normalize_url(url: str) -> str:
+    """URL without scheme, www., query, fragment and trailing slash ("" if empty)."""
+    url = re.sub(r"^https?://(www\.)?", "", (url or "").strip().lower())
+    return re.split(r"[?#]", url)[0].rstrip("/")
+
+
+@dataclass
+class Story:
+    """Group of items (from one or more feeds) covering the same event."""
+    items: List[Tuple[str, FeedItem]] = field(default_factory=list)  # (source_name, item)
+    lead_index: int = 0  # Index of the most informative item
+    lead_weight: float = -1.0
+    centroid: Dict[str, float] = field(default_factory=dict)  # Unnormalized sum of item vectors
+    centroid_norm: float = 0.0  # L2 norm of centroid, kept up to date by add()
+    entities: Counter = field(default_factory=Counter)  # Entity -> number of items mentioning it
+    oldest_date: Optional[Any] = None
+
+    @property
+    def lead(self) -> Tuple[str, FeedItem]:
+        return self.items[self.lead_index]
+
+    @property
+    def sources(self) -> List[str]:
+        """Distinct source names in order of appearance."""
+        return list(dict.fromkeys(source for source, _ in self.items))
+
+    @property
+    def latest_date(self):
+        return max(item.date for _, item in self.items)
+
+    def add(self, source_name: str, item: FeedItem, vector: Dict[str, float], weight: float,
+            entities: Set[str] = frozenset()) -> None:
+        self.items.append((source_name, item))
+        # Update the squared norm with the changed terms only
+        squared_norm = self.centroid_norm ** 2
+        for term, w in vector.items():
+            old = self.centroid.get(term, 0.0)
+            self.centroid[term] = old + w
+            squared_norm += (old + w) ** 2 - old ** 2
+        self.centroid_norm = math.sqrt(max(squared_norm, 0.0))
+        self.entities.update(entities)
+        if self.oldest_date is None or item.date < self.oldest_date:
+            self.oldest_date = item.date
+        if weight > self.lead_weight:
+            self.lead_index = len(self.items) - 1
+            self.lead_weight = weight
+
+    def similarity(self, vector: Dict[str, float]) -> float:
+        """Cosine similarity between a normalized item vector and the centroid."""
+        if self.centroid_norm == 0:
+            return 0.0
+        return cosine_similarity(vector, self.centroid) / self.centroid_norm
+
+    def entity_overlap(self, entities: Set[str]) -> float:
+        """Share of the smaller entity set that both have (0.0 below ENTITY_MIN_SHARED shared entities)."""
+        shared = sum(1 for entity in entities if entity in self.entities)
+        if shared < ENTITY_MIN_SHARED:
+            return 0.0
+        return shared / min(len(entities), len(self.entities))
+
+
+def cluster_stories(results: List[Dict[str, Any]], threshold: float = SIMILARITY_THRESHOLD) -> List[Story]:
+    """
+    Cluster items of all successful feeds into stories.
+
+    Single pass: an item linking the same URL as an item of an existing story
+    joins that story; otherwise it joins the most similar story centroid if the
+    cosine similarity reaches the threshold (same language). Failing that, it
+    joins the story sharing the most named entities within ENTITY_WINDOW, so
+    DE/EN/RU coverage of one event ends up in one story; else it starts a new
+    story. The lead item of a story is the one with the highest total TF-IDF
+    weight (most informative text).
+
+    Args:
+        results: Feed results from process_all_feeds()
+        threshold: Min cosine similarity to join an existing story
+
+    Returns:
+        Stories sorted by number of sources, then newest first
+    """
+    entries = [
+        (feed_result["source_name"], item)
+        for feed_result in results
+        if feed_result["result"] == "ok"
+        for item in feed_result["items"]
+    ]
+    if not entries:
+        return []
+
+    tokenized = [tokenize(item.text) for _, item in entries]
+    entity_sets = [find_entities(item.original_text or item.text) for _, item in entries]
+    idf = compute_idf(tokenized)
+
+    # Newest items first, so stories grow from the most recent coverage
+    order = sorted(range(len(entries)), key=lambda i: entries[i][1].date, reverse=True)
+
+    stories: List[Story] = []
+    stories_by_url: Dict[str, Story] = {}
+    for i in order:
+        source_name, item = entries[i]
+        vector = tfidf_vector(tokenized[i], idf)
+        weight = sum(idf.get(term, 1.0) for term in set(tokenized[i]))
+        url = normalize_url(item.url)
+
+        best_story = stories_by_url.get(url) if url else None
+        best_similarity = threshold
+        if best_story is None and vector:
+            for story in stories:
+                similarity = story.similarity(vector)
+                if similarity >= best_similarity:
+                    best_story = story
+                    best_similarity = similarity
+
+        entities = entity_sets[i]
+        if best_story is None and len(entities) >= ENTITY_MIN_SHARED:
+            best_overlap = ENTITY_MIN_OVERLAP
+            for story in stories:
+                if story.oldest_date - item.date > ENTITY_WINDOW:
+                    continue
+                overlap = story.entity_overlap(entities)
+                if overlap >= best_overlap:
+                    best_story = story
+                    best_overlap = overlap
+
+        if best_story is None:
+            best_story = Story()
+            stories.append(best_story)
+        best_story.add(source_name, item, vector, weight, entities)
+        if url:
+            stories_by_url.setdefault(url, best_story)
+
+    stories.sort(key=lambda s: (len(s.sources), s.latest_date), reverse=True)
+    return stories
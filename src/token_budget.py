@@ -0,0 +1,147 @@
+# src/token_budget.py
+"""Token accounting and per-agent budgets for feed data embedded in agent prompts."""
+from __future__ import annotations
+import os
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+try:
+    from .feeds.base import FeedItem
+    from .feeds.tokens import estimate_tokens
+except ImportError:
+    from feeds.base import FeedItem
+    from feeds.tokens import estimate_tokens
+
+# Default budget for the feed section of each agent prompt (approx. tokens)
+DEFAULT_AGENT_TOKEN_BUDGET = int(os.getenv("AGENT_TOKEN_BUDGET", "15000"))
+
+AGENT_TOKEN_BUDGETS: Dict[str, int] = {
+    "military": DEFAULT_AGENT_TOKEN_BUDGET,
+    "diplomatic": DEFAULT_AGENT_TOKEN_BUDGET,
+    "economic": DEFAULT_AGENT_TOKEN_BUDGET,
+    "societal": DEFAULT_AGENT_TOKEN_BUDGET,
+    "russians": DEFAULT_AGENT_TOKEN_BUDGET,
+    "review": DEFAULT_AGENT_TOKEN_BUDGET,
+}
+
+# Item tags (see feeds/tagging.py) that make an item more relevant for an agent.
+# Used to rank items when trimming to the budget.
+AGENT_RELEVANT_TAGS: Dict[str, frozenset] = {
+    "military": frozenset({"military_activity", "mobilization", "nuclear", "weapons", "nato", "baltics", "ukraine"}),
+    "diplomatic": frozenset({"diplomacy", "nato", "eu", "russia", "belarus", "ukraine"}),
+    "economic": frozenset({"sanctions", "energy", "eu", "russia"}),
+    "societal": frozenset({"civil_defense", "mobilization", "hybrid", "border"}),
+    "russians": frozenset({"russia", "border", "sanctions", "diplomacy"}),
+    "review": frozenset(),
+}
+
+# Approx. tokens for the per-feed header lines in the markdown (name, item count, date)
+FEED_OVERHEAD_TOKENS = 30
+
+
+def estimate_item_tokens(item: FeedItem) -> int:
+    """Estimate tokens of an item as rendered in the feed markdown."""
+    date_str = item.date.strftime("%Y-%m-%d %H:%M UTC")
+    return estimate_tokens(f"1. **{date_str}** - {item.text}")
+
+
+def estimate_feed_tokens(results: List[Dict[str, Any]]) -> Dict[str, Dict[str, int]]:
+    """
+    Estimate tokens per feed.
+
+    Args:
+        results: Feed results from process_all_feeds()
+
+    Returns:
+        Dict mapping source_name to {"items": count, "tokens": estimate}
+    """
+    feed_tokens = {}
+    for feed_result in results:
+        items = feed_result.get("items", [])
+        feed_tokens[feed_result["source_name"]] = {
+            "items": len(items),
+            "tokens": FEED_OVERHEAD_TOKENS + sum(estimate_item_tokens(item) for item in items),
+        }
+    return feed_tokens
+
+
+def tag_relevance(relevant_tags: frozenset) -> Optional[Callable[[FeedItem], float]]:
+    """Relevance function counting an item's tags in relevant_tags (None if no tags given)."""
+    if not relevant_tags:
+        return None
+    return lambda item: float(len(relevant_tags.intersection(item.tags)))
+
+
+def apply_token_budget(
+    results: List[Dict[str, Any]],
+    budget: int,
+    relevance: Optional[Callable[[FeedItem], float]] = None,
+) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Trim feed items so the rendered feed markdown fits into a token budget.
+
+    Items are ranked by relevance (if given), then newest first; the best-ranked
+    items are kept until the budget is used up. The original order within each
+    feed is preserved.
+
+    Args:
+        results: Feed results from process_all_feeds()
+        budget: Max approx. tokens for all feed sections
+        relevance: Optional item relevance function (higher = more relevant)
+
+    Returns:
+        Tuple of (trimmed feed results, trimming report)
+    """
+    ok_results = [r for r in results if r["result"] == "ok"]
+    used_tokens = FEED_OVERHEAD_TOKENS * len(ok_results)
+
+    # Collect (feed index, item index, item, tokens) for all items
+    candidates = []
+    for feed_idx, feed_result in enumerate(results):
+        if feed_result["result"] != "ok":
+            continue
+        for item_idx, item in enumerate(feed_result["items"]):
+            candidates.append((feed_idx, item_idx, item, estimate_item_tokens(item)))
+
+    tokens_before = used_tokens + sum(c[3] for c in candidates)
+
+    # Rank: most relevant first, then newest, then feed order
+    candidates.sort(key=lambda c: (
+        -(relevance(c[2]) if relevance else 0.0),
+        -c[2].date.timestamp(),
+        c[1],
+    ))
+
+    kept = set()
+    for feed_idx, item_idx, item, tokens in candidates:
+        if used_tokens + tokens <= budget:
+            kept.add((feed_idx, item_idx))
+            used_tokens += tokens
+
+    trimmed_results = []
+    dropped = {}
+    for feed_idx, feed_result in enumerate(results):
+        if feed_result["result"] != "ok":
+            trimmed_results.append(feed_result)
+            continue
+
+        items = feed_result["items"]
+        kept_items = [item for i, item in enumerate(items) if (feed_idx, i) in kept]
+        dropped_items = [item for i, item in enumerate(items) if (feed_idx, i) not in kept]
+        if dropped_items:
+            dropped[feed_result["source_name"]] = {
+                "count": len(dropped_items),
+                "urls": [item.url for item in dropped_items],
+            }
+
+        trimmed_results.append({**feed_result, "items": kept_items})
+
+    report = {
+        "budget": budget,
+        "tokens_before": tokens_before,
+        "tokens_after": used_tokens,
+        "items_before": len(candidates),
+        "items_after": len(kept),
+        "dropped": dropped,
+    }
+
+    return trimmed_results, report
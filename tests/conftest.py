@@ -0,0 +1,11 @@
+# tests/conftest.py
+"""Shared test setup: import the app as the `src` package from the repository root."""
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# Never touch Vercel Blob Storage from tests
+os.environ["ENVIRONMENT"] = "local"
+os.environ.pop("BLOB_READ_WRITE_TOKEN", None)
@@ -0,0 +1,59 @@
+# tests/test_change_detection.py
+import datetime as dt
+
+from src.change_detection import compute_fingerprints, detect_changes, filter_new_items
+from src.feeds.base import FeedItem
+
+
+def item(text, tags=()):
+    return FeedItem(date=dt.datetime(2025, 10, 15, tzinfo=dt.timezone.utc), text=text,
+                    url=f"https://example.com/{abs(hash(text))}", tags=list(tags))
+
+
+def feeds(*items):
+    return [{"source_name": "Test", "result": "ok", "items": list(items)}]
+
+
+def report(results, result="ok", age_days=0):
+    return {
+        "date": "2025-10-14",
+        "age_days": age_days,
+        "escalation_result": {"result": result, "run_metadata": {"feed_fingerprints": compute_fingerprints(results)}},
+    }
+
+
+OLD_ITEMS = [item(f"Meldung {i}", ["sanctions"]) for i in range(10)]
+
+
+def test_quiet_day_takes_the_fast_path():
+    today = feeds(*OLD_ITEMS, item("Neue Meldung"))  # Untagged: weight 1 of 21
+
+    change_report = detect_changes(today, report(feeds(*OLD_ITEMS)))
+
+    assert change_report["fast_path"] is True
+    assert change_report["new_items"] == 1
+    assert change_report["affected_agents"] == []
+
+
+def test_new_items_of_one_dimension_mark_that_agent_affected():
+    today = feeds(*OLD_ITEMS, item("Truppenverlegung", ["military_activity"]))
+
+    change_report = detect_changes(today, report(feeds(*OLD_ITEMS)))
+
+    assert change_report["fast_path"] is True
+    assert change_report["affected_agents"] == ["military"]
+
+
+def test_full_run_after_a_failed_or_old_previous_report():
+    previous = feeds(*OLD_ITEMS)
+
+    assert detect_changes(previous, report(previous, result="error"))["full_run_reason"] == "previous run failed"
+    assert detect_changes(previous, report(previous, age_days=3))["fast_path"] is False
+    assert detect_changes(previous, None)["full_run_reason"] == "no previous fingerprints"
+
+
+def test_filter_new_items_keeps_only_unseen_items():
+    new = item("Neue Meldung")
+    previous = compute_fingerprints(feeds(*OLD_ITEMS))
+
+    assert filter_new_items(feeds(*OLD_ITEMS, new), previous)[0]["items"] == [new]
@@ -0,0 +1,18 @@
+# tests/test_imports.py
+import subprocess
+import sys
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+
+
+def test_feed_module_imports_when_run_directly():
+    """Feed modules keep working from src/feeds (the dual-import fallback, without the src package)."""
+    completed = subprocess.run(
+        [sys.executable, "-c", "import tagesschau_ausland; print('ok')"],
+        cwd=SRC_DIR / "feeds",
+        capture_output=True,
+        text=True,
+    )
+    assert completed.returncode == 0, completed.stderr
+    assert completed.stdout.strip() == "ok"
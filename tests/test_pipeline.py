@@ -0,0 +1,54 @@
+# tests/test_pipeline.py
+import asyncio
+import datetime as dt
+
+from src import pipeline, run_status
+from src.feeds.base import FeedItem
+
+
+def make_feed_results():
+    item = FeedItem(
+        date=dt.datetime(2025, 10, 15, 8, 0, tzinfo=dt.timezone.utc),
+        text="NATO-Manöver an der Ostflanke",
+        url="https://example.com/nato",
+        tags=["nato"],
+    )
+    return [{"source_name": "Test", "date": "2025-10-15T08:00:00Z", "result": "ok", "items": [item]}]
+
+
+def test_prepare_stage_with_change_detection_off(monkeypatch):
+    checkpoints = []
+
+    async def process_all_feeds():
+        return make_feed_results()
+
+    async def save_ok(*args, **kwargs):
+        return True
+
+    async def save_run_status_async(run, client=None):
+        checkpoints.append({name: dict(stage) for name, stage in run["stages"].items()})
+        return True
+
+    async def calculate_escalation_score(markdown, **kwargs):
+        return {"result": "error", "timestamp": "2025-10-15T08:00:00Z", "error_message": "stubbed"}
+
+    monkeypatch.setattr(pipeline, "CHANGE_DETECTION_ENABLED", False)
+    monkeypatch.setattr(pipeline, "get_latest_report", lambda max_days_back: None)
+    monkeypatch.setattr(pipeline, "SCORING_MODE", "full")
+    monkeypatch.setattr(pipeline, "process_all_feeds", process_all_feeds)
+    monkeypatch.setattr(pipeline, "save_feed_markdown_async", save_ok)
+    monkeypatch.setattr(pipeline, "save_escalation_report_async", lambda result: save_ok())
+    monkeypatch.setattr(pipeline, "save_dashboard_snapshot", save_ok)
+    monkeypatch.setattr(pipeline, "calculate_escalation_score", calculate_escalation_score)
+    monkeypatch.setattr(run_status, "save_run_status_async", save_run_status_async)
+
+    run = run_status.new_run(run_status.new_run_id())
+    result = asyncio.run(pipeline.run_daily_pipeline(run_status.RunTracker(run)))
+
+    assert result["run_metadata"]["change_detection"] is None
+    prepare = run["stages"]["prepare"]
+    assert prepare["status"] == "done"
+    assert prepare["fast_path"] is False
+    assert prepare["incremental"] is False
+    assert run["stages"]["save"]["status"] == "done"
+    assert checkpoints
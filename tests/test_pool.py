@@ -0,0 +1,31 @@
+# tests/test_pool.py
+import asyncio
+
+from src.agents import pool
+
+
+def test_async_clients_are_reused_within_a_run_and_closed_at_its_end():
+    async def run():
+        client = pool.get_http_client("test-provider")
+        assert pool.get_http_client("test-provider") is client
+        agent = pool.get_agent("test-agent", object, provider="test-provider")
+        assert pool.get_agent("test-agent", object, provider="test-provider") is agent
+
+        assert await pool.aclose_async_clients() == 1
+        assert client.is_closed
+        assert pool.get_agent("test-agent", object, provider="test-provider") is not agent
+        await pool.aclose_async_clients()
+        return client
+
+    first_run_client = asyncio.run(run())
+    second_run_client = asyncio.run(run())
+
+    assert second_run_client is not first_run_client
+
+
+def test_sync_client_stays_warm_across_runs():
+    client = pool.get_http_client("test-provider", asynchronous=False)
+    asyncio.run(pool.aclose_async_clients())
+
+    assert pool.get_http_client("test-provider", asynchronous=False) is client
+    assert not client.is_closed
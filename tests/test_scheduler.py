@@ -0,0 +1,63 @@
+# tests/test_scheduler.py
+import asyncio
+
+import pytest
+
+from src.agents.scheduler import (
+    LLMScheduler, PRIORITY_DIMENSION, PRIORITY_FILTER, PRIORITY_REVIEW, RESERVED_OUTPUT_TOKENS,
+)
+
+
+@pytest.fixture
+def scheduler(monkeypatch):
+    # 600 requests per minute: one new request slot every 0.1s
+    monkeypatch.setenv("LLM_RPM_TEST", "600")
+    monkeypatch.setenv("LLM_TPM_TEST", "100000")
+    return LLMScheduler()
+
+
+def test_waiting_requests_are_served_by_priority(scheduler):
+    served = []
+
+    async def request(priority):
+        await scheduler.acquire_async("test", "", 10, priority)
+        served.append(priority)
+
+    async def run():
+        _, bucket = scheduler._bucket("test", "")
+        bucket.requests = 0.0  # Everybody has to wait
+        tasks = []
+        for priority in (PRIORITY_FILTER, PRIORITY_DIMENSION, PRIORITY_REVIEW):
+            tasks.append(asyncio.create_task(request(priority)))
+            await asyncio.sleep(0)  # Enqueue in this order
+        await asyncio.gather(*tasks)
+
+    asyncio.run(run())
+
+    assert served == [PRIORITY_REVIEW, PRIORITY_DIMENSION, PRIORITY_FILTER]
+    assert scheduler.get_stats()["priority:review"]["requests"] == 1
+
+
+def test_cancelled_waiter_leaves_the_queue(scheduler):
+    async def run():
+        _, bucket = scheduler._bucket("test", "")
+        bucket.requests = 0.0
+        task = asyncio.create_task(scheduler.acquire_async("test", "", 10, PRIORITY_REVIEW))
+        await asyncio.sleep(0.01)
+        assert bucket.waiters
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        return bucket
+
+    assert asyncio.run(run()).waiters == []
+
+
+def test_settle_corrects_the_token_reservation(scheduler):
+    scheduler.acquire("test", "", 5000, PRIORITY_DIMENSION)
+    _, bucket = scheduler._bucket("test", "")
+    assert bucket.tokens == pytest.approx(100000 - 5000 - RESERVED_OUTPUT_TOKENS, abs=50)
+
+    scheduler.settle("test", "", 5000, used_tokens=2000)
+
+    assert bucket.tokens == pytest.approx(100000 - 2000, abs=50)
@@ -0,0 +1,77 @@
+# tests/test_score_history.py
+import asyncio
+
+from src import storage
+from src.score_history import (
+    build_manifest, empty_table, normalize_table, report_to_row, select_range, to_document, upsert_row,
+)
+
+
+def report(date, score, result="ok"):
+    dimension_scores = {key: {"score": score} for key in ["military", "diplomatic", "economic", "societal", "russians"]}
+    return {
+        "date": date,
+        "escalation_result": {
+            "result": result,
+            "escalation_score": {
+                "score": score,
+                "level": "TENSION",
+                "methodology": {"calculated_score": score, "dimension_scores": dimension_scores},
+            },
+        },
+    }
+
+
+def table_with(*dates):
+    table = empty_table()
+    for i, date in enumerate(dates):
+        upsert_row(table, report_to_row(report(date, float(i))))
+    return table
+
+
+def test_rows_stay_sorted_and_are_replaced_by_date():
+    table = table_with("2025-10-03", "2025-10-01", "2025-10-02")
+    upsert_row(table, report_to_row(report("2025-10-02", 9.0)))
+
+    assert table["date"] == ["2025-10-01", "2025-10-02", "2025-10-03"]
+    assert table["score"] == [1.0, 9.0, 0.0]
+    assert table["military"][1] == 9.0
+
+
+def test_failed_reports_have_no_row():
+    assert report_to_row(report("2025-10-01", 3.0, result="error")) is None
+
+
+def test_select_range_is_inclusive():
+    table = table_with("2025-10-01", "2025-10-02", "2025-10-03", "2025-10-04")
+
+    assert select_range(table, "2025-10-02", "2025-10-03")["date"] == ["2025-10-02", "2025-10-03"]
+    assert select_range(table, end="2025-10-01")["date"] == ["2025-10-01"]
+    assert select_range(table)["date"] == table["date"]
+
+
+def test_document_round_trip_and_manifest():
+    table = table_with("2025-10-01", "2025-10-02")
+
+    assert normalize_table(to_document(table)) == table
+    assert normalize_table({"version": 0, "columns": table}) == empty_table()
+    manifest = build_manifest(table, "history/scores.json")
+    assert (manifest["rows"], manifest["first_date"], manifest["last_date"]) == (2, "2025-10-01", "2025-10-02")
+    assert manifest["etag"] == build_manifest(table_with("2025-10-01", "2025-10-02"), "history/scores.json")["etag"]
+
+
+def test_failed_history_read_does_not_overwrite_the_history(monkeypatch):
+    saved = []
+
+    def load_score_history():
+        raise OSError("blob store unavailable")
+
+    async def save_score_history_async(table, client=None):
+        saved.append(table)
+        return True
+
+    monkeypatch.setattr(storage, "_load_score_history", load_score_history)
+    monkeypatch.setattr(storage, "save_score_history_async", save_score_history_async)
+
+    assert asyncio.run(storage.update_score_history_async(report("2025-10-01", 3.0))) is False
+    assert saved == []
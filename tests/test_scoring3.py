@@ -0,0 +1,101 @@
+# tests/test_scoring3.py
+import asyncio
+from collections import defaultdict, deque
+from types import SimpleNamespace
+
+from src import scoring3
+from src.schemas import DimensionScore, EvidencePack, OverallAssessment
+
+
+def test_russians_keeps_live_search_when_evidence_pack_exists(monkeypatch):
+    search_settings = {}
+
+    async def run_research(current_date, rss_data):
+        return EvidencePack(evidence=[], gaps=[]), {"status": "ok"}
+
+    async def run_dimension_agent(name, agent_module, run_input, search_results=None, timeout=None):
+        search_settings[name] = search_results
+        return {"score": 3.0, "rationale": "r"}, {"path": "primary"}
+
+    async def arun_agent(agent, run_input, provider, tokens, priority):
+        content = OverallAssessment.model_construct(overall_score=3.0, situation_summary="s")
+        return SimpleNamespace(content=content), 0.0
+
+    monkeypatch.setattr(scoring3, "SHARED_RESEARCH_ENABLED", True)
+    monkeypatch.setattr(scoring3, "run_research", run_research)
+    monkeypatch.setattr(scoring3, "run_dimension_agent", run_dimension_agent)
+    monkeypatch.setattr(scoring3, "arun_agent", arun_agent)
+    monkeypatch.setattr(scoring3, "get_agent", lambda *args, **kwargs: object())
+    monkeypatch.setattr(scoring3, "record_call", lambda *args: None)
+
+    result = asyncio.run(scoring3.calculate_escalation_score("rss"))
+
+    assert result["result"] == "ok", result.get("error_message")
+    assert search_settings["russians"] is None  # Agent default: X search on its accounts
+    assert all(search_settings[name] == 0 for name in ["military", "diplomatic", "economic", "societal"])
+
+
+def stub_scoring(monkeypatch, arun_agent):
+    async def run_dimension_agent(name, agent_module, run_input, search_results=None, timeout=None):
+        return {"score": 3.0, "rationale": "r"}, {"path": "primary"}
+
+    monkeypatch.setattr(scoring3, "SHARED_RESEARCH_ENABLED", False)
+    monkeypatch.setattr(scoring3, "run_dimension_agent", run_dimension_agent)
+    monkeypatch.setattr(scoring3, "arun_agent", arun_agent)
+    monkeypatch.setattr(scoring3, "get_agent", lambda *args, **kwargs: object())
+    monkeypatch.setattr(scoring3, "record_call", lambda *args: None)
+
+
+def test_hedge_latencies_are_stored_and_seed_the_next_run(monkeypatch):
+    async def arun_agent(agent, run_input, provider, tokens, priority):
+        content = OverallAssessment.model_construct(overall_score=3.0, situation_summary="s")
+        return SimpleNamespace(content=content), 0.0
+
+    stub_scoring(monkeypatch, arun_agent)
+    monkeypatch.setattr(scoring3, "_primary_latencies", defaultdict(lambda: deque(maxlen=scoring3.HEDGE_MAX_SAMPLES)))
+    report = {"escalation_result": {"run_metadata": {"hedge_latencies": {"military:no-search": [30.0] * 10}}}}
+
+    result = asyncio.run(scoring3.calculate_escalation_score(
+        "rss", hedge_latencies=scoring3.previous_hedge_latencies(report)
+    ))
+
+    assert scoring3.get_hedge_threshold("military:no-search") == 30.0
+    assert scoring3.get_hedge_threshold("military") == scoring3.HEDGE_DEFAULT_SECONDS  # Too few samples
+    assert result["run_metadata"]["hedge_latencies"] == {"military:no-search": [30.0] * 10}
+
+
+def test_review_agent_has_a_timeout(monkeypatch):
+    async def arun_agent(agent, run_input, provider, tokens, priority):
+        await asyncio.sleep(1)
+
+    stub_scoring(monkeypatch, arun_agent)
+    monkeypatch.setattr(scoring3, "REVIEW_TIMEOUT_SECONDS", 0.01)
+
+    result = asyncio.run(scoring3.calculate_escalation_score("rss"))
+
+    assert result["result"] == "error"
+    assert "Review agent: no response" in result["error_message"]
+
+
+def test_fallback_model_gets_prompt_without_search_task(monkeypatch):
+    inputs = {}
+
+    async def run_agent_async(agent, input_text, provider, tokens):
+        inputs[agent] = input_text
+        if agent == "primary":
+            raise RuntimeError("provider down")
+        return SimpleNamespace(content=DimensionScore(score=4.0, rationale="r")), 0.0
+
+    def get_agent(key, factory, provider="xai"):
+        return "fallback" if key.endswith(":fallback") else "primary"
+
+    monkeypatch.setattr(scoring3, "run_agent_async", run_agent_async)
+    monkeypatch.setattr(scoring3, "get_agent", get_agent)
+    monkeypatch.setattr(scoring3, "record_call", lambda *args: None)
+    agent_module = SimpleNamespace(create_agent=lambda model=None: None)
+
+    result, path = asyncio.run(scoring3.run_dimension_agent("military", agent_module, "PROMPT"))
+
+    assert result["score"] == 4.0 and path["path"] == "fallback"
+    assert inputs["primary"] == "PROMPT"
+    assert inputs["fallback"] == "PROMPT" + scoring3.NO_SEARCH_NOTE
@@ -0,0 +1,67 @@
+# tests/test_storage.py
+import asyncio
+import gzip
+import json
+
+import httpx
+
+from src import storage
+
+BASE_URL = "https://store1.public.blob.vercel-storage.com"
+
+
+def use_blob_store(monkeypatch, tmp_path, blobs, requests):
+    """Serve blobs ({pathname: bytes}) through a mock transport and record the requests."""
+    def handler(request):
+        requests.append((request.method, request.url.path))
+        if request.method == "PUT":
+            return httpx.Response(200, json={"url": f"{BASE_URL}{request.url.path}"})
+        content = blobs.get(request.url.path.lstrip("/"))
+        return httpx.Response(200, content=content) if content is not None else httpx.Response(404)
+
+    transport = httpx.MockTransport(handler)
+    monkeypatch.setattr(storage, "BLOB_TOKEN", "vercel_blob_rw_store1_secret")
+    monkeypatch.setattr(storage, "BLOB_MANIFEST_FILE", tmp_path / "blob-manifest.json")
+    monkeypatch.setattr(storage, "_manifest", None)
+    monkeypatch.setattr(storage, "COMPRESS_ARCHIVE", True)
+    client_class = httpx.Client
+    monkeypatch.setattr(storage.httpx, "Client", lambda: client_class(transport=transport))
+    return httpx.AsyncClient(transport=transport)
+
+
+def test_cold_read_of_a_compressed_report_is_one_get(monkeypatch, tmp_path):
+    requests = []
+    blobs = {"reports/2025-10-15.json.gz": gzip.compress(json.dumps({"date": "2025-10-15"}).encode())}
+    use_blob_store(monkeypatch, tmp_path, blobs, requests)
+
+    assert storage._read_blob_json("reports/2025-10-15.json") == {"date": "2025-10-15"}
+    assert requests == [("GET", "/reports/2025-10-15.json.gz")]
+
+
+def test_legacy_plain_report_is_remembered(monkeypatch, tmp_path):
+    requests = []
+    blobs = {"reports/2024-01-01.json": json.dumps({"date": "2024-01-01"}).encode()}
+    use_blob_store(monkeypatch, tmp_path, blobs, requests)
+
+    assert storage._read_blob_json("reports/2024-01-01.json") == {"date": "2024-01-01"}
+    assert requests == [("GET", "/reports/2024-01-01.json.gz"), ("GET", "/reports/2024-01-01.json")]
+
+    requests.clear()
+    storage._read_blob_json("reports/2024-01-01.json")
+    assert requests == [("GET", "/reports/2024-01-01.json")]
+
+
+def test_mutable_blobs_are_written_and_read_plain(monkeypatch, tmp_path):
+    requests = []
+    blobs = {}
+    client = use_blob_store(monkeypatch, tmp_path, blobs, requests)
+
+    assert asyncio.run(storage._save_to_blob_async(storage.LATEST_RUN_PATHNAME, {"run_id": "r1"}, client))
+    assert requests == [("PUT", "/runs/latest.json")]
+
+    blobs["runs/latest.json"] = json.dumps({"run_id": "r1"}).encode()
+    monkeypatch.setattr(storage, "_manifest", None)
+    (tmp_path / "blob-manifest.json").unlink()  # Cold /tmp
+    requests.clear()
+    assert storage._read_blob_json(storage.LATEST_RUN_PATHNAME) == {"run_id": "r1"}
+    assert requests == [("GET", "/runs/latest.json")]
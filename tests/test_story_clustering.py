@@ -0,0 +1,59 @@
+# tests/test_story_clustering.py
+import datetime as dt
+
+from src.feeds.base import FeedItem
+from src.story_clustering import Story, cluster_stories
+
+
+def item(text, url, hour=8, day=15):
+    return FeedItem(date=dt.datetime(2025, 10, day, hour, 0, tzinfo=dt.timezone.utc), text=text, url=url)
+
+
+def feed(source_name, *items):
+    return {"source_name": source_name, "result": "ok", "items": list(items)}
+
+
+def test_same_event_in_different_languages_is_one_story():
+    results = [
+        feed("Tagesschau", item("Russland verlegt Iskander-Raketen nach Kaliningrad, Litauen reagiert besorgt",
+                                "https://tagesschau.de/a", hour=9)),
+        feed("Meduza", item("Россия перебросила комплексы «Искандер» в Калининград, Литва выразила обеспокоенность",
+                            "https://meduza.io/b", hour=7)),
+        feed("BMVg", item("Pistorius besucht die Brigade in Litauen", "https://bmvg.de/c", hour=8)),
+    ]
+
+    stories = cluster_stories(results)
+
+    assert len(stories) == 2
+    assert stories[0].sources == ["Tagesschau", "Meduza"]
+    assert stories[1].sources == ["BMVg"]
+
+
+def test_entity_match_needs_items_close_in_time():
+    results = [
+        feed("Tagesschau", item("Iskander-Raketen in Kaliningrad", "https://tagesschau.de/a", day=15)),
+        feed("Meduza", item("«Искандер» в Калининграде", "https://meduza.io/b", day=10)),
+    ]
+
+    assert len(cluster_stories(results)) == 2
+
+
+def test_same_url_is_one_story():
+    results = [
+        feed("A", item("Bericht über Sabotage", "https://example.com/story?utm=a")),
+        feed("B", item("Совсем другой текст", "http://www.example.com/story/")),
+    ]
+
+    stories = cluster_stories(results)
+
+    assert len(stories) == 1
+    assert stories[0].sources == ["A", "B"]
+
+
+def test_centroid_norm_is_cached_on_add():
+    story = Story()
+    story.add("A", item("x", "u"), {"drohne": 0.6, "luftraum": 0.8}, 1.0)
+    story.add("B", item("y", "v"), {"drohne": 1.0}, 1.0)
+
+    assert abs(story.centroid_norm - (1.6 ** 2 + 0.8 ** 2) ** 0.5) < 1e-9
+    assert abs(story.similarity({"drohne": 1.0}) - 1.6 / story.centroid_norm) < 1e-9
@@ -0,0 +1,52 @@
+# tests/test_tagging.py
+import pytest
+
+from src.feeds.tagging import KeywordAutomaton, find_entities, get_default_automaton
+
+
+def tags(text):
+    return get_default_automaton().find_tags(text)
+
+
+def test_prefix_terms_match_inflections_in_all_languages():
+    assert tags("Die Ukrainische Armee meldet Angriffe") >= {"ukraine"}
+    assert tags("Украинские военные") >= {"ukraine"}
+    assert tags("Sanktionspaket gegen Moskau") >= {"sanctions", "russia"}
+
+
+def test_short_and_dollar_terms_match_whole_words_only():
+    automaton = KeywordAutomaton({"eu": ["eu"], "crimea": ["krim$"]})
+
+    assert automaton.find_tags("Die EU beschließt") == {"eu"}
+    assert automaton.find_tags("Der Euro fällt") == set()
+    assert automaton.find_tags("Lage auf der Krim") == {"crimea"}
+    assert automaton.find_tags("Ein Krimi am Abend") == set()
+
+
+@pytest.mark.parametrize("text", [
+    "Übung macht den Meister",
+    "Gas geben auf der Autobahn",
+    "Speiseöl wird teurer",
+    "Zahlung mit Visa-Karte",
+    "Ученик получил награду",
+    "Pedestrian crossing closed",
+])
+def test_loose_terms_do_not_tag_everyday_text(text):
+    assert not tags(text) & {"military_activity", "energy", "border"}
+
+
+@pytest.mark.parametrize("text, tag", [
+    ("NATO-Militärübung im Baltikum", "military_activity"),
+    ("Россия провела учения на границе", "military_activity"),
+    ("Gaslieferungen nach Europa gestoppt", "energy"),
+    ("Oil price jumps after drone attack", "energy"),
+    ("Finnland schließt Grenzübergang", "border"),
+    ("EU discusses visa ban for Russians", "border"),
+])
+def test_domain_phrases_are_tagged(text, tag):
+    assert tag in tags(text)
+
+
+def test_entities_are_language_independent():
+    assert find_entities("Iskander-Raketen nach Kaliningrad verlegt") == {"iskander", "kaliningrad"}
+    assert find_entities("«Искандеры» переброшены в Калининград") == {"iskander", "kaliningrad"}